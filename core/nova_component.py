@@ -142,6 +142,10 @@ class NovaComponent:
         """Component name"""
         return self._name
 
+    def copy(self) -> "NovaComponent":
+        """Returns a copy of component without tasks"""
+        return NovaComponent(self._name, self.repo)
+
     @property
     def tasks(self) -> list[NovaTask]:
         """Returns component tasks"""
@@ -160,6 +164,27 @@ class NovaComponent:
         """Adds tasks to component"""
         self._tasks.extend(tasks)
 
+    def upsert_task(self, task: NovaTask):
+        """Replaces task with the same name or adds it to component"""
+        for index, existing_task in enumerate(self._tasks):
+            if existing_task.name == task.name:
+                self._tasks[index] = task
+                return
+        self._tasks.append(task)
+
+    def remove_task(self, task_name: str) -> bool:
+        """
+        Removes task from component
+
+        :param task_name: task name
+        :return: True if task was removed, False if there was no such task
+        """
+        for index, existing_task in enumerate(self._tasks):
+            if existing_task.name == task_name:
+                del self._tasks[index]
+                return True
+        return False
+
     @property
     def status(self) -> Status:
         """Returns component status"""
@@ -216,6 +241,10 @@ class NovaEmptyComponent(NovaComponent):
     def __init__(self):
         super().__init__(NovaEmptyComponent.default_component_name, None)
 
+    def copy(self) -> "NovaComponent":
+        """Returns a copy of component without tasks"""
+        return NovaEmptyComponent()
+
     @staticmethod
     def parse(component_name: str):
         """Parses component name"""
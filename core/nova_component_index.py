@@ -0,0 +1,68 @@
+"""
+Nova component index module
+"""
+
+from typing import Callable, Generic, Iterable, Iterator, TypeVar
+
+T = TypeVar("T")
+
+
+def normalize_component_name(name: str) -> str:
+    """
+    Normalizes component name for comparison, Jira component names
+    are compared case insensitive ignoring surrounding spaces.
+
+    :param name: component name
+    :return: normalized component name
+    """
+    return name.strip().lower()
+
+
+class ComponentIndex(Generic[T]):
+    """
+    Groups items (Jira issues, tasks, components) by normalized
+    component name. Items are bucketed in a single pass, so looking
+    up items of every component costs O(components + items) instead of
+    scanning all items for every component. The order of items within
+    a bucket is preserved.
+    """
+
+    def __init__(
+        self, key: Callable[[T], str], items: Iterable[T] = ()
+    ) -> None:
+        """
+        :param key: function returning component name of an item
+        :param items: items to index
+        """
+        self._key = key
+        self._buckets: dict[str, list[T]] = {}
+        for item in items:
+            self.add(item)
+
+    def __len__(self):
+        return len(self._buckets)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._buckets)
+
+    def __contains__(self, component_name: object) -> bool:
+        return (
+            isinstance(component_name, str)
+            and normalize_component_name(component_name) in self._buckets
+        )
+
+    def add(self, item: T) -> None:
+        """Adds item to the bucket of its component"""
+        bucket_name = normalize_component_name(self._key(item))
+        self._buckets.setdefault(bucket_name, []).append(item)
+
+    def get(self, component_name: str) -> list[T]:
+        """
+        Returns items of the component
+
+        :param component_name: component name, not necessarily normalized
+        :return: list of items, empty if the component has none
+        """
+        return list(
+            self._buckets.get(normalize_component_name(component_name), [])
+        )
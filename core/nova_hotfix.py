@@ -2,21 +2,48 @@
 Nova hotfix component module
 """
 
+from typing import Optional
+
+from core.nova_component import NovaComponent
+from core.nova_component_index import ComponentIndex
 from core.nova_release import NovaRelease
 
 
 class NovaHotfix(NovaRelease):
-    """Nova hotfix component"""
+    """
+    Nova hotfix component, contains the components the hotfix changes,
+    the rest of the delivery is taken from the base delivery
+    """
 
-    def __init__(self, project, version, delivery, hotfix):
+    def __init__(
+        self,
+        project,
+        version,
+        delivery,
+        hotfix,
+        base: Optional[NovaRelease] = None,
+    ):
         super().__init__(project, version, delivery)
         self.hotfix = hotfix
+        self._base = base
 
     def __str__(self):
-        return f"""
-            Nova {self.version}. 
-            Delivery {self._delivery}. 
-            Hotfix {self.hotfix}"""
+        return (
+            f"Nova {self.version}. Delivery {self.delivery}. "
+            + f"Hotfix {self.hotfix}"
+        )
 
     def __repr__(self):
         return self.__str__()
+
+    @property
+    def base(self) -> Optional[NovaRelease]:
+        """Returns the delivery the hotfix is built on"""
+        return self._base
+
+    def get_unchanged_components(self) -> list[NovaComponent]:
+        """Returns components of the base delivery the hotfix does not change"""
+        if self._base is None:
+            return []
+        changed = ComponentIndex(lambda c: c.name, self)
+        return [c for c in self._base if c.name not in changed]
@@ -5,6 +5,7 @@ Nova release component module
 from typing import Optional
 from .nova_status import Status
 from .nova_component import NovaComponent
+from .nova_component_index import ComponentIndex
 
 
 def get_release_status(component_statuses: list) -> Status:
@@ -56,6 +57,10 @@ class NovaRelease:
         """Adds component to release model"""
         self._components.append(component)
 
+    def remove_component(self, component: NovaComponent):
+        """Removes component from release model"""
+        self._components.remove(component)
+
     def get_status(self) -> Status:
         """Returns release status"""
         statuses = list({component.status for component in self._components})
@@ -81,15 +86,16 @@ class NovaRelease:
 
         :param str name: Component name. If name ends with '!' then search
             will use strict equality, otherwise it will use 'in' operator.
-            In any case search is case insensitive.
+            In any case search is case insensitive, strict equality also
+            ignores surrounding spaces the way Jira does.
         """
         if name.endswith("!"):
             name = name[:-1]
             if not name:
                 return None
-            target_components = [
-                c for c in self._components if name.lower() == c.name.lower()
-            ]
+            target_components = ComponentIndex(
+                lambda c: c.name, self._components
+            ).get(name)
         else:
             target_components = [
                 c for c in self._components if name.lower() in c.name.lower()
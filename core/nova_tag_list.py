@@ -1,22 +1,21 @@
 """
 This module contains the class NovaTagList,
-which is a list of TagReference objects under the hood.
+which is a list of GitTag objects under the hood.
 The list is associated with a NovaComponent object.
 """
 
 from __future__ import annotations
-from collections.abc import Sequence
-from git import TagReference
+from collections.abc import Iterable, Sequence
 
 from core.nova_component import NovaComponent
 from core.nova_component_type import NovaComponentType
-from integration.git import GitIntegration
+from integration.git import GitIntegration, GitTag
 import mappers
 
 
 class NovaTagList(Sequence):
     """
-    List of TagReference objects. Essetially filters
+    List of GitTag objects. Essetially filters
     the tags that are relevant to the associated component
     starting from a given date.
     """
@@ -24,7 +23,7 @@ class NovaTagList(Sequence):
     def __init__(self, component: NovaComponent, since: str):
         self._component: NovaComponent = component
         self._since: str = since
-        self._list: list[TagReference] = []
+        self._list: list[GitTag] = []
 
     def __iter__(self):
         return iter(self._list)
@@ -42,7 +41,7 @@ class NovaTagList(Sequence):
         """
         return self._component
 
-    def try_add_tag(self, tag: TagReference) -> bool:
+    def try_add_tag(self, tag: GitTag) -> bool:
         """
         Try to add tag to the list if only it matches the
         component and if only it is not already in the list
@@ -83,6 +82,27 @@ class NovaTagList(Sequence):
 
         return result
 
+    @staticmethod
+    def from_tags(
+        component: NovaComponent, since: str, tags: Iterable[GitTag]
+    ) -> NovaTagList:
+        """
+        Create a new instance of NovaTagList for the given component
+        from the tags of its repository. Tags of a repository shared
+        by several components are listed once and classified for
+        every component.
+
+        :param component: Component to map
+        :param since: Date the tags were counted from
+        :param tags: Tags of the component repository
+        :return: New instance of NovaTagList
+        """
+        result = NovaTagList(component, since)
+        for tag in tags:
+            result.try_add_tag(tag)
+
+        return result
+
     @staticmethod
     def from_component(
         component: NovaComponent, since: str, git_integration: GitIntegration
@@ -101,8 +121,4 @@ class NovaTagList(Sequence):
             return NovaTagList(component, since)
 
         all_tags = git_integration.list_tags(component.repo.url, since)
-        result = NovaTagList(component, since)
-        for tag in all_tags:
-            result.try_add_tag(tag)
-
-        return result
+        return NovaTagList.from_tags(component, since, all_tags)
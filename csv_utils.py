@@ -69,7 +69,7 @@ def map_to_csv_rows(source: NovaTagList) -> list[GitTagCsvRow]:
             (
                 source.component.name,
                 tag.name,
-                tag.commit.committed_datetime.strftime("%Y-%m-%d"),
+                tag.committed_datetime.strftime("%Y-%m-%d"),
                 get_git_tag_url(
                     repo.git_cloud,
                     repo.sanitized_url,
@@ -4,15 +4,56 @@ Git integration layer module.
 
 import tempfile
 import time
-from datetime import datetime
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
 from operator import attrgetter
 from typing import Optional
 
-from git import TagReference
+from git import Git
 from git.exc import GitCommandError
 from git.repo import Repo
 
 from fs_utils import search_files_with_ext, search_changelog_files
+from integration.git_mirror import GitMirrorStore
+
+
+@dataclass(frozen=True)
+class GitTag:
+    """
+    Tag metadata read without loading tag and commit objects one by one
+    """
+
+    name: str
+    # date of the commit the tag points to
+    committed_datetime: datetime
+    # None for lightweight tags
+    tagged_datetime: Optional[datetime] = None
+    # annotation of annotated tags, commit message of lightweight tags
+    message: str = ""
+
+    def __str__(self):
+        return self.name
+
+    @property
+    def annotated(self) -> bool:
+        """True for annotated tags"""
+        return self.tagged_datetime is not None
+
+
+def parse_raw_git_date(raw_date: str) -> Optional[datetime]:
+    """
+    Parse git date in the raw format, e.g. `1700000000 +0100`
+
+    :param raw_date: date in the raw format
+    :return: date with the time zone, None if the date is empty
+    """
+    if not raw_date:
+        return None
+    timestamp, offset = raw_date.split()
+    sign = -1 if offset.startswith("-") else 1
+    hours, minutes = int(offset[-4:-2]), int(offset[-2:])
+    tz = timezone(sign * timedelta(hours=hours, minutes=minutes))
+    return datetime.fromtimestamp(int(timestamp), tz)
 
 
 class GitIntegration:
@@ -21,8 +62,32 @@ class GitIntegration:
     Connects to Git using ...
     """
 
-    def __init__(self, branch: str = "master") -> None:
+    # fields of tag records separated by \x1f and terminated by \x1e,
+    # annotations and commit messages might contain new lines
+    TAG_FORMAT = (
+        "%1f".join(
+            [
+                "%(refname:strip=2)",
+                "%(committerdate:raw)",
+                "%(*committerdate:raw)",
+                "%(taggerdate:raw)",
+                "%(contents)",
+            ]
+        )
+        + "%1e"
+    )
+
+    def __init__(
+        self, branch: str = "master", mirrors: Optional[GitMirrorStore] = None
+    ) -> None:
+        """
+        :param branch: branch repositories are cloned from
+        :param mirrors: optional store of repository mirrors, when it is
+            specified repositories are cloned and tags are listed from
+            the mirrors brought up to date with incremental fetches
+        """
         self._branch = branch
+        self._mirrors = mirrors
 
     def clone(self, url: str, sources_dir: Optional[str] = None) -> str:
         """
@@ -40,8 +105,17 @@ class GitIntegration:
         if sources_dir is None:
             sources_dir = tempfile.mkdtemp(prefix="nova")
 
-        Repo.clone_from(url, sources_dir, branch=self._branch)
+        if self._mirrors is None:
+            Repo.clone_from(url, sources_dir, branch=self._branch)
+            return sources_dir
 
+        # local clone hardlinks objects of the mirror, changes are
+        # pushed to the repository itself
+        with self._mirrors.use(url) as mirror:
+            repo = Repo.clone_from(
+                mirror.git_dir, sources_dir, branch=self._branch
+            )
+        repo.remote("origin").set_url(url)
         return sources_dir
 
     def commit_changelogs_and_csproj(
@@ -114,56 +188,153 @@ class GitIntegration:
         if not repo_dir:
             raise ValueError("Repository directory is not specified")
 
-        repo = Repo(repo_dir)
-        tags = sorted(repo.tags, key=attrgetter("commit.committed_datetime"))
+        tags = sorted(
+            GitIntegration.read_tags(Repo(repo_dir)),
+            key=attrgetter("committed_datetime"),
+        )
 
         return str(tags[-1])
 
     @staticmethod
+    def read_tags(repo: Repo) -> list[GitTag]:
+        """
+        Read names, commit dates, tagger dates and annotations of all tags
+        of the repository with a single `git for-each-ref` call
+
+        :param repo: repository
+        :return: tags sorted by name, tags which do not point
+            to commits are skipped
+        """
+        output = repo.git.for_each_ref(
+            "refs/tags", format=GitIntegration.TAG_FORMAT
+        )
+        tags: list[GitTag] = []
+        for record in output.split("\x1e"):
+            if not record.strip():
+                continue
+            fields = record.lstrip("\n").split("\x1f")
+            name, committed, peeled_committed, tagged, message = fields
+            # lightweight tags point to commits, annotated tags
+            # point to tag objects which are peeled to commits
+            committed_datetime = parse_raw_git_date(
+                committed or peeled_committed
+            )
+            if committed_datetime is None:
+                continue
+            tags.append(
+                GitTag(
+                    name,
+                    committed_datetime,
+                    parse_raw_git_date(tagged),
+                    message.rstrip("\n"),
+                )
+            )
+        return tags
+
+    @staticmethod
+    def list_remote_tags(url: str) -> dict[str, str]:
+        """
+        List tags of a remote repository without downloading anything
+
+        :param url: repository url
+        :return: tag name -> sha of the commit the tag points to
+        """
+        tags: dict[str, str] = {}
+        for line in Git().ls_remote("--tags", url).splitlines():
+            sha, ref = line.split("\t", 1)
+            name = ref.removeprefix("refs/tags/")
+            # annotated tags are listed twice, the peeled entry
+            # with ^{} suffix has the commit sha
+            if name.endswith("^{}"):
+                tags[name.removesuffix("^{}")] = sha
+            else:
+                tags.setdefault(name, sha)
+        return tags
+
+    @staticmethod
+    def fetch_tags(url: str, repo_dir: Optional[str] = None) -> Repo:
+        """
+        Fetch tags of a remote repository into a bare repository.
+        Only tag objects and the commits they point to are downloaded,
+        without history, trees and blobs, which is enough to read tag
+        names, annotations and commit dates.
+
+        :param url: repository url
+        :param repo_dir: directory of the bare repository. If None
+        then a temporary directory will be used.
+        :return: bare repository with the tags
+        """
+        repo = Repo.init(repo_dir or tempfile.mkdtemp(prefix="nova"), bare=True)
+        repo.git.fetch(
+            url,
+            "+refs/tags/*:refs/tags/*",
+            depth=1,
+            filter="tree:0",
+            no_tags=True,
+        )
+        return repo
+
+    def _read_remote_tags(self, url: str) -> list[GitTag]:
+        """
+        Read tags of the remote repository from its mirror or from
+        a bare repository with only the tags fetched
+
+        :param url: repository url
+        :return: list of tags
+        """
+        if self._mirrors is not None:
+            # the mirror is read while it is locked, so another process
+            # cannot fetch into it in the meantime
+            with self._mirrors.use(url) as mirror:
+                return GitIntegration.read_tags(mirror)
+        try:
+            repo = GitIntegration.fetch_tags(url)
+        except GitCommandError:
+            # the fetch fails when no tag matches the refspec, tags are
+            # listed only then to tell a repository without tags apart
+            if GitIntegration.list_remote_tags(url):
+                raise
+            return []
+        return GitIntegration.read_tags(repo)
+
     def list_tags(
-        url: str, since: str = "", retry_times=3, retry_interval_sec=5
-    ) -> list[TagReference]:
+        self, url: str, since: str = "", retry_times=3, retry_interval_sec=5
+    ) -> list[GitTag]:
         """
-        List tags in the repository since a specified date
+        List tags in the repository since a specified date.
+        Tags are read from the repository mirror if mirrors are used.
+        Otherwise only the tag objects and their commits are fetched,
+        see `fetch_tags`, `git ls-remote` is used only when the fetch
+        fails to tell a repository without tags from a failure.
+        The repository is not cloned.
 
         :param url: repository url
         :param since: date in the format YYYY-MM-DD
-        :param retry_times: number of times to retry `git clone` operation
-            if it fails
+        :param retry_times: number of times to retry git operations
+            if they fail
         :param retry_interval_sec: interval between retries in seconds
         :return: list of tags
         """
         if not url:
             raise ValueError("Repository url is not specified")
 
-        repo = None
         for _ in range(retry_times):
             try:
-                repo = Repo.clone_from(
-                    url,
-                    tempfile.mkdtemp(prefix="nova"),
-                    depth=1,
-                    tags=True,
-                    no_single_branch=True,
-                )
-                break
+                tags = self._read_remote_tags(url)
             except GitCommandError:
                 time.sleep(retry_interval_sec)
+                continue
 
-        if not repo:
-            raise ValueError(f"Failed to clone the repository ({url})")
-
-        if since:
+            if not since:
+                return tags
             since_date = datetime.strptime(since, "%Y-%m-%d").date()
-            tags = [
+            return [
                 tag
-                for tag in repo.tags
-                if tag.commit.committed_datetime.date() >= since_date
+                for tag in tags
+                if tag.committed_datetime.date() >= since_date
             ]
-        else:
-            tags = list(repo.tags)
 
-        return tags
+        raise ValueError(f"Failed to fetch tags of the repository ({url})")
 
     def list_tags_with_annotation(
         self, repo_dir: str, annotation: str
@@ -182,14 +353,9 @@ class GitIntegration:
         if not annotation:
             raise ValueError("Annotation is not specified")
 
-        repo = Repo(repo_dir)
         filtered_tags = filter(
-            lambda tag: (
-                annotation in tag.tag.message
-                if tag.tag
-                else annotation in tag.commit.message
-            ),
-            repo.tags,
+            lambda tag: annotation in tag.message,
+            GitIntegration.read_tags(Repo(repo_dir)),
         )
 
         return list(
@@ -197,7 +363,7 @@ class GitIntegration:
                 lambda tag: tag.name,
                 sorted(
                     filtered_tags,
-                    key=lambda tag: tag.commit.committed_datetime,
+                    key=lambda tag: tag.committed_datetime,
                     reverse=True,
                 ),
             )
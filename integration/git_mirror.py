@@ -0,0 +1,120 @@
+"""
+Git mirror store module.
+"""
+
+import hashlib
+import os
+import sys
+from contextlib import contextmanager
+from typing import IO, Iterator
+
+from git.repo import Repo
+
+from core.cvs import CodeRepository
+from fs_utils import sanitize_filename
+
+if sys.platform == "win32":
+    import msvcrt  # pylint: disable=import-error
+else:
+    import fcntl
+
+
+@contextmanager
+def file_lock(path: str) -> Iterator[None]:
+    """
+    Holds an exclusive lock of a file, blocks until other processes
+    and threads release it
+
+    :param path: path to the lock file, created if it does not exist
+    """
+    with open(path, "a+b") as lock_file:
+        _lock(lock_file)
+        try:
+            yield
+        finally:
+            _unlock(lock_file)
+
+
+def _lock(lock_file: IO[bytes]) -> None:
+    """
+    Lock the first byte of an open file
+    """
+    if sys.platform == "win32":
+        lock_file.seek(0)
+        while True:
+            try:
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+                return
+            except OSError:
+                # LK_LOCK gives up after 10 seconds
+                continue
+    else:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+
+
+def _unlock(lock_file: IO[bytes]) -> None:
+    """
+    Unlock the first byte of an open file
+    """
+    if sys.platform == "win32":
+        lock_file.seek(0)
+        msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+    else:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+class GitMirrorStore:
+    """
+    Keeps a bare mirror of every repository on disk between application
+    runs, so repositories are downloaded once and then only brought up
+    to date with incremental fetches. Mirrors are keyed by repository
+    urls without credentials and never store the credentials themselves,
+    urls are passed to `git fetch` directly. Mirrors are locked while
+    they are fetched and used, so several processes can share the store.
+    """
+
+    REFSPECS = ["+refs/heads/*:refs/heads/*", "+refs/tags/*:refs/tags/*"]
+
+    def __init__(self, path: str) -> None:
+        """
+        :param path: folder the mirrors are kept in
+        """
+        if not path:
+            raise ValueError("Mirror store path is not specified")
+        self._path = path
+
+    def get_mirror_path(self, url: str) -> str:
+        """
+        Get path to the mirror of a repository
+
+        :param url: repository url, credentials are ignored
+        :return: path to the bare mirror
+        """
+        if not url:
+            raise ValueError("Repository url is not specified")
+        key = CodeRepository.sanitize_git_url(url).rstrip("/")
+        if key.endswith(".git"):
+            key = key[: -len(".git")]
+        name = sanitize_filename(key.rsplit("/", 1)[-1])
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+        return os.path.join(self._path, f"{name}-{digest}.git")
+
+    @contextmanager
+    def use(self, url: str) -> Iterator[Repo]:
+        """
+        Brings the mirror of a repository up to date, the mirror is
+        created on the first use. The mirror is locked until the caller
+        is done with it.
+
+        :param url: repository url
+        :return: bare mirror repository
+        """
+        mirror_path = self.get_mirror_path(url)
+        os.makedirs(self._path, exist_ok=True)
+        with file_lock(f"{mirror_path}.lock"):
+            if os.path.isdir(mirror_path):
+                repo = Repo(mirror_path)
+            else:
+                repo = Repo.init(mirror_path, bare=True)
+            repo.git.fetch(url, *GitMirrorStore.REFSPECS, prune=True)
+            yield repo
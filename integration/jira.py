@@ -2,57 +2,453 @@
 Jira integration layer module.
 """
 
-from typing import cast
+import json
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from itertools import islice
+from typing import Any, Callable, Generator, Optional, TypeVar, cast
 
 from jira import JIRA, JIRAError
 from jira.resources import Component, Issue
 from jira.client import ResultList
 from jira.resources import Version
+from requests.adapters import (  # type: ignore
+    DEFAULT_POOLSIZE,
+    HTTPAdapter,
+)
 
 import jira_utils as ju
+from integration.jira_cache import (
+    COMPONENTS_RESOURCE,
+    ISSUES_RESOURCE,
+    VERSIONS_RESOURCE,
+    JiraResponseStore,
+)
+from integration.jira_resilience import (
+    COMPONENTS_OPERATION,
+    SEARCH_OPERATION,
+    TRANSITIONS_OPERATION,
+    VERSIONS_OPERATION,
+    JiraCallPolicy,
+    JiraCallReport,
+    JiraCallRunner,
+)
+from integration.jira_version_catalog import JiraVersionCatalog
 
+T = TypeVar("T")
 
-class JiraIntegration:
+
+class JiraIntegration:  # pylint: disable=too-many-instance-attributes
     """
     Jira integration service.
     Connects to Jira using basic authentication.
     """
 
-    def __init__(self, host, username, password) -> None:
-        self._j = JIRA(host, basic_auth=(username, password))
+    DEFAULT_PAGE_SIZE = 50
+    DEFAULT_REQUEST_TIMEOUT_SEC = 30
+    # Jira Cloud bulk operations API
+    BULK_API_URL = "{server}/rest/api/3/{path}"
+    BULK_TRANSITION_LIMIT = 1000
+    BULK_POLL_INTERVAL_SEC = 0.5
+    BULK_FINAL_STATUSES = ("COMPLETE", "FAILED", "CANCELLED", "DEAD")
+
+    # pylint: disable=too-many-arguments
+    def __init__(
+        self,
+        host,
+        username,
+        password,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        max_workers: int = 1,
+        *,
+        cache: Optional[JiraResponseStore] = None,
+        request_timeout_sec: float = DEFAULT_REQUEST_TIMEOUT_SEC,
+        policies: Optional[dict[str, JiraCallPolicy]] = None,
+    ) -> None:
+        """
+        :param host: Jira host
+        :param username: Jira username
+        :param password: Jira password or token
+        :param page_size: number of issues requested per search page
+        :param max_workers: number of concurrent requests to Jira used to
+            fetch search pages and transition issues, 1 means requests
+            are sent one after another
+        :param cache: optional persistent cache of Jira responses or
+            another store of them, see `JiraResponseStore`
+        :param request_timeout_sec: timeout of a single HTTP request
+        :param policies: deadlines, retries and hedging of Jira calls
+            per operation, see `integration.jira_resilience`. Failed calls
+            raise `JiraOperationError`.
+        """
+        if page_size < 1:
+            raise ValueError("Page size must be greater than zero")
+        if max_workers < 1:
+            raise ValueError("Max workers must be greater than zero")
+
+        self._j = self._connect(host, username, password, request_timeout_sec)
+        # keep-alive connections for all concurrent requests including
+        # hedged ones, otherwise extra connections are opened and dropped
+        adapter = HTTPAdapter(
+            pool_maxsize=max(DEFAULT_POOLSIZE, 2 * max_workers),
+            max_retries=0,
+        )
+        # pylint: disable=protected-access
+        self._j._session.mount("https://", adapter)
+        self._j._session.mount("http://", adapter)
+        self._runner = JiraCallRunner(policies)
+        self._page_size = page_size
+        self._max_workers = max_workers
+        self._cache = cache
+        # (project, issue type, source status, transition name) -> id
+        self._transition_ids: dict[tuple[str, str, str, str], str] = {}
+        # project code -> versions, loaded on the first request
+        self._version_catalogs: dict[str, JiraVersionCatalog] = {}
+        # turned off once Jira turns out not to provide bulk operations
+        self._bulk_transitions = True
+
+    def _connect(
+        self, host, username, password, request_timeout_sec: float
+    ) -> JIRA:
+        """
+        Create Jira client
+
+        :param host: Jira host
+        :param username: Jira username
+        :param password: Jira password or token
+        :param request_timeout_sec: timeout of a single HTTP request
+        :return: Jira client
+        """
+        # retries are made by the call runner within operation deadlines
+        return JIRA(
+            host,
+            basic_auth=(username, password),
+            timeout=request_timeout_sec,
+            max_retries=0,
+        )
+
+    @property
+    def call_report(self) -> JiraCallReport:
+        """Outcomes of Jira calls which were retried, hedged or failed"""
+        return self._runner.report
+
+    def _to_resources(self, resource_type: type, raws: list[Any]) -> list:
+        """
+        Build Jira resources from raw JSON responses taken from cache
+
+        :param resource_type: Jira resource class
+        :param raws: raw JSON responses
+        :return: list of Jira resources
+        """
+        # pylint: disable=protected-access
+        return [
+            resource_type(self._j._options, self._j._session, raw=raw)
+            for raw in raws
+        ]
+
+    def _search_page(
+        self, jql: str, fields: Optional[list[str]], raw: bool, start_at: int
+    ) -> tuple[list[Any], int]:
+        """
+        Get a single page of JIRA issues
+
+        :param jql: JQL query string
+        :param fields: issue fields to request, None requests all fields
+        :param raw: return JSON dictionaries instead of Issue objects
+        :param start_at: index of the first issue in the page
+        :return: page of JIRA issues and the total number of issues
+        """
+        page = self._runner.run(
+            SEARCH_OPERATION,
+            f"{jql} (startAt={start_at})",
+            lambda: self._j.search_issues(
+                jql,
+                maxResults=self._page_size,
+                startAt=start_at,
+                # search_issues translates field names in place
+                fields=list(fields) if fields else None,
+                json_result=raw,
+            ),
+        )
+        if raw:
+            json_page = cast(dict[str, Any], page)
+            return json_page.get("issues", []), int(json_page.get("total", 0))
+        issues_page = cast(ResultList[Issue], page)
+        return list(issues_page.iterable), issues_page.total
 
     def get_issues(
-        self, project_code: str, delivery: str, component_name: str = ""
+        self,
+        project_code: str,
+        delivery: str | list[str],
+        component_name: str = "",
+        fields_profile: str = "",
+        updated_within_min: int = 0,
     ) -> list[Issue]:
         """
-        Get JIRA issues for a component in a particular delivery
+        Get JIRA issues for a component in a particular delivery.
+        When the cache is configured, previously downloaded issues are
+        served from it as long as none of them has been updated since.
+
+        :param project_code: project code
+        :param delivery: delivery number or several delivery numbers,
+            issue `fixVersions` field is requested in addition to the
+            fields profile ones in the latter case
+        :param component_name: component name
+        :param fields_profile: name of the issue fields profile, see
+            `jira_utils.JIRA_FIELDS_PROFILES`. All fields are requested
+            if not specified.
+        :param updated_within_min: only issues updated within the specified
+            number of minutes, such delta queries are never cached
+        :return: list of JIRA issues
+        """
+        return self._get_issues(
+            project_code,
+            delivery=delivery,
+            component_name=component_name,
+            fields_profile=fields_profile,
+            updated_within_min=updated_within_min,
+            raw=False,
+        )
+
+    def get_raw_issues(
+        self,
+        project_code: str,
+        delivery: str | list[str],
+        component_name: str = "",
+        fields_profile: str = "",
+        updated_within_min: int = 0,
+    ) -> list[dict[str, Any]]:
+        """
+        Same as `get_issues` but returns issues as JSON dictionaries
+        the way Jira sent them. Building Issue objects recursively from
+        JSON takes considerable CPU time and memory on big deliveries,
+        use `jira_utils.parse_jira_issue_raw` to parse the dictionaries.
 
         :param project_code: project code
         :param delivery: delivery number
         :param component_name: component name
+        :param fields_profile: name of the issue fields profile
+        :param updated_within_min: only issues updated within the specified
+            number of minutes
+        :return: list of JIRA issues as JSON dictionaries
+        """
+        return self._get_issues(
+            project_code,
+            delivery=delivery,
+            component_name=component_name,
+            fields_profile=fields_profile,
+            updated_within_min=updated_within_min,
+            raw=True,
+        )
+
+    # pylint: disable=too-many-arguments
+    def _get_issues(
+        self,
+        project_code: str,
+        *,
+        delivery: str | list[str],
+        component_name: str,
+        fields_profile: str,
+        updated_within_min: int,
+        raw: bool,
+    ) -> list[Any]:
+        """
+        Get JIRA issues either as Issue objects or JSON dictionaries.
+        Cache keeps JSON dictionaries in both cases.
+        """
+        jql = ju.build_jql(
+            project_code, delivery, component_name, updated_within_min
+        )
+        fields = self._get_fields(fields_profile, delivery)
+        if self._cache is None or updated_within_min > 0:
+            return self._search_all(jql, fields, raw)
+
+        fetched: list[Any] = []
+
+        def fetch() -> list[Any]:
+            fetched.extend(self._search_all(jql, fields, raw))
+            return fetched if raw else [issue.raw for issue in fetched]
+
+        raw_issues = self._cache.get_or_fetch(
+            ISSUES_RESOURCE,
+            f"search:{jql}:{','.join(fields or [])}",
+            fetch,
+            partial(self._get_issues_validator, jql),
+        )
+        if raw:
+            return raw_issues
+        return fetched or self._to_resources(Issue, raw_issues)
+
+    @staticmethod
+    def _get_fields(
+        fields_profile: str, delivery: str | list[str]
+    ) -> Optional[list[str]]:
+        """
+        Get issue fields to request
+
+        :param fields_profile: name of the issue fields profile
+        :param delivery: delivery number or several delivery numbers
+        :return: list of issue fields, None requests all fields
+        """
+        if not fields_profile:
+            return None
+        fields = ju.get_jira_fields(fields_profile)
+        # issues of several deliveries are told apart by fix versions
+        if isinstance(delivery, list):
+            fields.append("fixVersions")
+        return fields
+
+    def _get_issues_validator(self, jql: str) -> str:
+        """
+        Get a value which changes whenever any of the issues
+        matching the query is changed, added or removed
+
+        :param jql: JQL query string
+        :return: number of issues and the newest `updated` timestamp
+        """
+        newest_jql = f"{jql} ORDER BY updated DESC"
+        newest = cast(
+            ResultList[Issue],
+            self._runner.run(
+                SEARCH_OPERATION,
+                newest_jql,
+                lambda: self._j.search_issues(
+                    newest_jql, maxResults=1, fields=["updated"]
+                ),
+            ),
+        )
+        updated = newest[0].fields.updated if len(newest) > 0 else ""
+        return f"{newest.total}:{updated}"
+
+    def _search_all(
+        self, jql: str, fields: Optional[list[str]], raw: bool = False
+    ) -> list[Any]:
+        """
+        Get all pages of JIRA issues matching the query
+
+        :param jql: JQL query string
+        :param fields: issue fields to request, None requests all fields
+        :param raw: return JSON dictionaries instead of Issue objects
         :return: list of JIRA issues
         """
+        return [
+            issue
+            for page in self._iter_pages(jql, fields, raw)
+            for issue in page
+        ]
+
+    def _iter_pages(
+        self, jql: str, fields: Optional[list[str]], raw: bool
+    ) -> Generator[list[Any], None, None]:
+        """
+        Iterate over pages of JIRA issues matching the query.
+        The first page is requested to find out the total number of
+        issues. While the caller processes a page, up to `max_workers`
+        following pages are requested in the background, so no more than
+        that many pages are kept in memory. Pages are yielded in the
+        order JIRA sorted the issues regardless of their arrival order.
 
-        result = []
-        i = 0
-        chunk_size = 50
+        :param jql: JQL query string
+        :param fields: issue fields to request, None requests all fields
+        :param raw: return JSON dictionaries instead of Issue objects
+        :return: iterator over pages of JIRA issues
+        """
+        first_page, total = self._search_page(jql, fields, raw, 0)
+        remaining_starts = iter(range(self._page_size, total, self._page_size))
+        executor = ThreadPoolExecutor(max_workers=self._max_workers)
+        try:
+            pending: deque[Future[tuple[list[Any], int]]] = deque(
+                executor.submit(self._search_page, jql, fields, raw, start_at)
+                for start_at in islice(remaining_starts, self._max_workers)
+            )
+            yield first_page
+            while pending:
+                page, _ = pending.popleft().result()
+                next_start = next(remaining_starts, None)
+                if next_start is not None:
+                    pending.append(
+                        executor.submit(
+                            self._search_page, jql, fields, raw, next_start
+                        )
+                    )
+                yield page
+        finally:
+            # the caller may stop iterating before the last page
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def iter_issues(
+        self,
+        project_code: str,
+        delivery: str | list[str],
+        component_name: str = "",
+        fields_profile: str = "",
+    ) -> Generator[Issue, None, None]:
+        """
+        Same as `get_issues` but yields issues page by page as they are
+        received, the next pages are requested while the caller processes
+        the current one. If the cache is configured, the issues are
+        loaded through it and yielded afterwards.
+        Failed page request raises `JiraOperationError`.
+
+        :param project_code: project code
+        :param delivery: delivery number
+        :param component_name: component name
+        :param fields_profile: name of the issue fields profile
+        :return: iterator over JIRA issues
+        """
+        return self._iter_issues(
+            project_code, delivery, component_name, fields_profile, False
+        )
+
+    def iter_raw_issues(
+        self,
+        project_code: str,
+        delivery: str | list[str],
+        component_name: str = "",
+        fields_profile: str = "",
+    ) -> Generator[dict[str, Any], None, None]:
+        """
+        Same as `iter_issues` but yields issues as JSON dictionaries,
+        see `get_raw_issues`.
+
+        :param project_code: project code
+        :param delivery: delivery number
+        :param component_name: component name
+        :param fields_profile: name of the issue fields profile
+        :return: iterator over JIRA issues as JSON dictionaries
+        """
+        return self._iter_issues(
+            project_code, delivery, component_name, fields_profile, True
+        )
+
+    def _iter_issues(
+        self,
+        project_code: str,
+        delivery: str | list[str],
+        component_name: str,
+        fields_profile: str,
+        raw: bool,
+    ) -> Generator[Any, None, None]:
+        """
+        Iterate over JIRA issues either as Issue objects or JSON
+        dictionaries
+        """
+        if self._cache is not None:
+            yield from self._get_issues(
+                project_code,
+                delivery=delivery,
+                component_name=component_name,
+                fields_profile=fields_profile,
+                updated_within_min=0,
+                raw=raw,
+            )
+            return
 
         jql = ju.build_jql(project_code, delivery, component_name)
-        while True:
-            try:
-                issues = cast(
-                    ResultList[Issue],
-                    self._j.search_issues(
-                        jql, maxResults=chunk_size, startAt=i
-                    ),
-                )
-            except JIRAError:
-                return []
-            i += chunk_size
-            result += issues.iterable
-            if i >= issues.total:
-                break
-        return result
+        fields = self._get_fields(fields_profile, delivery)
+        for page in self._iter_pages(jql, fields, raw):
+            yield from page
 
     def get_components(self, project_code: str) -> list[Component]:
         """
@@ -61,7 +457,75 @@ class JiraIntegration:
         :param project_code: project code
         :return: list of components
         """
-        return self._j.project_components(project_code)
+
+        def fetch() -> list[Component]:
+            return self._runner.run(
+                COMPONENTS_OPERATION,
+                project_code,
+                lambda: self._j.project_components(project_code),
+            )
+
+        if self._cache is None:
+            return fetch()
+
+        raw_components = self._cache.get_or_fetch(
+            COMPONENTS_RESOURCE,
+            f"project_components:{project_code}",
+            lambda: [cmp.raw for cmp in fetch()],
+        )
+        return self._to_resources(Component, raw_components)
+
+    def _get_project_versions(self, project_code: str) -> list[Version]:
+        """
+        Get all versions of a project
+
+        :param project_code: project code
+        :return: list of versions
+        """
+
+        def fetch() -> list[Version]:
+            return self._runner.run(
+                VERSIONS_OPERATION,
+                project_code,
+                lambda: self._j.project_versions(project_code),
+            )
+
+        if self._cache is None:
+            return fetch()
+
+        raw_versions = self._cache.get_or_fetch(
+            VERSIONS_RESOURCE,
+            f"project_versions:{project_code}",
+            lambda: [version.raw for version in fetch()],
+        )
+        return self._to_resources(Version, raw_versions)
+
+    def get_versions(self, project_code: str) -> JiraVersionCatalog:
+        """
+        Get indexed versions of a project. Versions are requested once,
+        the catalog is reloaded only after the application changes
+        a version itself.
+
+        :param project_code: project code
+        :return: version catalog
+        """
+        catalog = self._version_catalogs.get(project_code)
+        if catalog is None:
+            catalog = JiraVersionCatalog(
+                self._get_project_versions(project_code)
+            )
+            self._version_catalogs[project_code] = catalog
+        return catalog
+
+    def _invalidate_versions(self, project_code: str) -> None:
+        """
+        Forces versions of a project to be requested again
+
+        :param project_code: project code
+        """
+        self._version_catalogs.pop(project_code, None)
+        if self._cache is not None:
+            self._cache.invalidate(VERSIONS_RESOURCE)
 
     def mark_version_as_released(
         self, project_code: str, version_name: str
@@ -72,12 +536,15 @@ class JiraIntegration:
         :param project_code: project code
         :param version_name: version name
         """
-        version = self._j.get_project_version_by_name(
-            project=project_code, version_name=version_name
-        )
+        version = self.get_versions(project_code).get(version_name)
         if version is None:
             raise ValueError(f"Version {version_name} not found")
-        version.update(released=True)
+        self._runner.run(
+            VERSIONS_OPERATION,
+            version_name,
+            lambda: version.update(released=True),
+        )
+        self._invalidate_versions(project_code)
 
     def can_release_version(self, project_code: str, version_name: str) -> bool:
         """
@@ -87,9 +554,7 @@ class JiraIntegration:
         :param version_name: version name
         :return: True if version can be released, False otherwise
         """
-        version = self._j.get_project_version_by_name(
-            project=project_code, version_name=version_name
-        )
+        version = self.get_versions(project_code).get(version_name)
 
         if version is None:
             return False
@@ -107,20 +572,397 @@ class JiraIntegration:
         :param project_code: project code
         :return: latest version
         """
-        versions = sorted(
-            filter(
-                lambda v: not ju.is_jira_hotfix_version(v)
-                and ju.is_jira_released_version(v),
-                self._j.project_versions(project_code),
+        version = self.get_versions(project_code).latest_released()
+
+        if version is None:
+            raise ValueError("No versions found")
+
+        return version
+
+    def _get_transition_id(self, issue: Issue, transition_name: str) -> str:
+        """
+        Get the id of the transition available for the issue.
+        Transitions depend on the workflow, which is defined by the project
+        and the issue type, and on the issue status, so the id found is
+        reused for all issues sharing them.
+
+        :param issue: issue with status, issue type and project fields
+        :param transition_name: transition name, case insensitive
+        :return: transition id or empty string if not available
+        """
+        cache_key = (
+            issue.fields.project.id,
+            issue.fields.issuetype.id,
+            issue.fields.status.id,
+            transition_name.lower(),
+        )
+        if cache_key in self._transition_ids:
+            return self._transition_ids[cache_key]
+
+        transition_id = next(
+            (
+                str(transition["id"])
+                for transition in self._runner.run(
+                    TRANSITIONS_OPERATION,
+                    issue.key,
+                    lambda: self._j.transitions(issue.key),
+                )
+                if transition["name"].lower() == transition_name.lower()
             ),
-            key=lambda v: v.releaseDate,
-            reverse=True,
+            "",
         )
+        # not available transition is not cached, the workflow might
+        # be fixed by Jira administrator while the application is running
+        if transition_id:
+            self._transition_ids[cache_key] = transition_id
+        return transition_id
 
-        if len(versions) == 0:
-            raise ValueError("No versions found")
+    def _transition_issue_by_id(
+        self, task_name: str, transition_id: str, comment: str
+    ) -> str:
+        """
+        Transition issue using transition id, which saves the request
+        Jira client makes to find transition id by name
+
+        :param task_name: task name
+        :param transition_id: transition id
+        :param comment: comment
+        :return: error message or empty string
+        """
+        try:
+            self._runner.run(
+                TRANSITIONS_OPERATION,
+                task_name,
+                lambda: self._j.transition_issue(
+                    task_name, transition_id, comment=comment or None
+                ),
+                idempotent=False,
+            )
+        except JIRAError as error:
+            return error.text
+        return ""
+
+    def _bulk_request(self, method: str, path: str, body: Any = None) -> Any:
+        """
+        Sends request to Jira bulk operations API
+
+        :param method: HTTP method
+        :param path: path relative to the API root
+        :param body: JSON body
+        :return: JSON response
+        """
+        # pylint: disable=protected-access
+        url = self._j._get_url(path, base=self.BULK_API_URL)
+        if method == "POST":
+            response = self._j._session.post(url, data=json.dumps(body))
+        else:
+            response = self._j._session.get(url)
+        return response.json()
+
+    def _bulk_transition(
+        self, transitions: list[tuple[str, str]], issues: dict[str, Any]
+    ) -> tuple[list[tuple[str, str]], dict[str, str]]:
+        """
+        Transition issues with Jira bulk transition tasks, one task per
+        chunk of issues, and wait for the tasks to complete.
+        Only issues the bulk tasks definitely did not transition are
+        returned to be transitioned one by one, issues the tasks might
+        have transitioned are never transitioned twice.
+
+        :param transitions: task names and transition ids
+        :param issues: task name -> Jira issue with the status loaded
+        :return: transitions the bulk tasks rejected, and
+            task name -> error message of the issues the bulk tasks
+            did not complete in time or may have transitioned
+        """
+        issue_ids = {str(issues[name].id): name for name, _ in transitions}
+        rejected: list[tuple[str, str]] = []
+        errors: dict[str, str] = {}
+        unknown: list[str] = []
+        for start in range(0, len(transitions), self.BULK_TRANSITION_LIMIT):
+            chunk = transitions[start : start + self.BULK_TRANSITION_LIMIT]
+            try:
+                task_id = self._start_bulk_transition(chunk)
+            except (JIRAError, KeyError, ValueError) as error:
+                # Jira Server and Data Center have no bulk API, users may
+                # lack the bulk change permission
+                if getattr(error, "status_code", None) in (403, 404, 405):
+                    self._bulk_transitions = False
+                    rejected.extend(transitions[start:])
+                    break
+                # Jira might have accepted the task and only the response
+                # is lost, the issues must not be transitioned twice
+                unknown.extend(task_name for task_name, _ in chunk)
+                continue
+
+            chunk_rejected, chunk_unknown, chunk_errors = (
+                self._wait_bulk_transition(task_id, chunk, issue_ids)
+            )
+            rejected.extend(chunk_rejected)
+            unknown.extend(chunk_unknown)
+            errors.update(chunk_errors)
+        errors.update(self._get_not_transitioned_errors(unknown, issues))
+        return rejected, errors
+
+    def _wait_bulk_transition(
+        self,
+        task_id: str,
+        chunk: list[tuple[str, str]],
+        issue_ids: dict[str, str],
+    ) -> tuple[list[tuple[str, str]], list[str], dict[str, str]]:
+        """
+        Waits for the bulk transition task and sorts the issues of the
+        chunk by the task result
+
+        :param task_id: bulk task id
+        :param chunk: task names and transition ids
+        :param issue_ids: issue id -> task name
+        :return: transitions the task rejected, task names of the issues
+            the task may have transitioned, and task name -> error message
+            of the issues the task did not complete in time
+        """
+        task = self._wait_bulk_task(task_id)
+        processed = {
+            issue_ids.get(str(issue_id), str(issue_id))
+            for issue_id in task.get("processedAccessibleIssues", [])
+        }
+        failed = {
+            issue_ids.get(str(issue_id), str(issue_id))
+            for issue_id in task.get("failedAccessibleIssues", {})
+        }
+        rejected: list[tuple[str, str]] = []
+        unknown: list[str] = []
+        errors: dict[str, str] = {}
+        for task_name, transition_id in chunk:
+            if task_name in processed:
+                continue
+            if task_name in failed:
+                rejected.append((task_name, transition_id))
+            elif task.get("status") in self.BULK_FINAL_STATUSES:
+                unknown.append(task_name)
+            else:
+                # the task may still transition the issue,
+                # it must not be transitioned twice
+                errors[task_name] = (
+                    f"Bulk transition [{task_id}] is not completed"
+                )
+        return rejected, unknown, errors
+
+    def _start_bulk_transition(self, chunk: list[tuple[str, str]]) -> str:
+        """
+        Creates Jira bulk transition task
 
-        return versions[0]
+        :param chunk: task names and transition ids
+        :return: bulk task id
+        """
+        by_transition: dict[str, list[str]] = {}
+        for task_name, transition_id in chunk:
+            by_transition.setdefault(transition_id, []).append(task_name)
+        body = {
+            "bulkTransitionInputs": [
+                {
+                    "selectedIssueIdsOrKeys": task_names,
+                    "transitionId": transition_id,
+                }
+                for transition_id, task_names in by_transition.items()
+            ],
+            "sendBulkNotification": False,
+        }
+        return self._runner.run(
+            TRANSITIONS_OPERATION,
+            f"bulk of {len(chunk)} issues",
+            partial(
+                self._bulk_request, "POST", "bulk/issues/transition", body
+            ),
+            idempotent=False,
+        )["taskId"]
+
+    def _get_not_transitioned_errors(
+        self, task_names: list[str], issues: dict[str, Any]
+    ) -> dict[str, str]:
+        """
+        Re-reads statuses of the issues a bulk task may have transitioned,
+        issues which changed their status are taken as transitioned
+
+        :param task_names: task names
+        :param issues: task name -> Jira issue with the status loaded
+            before the bulk task
+        :return: task name -> error message of the issues which kept
+            their status or whose status could not be read
+        """
+        if not task_names:
+            return {}
+        try:
+            statuses = {
+                issue.key: issue.fields.status.id
+                for issue in self._search_all(
+                    ju.build_issue_keys_jql(task_names), ["status"]
+                )
+            }
+        except JIRAError:
+            statuses = {}
+        return {
+            task_name: "Bulk transition result is unknown, check the issue"
+            for task_name in task_names
+            if statuses.get(task_name, issues[task_name].fields.status.id)
+            == issues[task_name].fields.status.id
+        }
+
+    def _wait_bulk_task(self, task_id: str) -> dict[str, Any]:
+        """
+        Polls bulk task progress until the task is over or the
+        transitions deadline passes
+
+        :param task_id: bulk task id
+        :return: the last task progress
+        """
+        deadline = (
+            time.monotonic()
+            + self._runner.policy(TRANSITIONS_OPERATION).deadline_sec
+        )
+        while True:
+            try:
+                task = self._runner.run(
+                    TRANSITIONS_OPERATION,
+                    f"bulk task {task_id}",
+                    lambda: self._bulk_request("GET", f"bulk/queue/{task_id}"),
+                )
+            except JIRAError:
+                return {"status": "UNKNOWN"}
+            if task.get("status") in self.BULK_FINAL_STATUSES:
+                return task
+            if time.monotonic() + self.BULK_POLL_INTERVAL_SEC >= deadline:
+                return task
+            time.sleep(self.BULK_POLL_INTERVAL_SEC)
+
+    def _add_comment(self, task_name: str, comment: str) -> str:
+        """
+        Adds comment to the issue
+
+        :param task_name: task name
+        :param comment: comment
+        :return: error message or empty string
+        """
+        try:
+            self._runner.run(
+                TRANSITIONS_OPERATION,
+                task_name,
+                lambda: self._j.add_comment(task_name, comment),
+                idempotent=False,
+            )
+        except JIRAError as error:
+            return f"Issue is transitioned, comment is not added: {error.text}"
+        return ""
+
+    def transition_issues(  # pylint: disable=too-many-statements
+        self, task_names: list[str], status: str, comment: str = ""
+    ) -> dict[str, str]:
+        """
+        Transition issues to a new status.
+        Issues are requested in a single search to find out their
+        workflows and statuses, transition ids are resolved once per
+        workflow and status and reused afterwards.
+        Issues are transitioned with Jira bulk transition tasks when
+        Jira provides them, the comment is added to the transitioned
+        issues afterwards. Issues the bulk tasks rejected, and all issues
+        when bulk operations are not available, are transitioned one by
+        one concurrently.
+
+        :param task_names: task names
+        :param status: new status
+        :param comment: comment
+        :return: dictionary with task name as a key and error message
+            or empty string as a value, in the order of task names
+        """
+        if not task_names:
+            return {}
+
+        try:
+            issues = {
+                issue.key: issue
+                for issue in self._search_all(
+                    ju.build_issue_keys_jql(task_names),
+                    ["status", "issuetype", "project"],
+                )
+            }
+        except JIRAError:
+            # fall back to transitions by name
+            return {
+                task_name: self.transition_issue(task_name, status, comment)
+                for task_name in task_names
+            }
+
+        result: dict[str, str] = {}
+        transitions: list[tuple[str, str]] = []
+        for task_name in dict.fromkeys(task_names):
+            if task_name not in issues:
+                result[task_name] = f"Issue {task_name} not found"
+                continue
+            try:
+                transition_id = self._get_transition_id(
+                    issues[task_name], status
+                )
+            except JIRAError as error:
+                result[task_name] = error.text
+                continue
+            if not transition_id:
+                result[task_name] = f"Invalid transition name. {status}"
+                continue
+            transitions.append((task_name, transition_id))
+
+        rejected = transitions
+        if transitions and self._bulk_transitions:
+            rejected, errors = self._bulk_transition(transitions, issues)
+            result.update(errors)
+            not_transitioned = {name for name, _ in rejected} | set(errors)
+            bulk_transitioned = [
+                name for name, _ in transitions if name not in not_transitioned
+            ]
+            result.update(dict.fromkeys(bulk_transitioned, ""))
+            if comment:
+                result.update(
+                    zip(
+                        bulk_transitioned,
+                        self._run_concurrently(
+                            partial(self._add_comment, comment=comment),
+                            bulk_transitioned,
+                        ),
+                    )
+                )
+
+        result.update(
+            zip(
+                (name for name, _ in rejected),
+                self._run_concurrently(
+                    lambda transition: self._transition_issue_by_id(
+                        transition[0], transition[1], comment
+                    ),
+                    rejected,
+                ),
+            )
+        )
+
+        if self._cache is not None and transitions:
+            self._cache.invalidate(ISSUES_RESOURCE)
+
+        return {task_name: result[task_name] for task_name in task_names}
+
+    def _run_concurrently(
+        self, action: Callable[[T], str], items: list[T]
+    ) -> list[str]:
+        """
+        Runs the action for every item using up to max workers threads
+
+        :param action: action returning error message or empty string
+        :param items: action arguments
+        :return: action results in the order of items
+        """
+        if not items:
+            return []
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(self._max_workers, len(items)))
+        ) as executor:
+            return list(executor.map(action, items))
 
     def transition_issue(
         self, task_name: str, status: str, comment: str = ""
@@ -134,7 +976,16 @@ class JiraIntegration:
         :return: error message or empty string
         """
         try:
-            self._j.transition_issue(task_name, status, comment=comment)
-            return ""
+            self._runner.run(
+                TRANSITIONS_OPERATION,
+                task_name,
+                lambda: self._j.transition_issue(
+                    task_name, status, comment=comment
+                ),
+                idempotent=False,
+            )
         except JIRAError as error:
             return error.text
+        if self._cache is not None:
+            self._cache.invalidate(ISSUES_RESOURCE)
+        return ""
@@ -0,0 +1,213 @@
+"""
+Persistent Jira response cache module.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Optional, Protocol
+
+COMPONENTS_RESOURCE = "components"
+VERSIONS_RESOURCE = "versions"
+ISSUES_RESOURCE = "issues"
+
+
+@dataclass
+class JiraCacheStats:
+    """
+    Jira response cache statistics
+    """
+
+    hits: int = 0
+    misses: int = 0
+    revalidated: int = 0
+
+    def __str__(self):
+        return (
+            f"{self.hits} hit(s) ({self.revalidated} revalidated), "
+            f"{self.misses} miss(es)"
+        )
+
+
+class JiraResponseStore(Protocol):
+    """
+    Store of raw Jira responses Jira integration reads through,
+    implemented by the persistent cache and by offline snapshots
+    """
+
+    def get_or_fetch(
+        self,
+        resource: str,
+        key: str,
+        fetch: Callable[[], Any],
+        validate: Optional[Callable[[], str]] = None,
+    ) -> Any:
+        """
+        Returns the stored response or fetches it from Jira
+
+        :param resource: resource type
+        :param key: endpoint with arguments
+        :param fetch: function which downloads the JSON serializable
+            response from Jira
+        :param validate: optional function which returns a cheap to get
+            validator value of the response
+        :return: response
+        """
+
+    def invalidate(self, resource: str) -> None:
+        """
+        Forgets stored responses of the resource type
+
+        :param resource: resource type
+        """
+
+
+class JiraResponseCache:
+    """
+    Keeps raw Jira responses on disk between application runs.
+    Every response is stored under a resource type (components,
+    versions, issues) and a key, which is an endpoint with its
+    arguments, for example JQL query. A stored response is served
+    without contacting Jira while its resource type TTL is not expired.
+    After that it is revalidated with a cheap validator request if the
+    caller provides one, otherwise it is downloaded again.
+    """
+
+    DEFAULT_TTL_SEC = {
+        COMPONENTS_RESOURCE: 3600,
+        VERSIONS_RESOURCE: 600,
+        # issues are always revalidated since their statuses
+        # are changed by other people during the release
+        ISSUES_RESOURCE: 0,
+    }
+
+    def __init__(
+        self,
+        cache_dir: str,
+        ttl_sec: Optional[dict[str, int]] = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if not cache_dir:
+            raise ValueError("Cache directory is not specified")
+
+        self._cache_dir = cache_dir
+        self._ttl_sec = {**JiraResponseCache.DEFAULT_TTL_SEC, **(ttl_sec or {})}
+        self._clock = clock
+        self._stats = JiraCacheStats()
+
+    @property
+    def stats(self) -> JiraCacheStats:
+        """Cache hit/miss statistics"""
+        return self._stats
+
+    def _entry_path(self, resource: str, key: str) -> str:
+        """
+        Builds the path to the cache entry file.
+
+        :param resource: resource type
+        :param key: cache key
+        :return: path to the cache entry file
+        """
+        digest = hashlib.sha256(f"{resource}:{key}".encode("utf-8"))
+        return os.path.join(self._cache_dir, f"{resource}-{digest.hexdigest()}")
+
+    def _read(self, resource: str, key: str) -> Optional[dict[str, Any]]:
+        """
+        Reads the cache entry, damaged entries are treated as missing.
+
+        :param resource: resource type
+        :param key: cache key
+        :return: cache entry or None if not found
+        """
+        try:
+            with open(
+                self._entry_path(resource, key), "r", encoding="utf-8"
+            ) as entry_file:
+                entry = json.load(entry_file)
+        except (OSError, ValueError):
+            return None
+
+        # different keys might have the same file name in theory
+        return entry if entry.get("key") == key else None
+
+    def _write(
+        self, resource: str, key: str, payload: Any, validator: str
+    ) -> None:
+        """
+        Writes the cache entry atomically, so concurrent readers never
+        see a partially written file.
+
+        :param resource: resource type
+        :param key: cache key
+        :param payload: JSON serializable response
+        :param validator: validator value of the response
+        """
+        os.makedirs(self._cache_dir, exist_ok=True)
+        entry = {
+            "key": key,
+            "stored_at": self._clock(),
+            "validator": validator,
+            "payload": payload,
+        }
+        fd, tmp_path = tempfile.mkstemp(dir=self._cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as entry_file:
+            json.dump(entry, entry_file)
+        os.replace(tmp_path, self._entry_path(resource, key))
+
+    def get_or_fetch(
+        self,
+        resource: str,
+        key: str,
+        fetch: Callable[[], Any],
+        validate: Optional[Callable[[], str]] = None,
+    ) -> Any:
+        """
+        Returns the cached response or fetches it from Jira.
+
+        :param resource: resource type
+        :param key: cache key, endpoint with arguments
+        :param fetch: function which downloads the JSON serializable
+            response from Jira
+        :param validate: optional function which returns a cheap to get
+            validator value, for example the newest `updated` timestamp.
+            Stale entry with the same validator value is served
+            without calling `fetch`.
+        :return: response
+        """
+        entry = self._read(resource, key)
+        if entry is not None:
+            age = self._clock() - entry["stored_at"]
+            if age < self._ttl_sec.get(resource, 0):
+                self._stats.hits += 1
+                return entry["payload"]
+
+        validator = validate() if validate is not None else ""
+        if entry is not None and validator and entry["validator"] == validator:
+            self._stats.hits += 1
+            self._stats.revalidated += 1
+            self._write(resource, key, entry["payload"], validator)
+            return entry["payload"]
+
+        self._stats.misses += 1
+        payload = fetch()
+        self._write(resource, key, payload, validator)
+        return payload
+
+    def invalidate(self, resource: str) -> None:
+        """
+        Removes all cached responses of the resource type,
+        used when the resource is changed by the application itself.
+
+        :param resource: resource type
+        """
+        if not os.path.isdir(self._cache_dir):
+            return
+        for file_name in os.listdir(self._cache_dir):
+            if file_name.startswith(f"{resource}-"):
+                try:
+                    os.remove(os.path.join(self._cache_dir, file_name))
+                except FileNotFoundError:
+                    pass
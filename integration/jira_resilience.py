@@ -0,0 +1,357 @@
+"""
+Deadlines, retries and hedged requests of Jira calls module.
+"""
+
+import random
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from dataclasses import dataclass, field, replace
+from typing import Any, Callable, Optional, TypeVar
+
+from jira import JIRAError
+from requests.exceptions import (  # type: ignore
+    ConnectionError as RequestsConnectionError,
+    Timeout,
+)
+
+T = TypeVar("T")
+
+SEARCH_OPERATION = "search"
+COMPONENTS_OPERATION = "components"
+VERSIONS_OPERATION = "versions"
+TRANSITIONS_OPERATION = "transitions"
+
+# responses of overloaded or restarting Jira nodes
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+@dataclass(frozen=True)
+class JiraCallPolicy:
+    """
+    Limits of a Jira call.
+    Deadline covers all attempts of the call including backoff pauses.
+    Hedged request is another request of the same attempt sent when the
+    first one has not responded within `hedge_after_sec`, the response
+    which comes first is used.
+    """
+
+    deadline_sec: float
+    attempts: int = 1
+    backoff_sec: float = 0.5
+    max_backoff_sec: float = 8.0
+    hedge_after_sec: Optional[float] = None
+
+    def __post_init__(self):
+        if self.deadline_sec <= 0:
+            raise ValueError(f"Invalid deadline [{self.deadline_sec}]")
+        if self.attempts < 1:
+            raise ValueError(f"Invalid number of attempts [{self.attempts}]")
+
+
+DEFAULT_POLICIES = {
+    SEARCH_OPERATION: JiraCallPolicy(deadline_sec=120, attempts=3),
+    COMPONENTS_OPERATION: JiraCallPolicy(deadline_sec=60, attempts=3),
+    VERSIONS_OPERATION: JiraCallPolicy(deadline_sec=60, attempts=3),
+    TRANSITIONS_OPERATION: JiraCallPolicy(deadline_sec=60, attempts=3),
+}
+
+
+def policies_from_config(
+    operations: dict[str, dict[str, Any]],
+) -> dict[str, JiraCallPolicy]:
+    """
+    Builds call policies from the configuration section, where every
+    operation may override `deadline`, `attempts`, `backoff`,
+    `maxBackoff` and `hedgeAfter` of its default policy.
+
+    :param operations: operation name -> policy settings
+    :return: operation name -> call policy
+    """
+    policies = dict(DEFAULT_POLICIES)
+    for operation, settings in operations.items():
+        if operation not in DEFAULT_POLICIES:
+            raise ValueError(f"Unknown Jira operation [{operation}]")
+        default = DEFAULT_POLICIES[operation]
+        policies[operation] = replace(
+            default,
+            deadline_sec=settings.get("deadline", default.deadline_sec),
+            attempts=settings.get("attempts", default.attempts),
+            backoff_sec=settings.get("backoff", default.backoff_sec),
+            max_backoff_sec=settings.get("maxBackoff", default.max_backoff_sec),
+            hedge_after_sec=settings.get("hedgeAfter", default.hedge_after_sec),
+        )
+    return policies
+
+
+@dataclass
+class JiraCallOutcome:  # pylint: disable=too-many-instance-attributes
+    """
+    Outcome of a Jira call which needed more than one request or failed
+    """
+
+    operation: str
+    target: str
+    attempts: int = 0
+    hedged: int = 0
+    elapsed_sec: float = 0.0
+    errors: list[str] = field(default_factory=list)
+    succeeded: bool = False
+    deadline_exceeded: bool = False
+
+    def __str__(self):
+        if self.succeeded:
+            result = "recovered"
+        elif self.deadline_exceeded:
+            result = "deadline exceeded"
+        else:
+            result = "failed"
+        details = "; ".join(self.errors)
+        return (
+            f"[{self.operation}] {self.target}: {result} after "
+            f"{self.attempts} attempt(s), {self.hedged} hedged, "
+            f"{self.elapsed_sec:.1f}s" + (f" ({details})" if details else "")
+        )
+
+
+class JiraCallReport:
+    """
+    Outcomes of Jira calls which were retried, hedged or failed
+    """
+
+    def __init__(self) -> None:
+        self._outcomes: list[JiraCallOutcome] = []
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._outcomes)
+
+    def __str__(self):
+        return "\n".join(str(outcome) for outcome in self.outcomes)
+
+    @property
+    def outcomes(self) -> list[JiraCallOutcome]:
+        """Recorded outcomes"""
+        with self._lock:
+            return list(self._outcomes)
+
+    @property
+    def failed(self) -> list[JiraCallOutcome]:
+        """Outcomes of the calls which did not succeed"""
+        return [outcome for outcome in self.outcomes if not outcome.succeeded]
+
+    def add(self, outcome: JiraCallOutcome) -> None:
+        """Records the outcome"""
+        with self._lock:
+            self._outcomes.append(outcome)
+
+
+class JiraOperationError(JIRAError):
+    """
+    Jira call failed, the outcome describes all its attempts while
+    `text` and `status_code` are taken from the last one
+    """
+
+    def __init__(
+        self,
+        outcome: JiraCallOutcome,
+        text: str,
+        status_code: Optional[int] = None,
+    ) -> None:
+        super().__init__(text=text, status_code=status_code)  # type: ignore
+        self.outcome = outcome
+
+    def __str__(self):
+        return str(self.outcome)
+
+
+def is_retryable(error: Exception) -> bool:
+    """
+    Whether another attempt of the call may succeed
+
+    :param error: error of the attempt
+    :return: True for network errors and overloaded Jira responses
+    """
+    if isinstance(error, (RequestsConnectionError, Timeout)):
+        return True
+    return (
+        isinstance(error, JIRAError)
+        and error.status_code in RETRYABLE_STATUS_CODES
+    )
+
+
+class _DeadlineExceeded(Exception):
+    """
+    No response came before the deadline
+    """
+
+
+def _start(call: Callable[[], T]) -> "Future[T]":
+    """
+    Runs the call in a daemon thread, so a hung request never keeps
+    the application from exiting
+
+    :param call: call to run
+    :return: future of the call result
+    """
+    future: Future[T] = Future()
+
+    def run():
+        try:
+            future.set_result(call())
+        except Exception as error:  # pylint: disable=broad-except
+            future.set_exception(error)
+
+    threading.Thread(target=run, daemon=True).start()
+    return future
+
+
+class JiraCallRunner:
+    """
+    Runs Jira calls within deadlines of their operations. Idempotent calls
+    are retried after retryable errors with exponential backoff and full
+    jitter and, if configured, hedged. Calls which needed more than one
+    request are recorded to the report.
+    """
+
+    def __init__(
+        self,
+        policies: Optional[dict[str, JiraCallPolicy]] = None,
+        report: Optional[JiraCallReport] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+        rnd: Optional[random.Random] = None,
+    ) -> None:
+        self._policies = {**DEFAULT_POLICIES, **(policies or {})}
+        self.report = report if report is not None else JiraCallReport()
+        self._clock = clock
+        self._sleep = sleep
+        self._random = rnd or random.Random()
+
+    def policy(self, operation: str) -> JiraCallPolicy:
+        """
+        Returns policy of the operation
+
+        :param operation: operation name
+        :return: call policy
+        """
+        if operation not in self._policies:
+            raise ValueError(f"Unknown Jira operation [{operation}]")
+        return self._policies[operation]
+
+    def run(  # pylint: disable=too-many-statements
+        self,
+        operation: str,
+        target: str,
+        call: Callable[[], T],
+        idempotent: bool = True,
+    ) -> T:
+        """
+        Runs the call
+
+        :param operation: operation name, defines the call policy
+        :param target: what is requested, for the report
+        :param call: Jira call
+        :param idempotent: whether the call can be safely repeated,
+            non-idempotent calls are never retried or hedged
+        :return: call result
+        :raises JiraOperationError: when the call failed
+        """
+        policy = self.policy(operation)
+        started = self._clock()
+        deadline = started + policy.deadline_sec
+        attempts = policy.attempts if idempotent else 1
+        outcome = JiraCallOutcome(operation, target)
+        status_code: Optional[int] = None
+        text = ""
+
+        while True:
+            outcome.attempts += 1
+            try:
+                result = self._attempt(
+                    call,
+                    deadline,
+                    policy.hedge_after_sec if idempotent else None,
+                    outcome,
+                )
+            except _DeadlineExceeded:
+                outcome.deadline_exceeded = True
+                text = "no response before the deadline"
+                outcome.errors.append(text)
+                break
+            except Exception as error:  # pylint: disable=broad-except
+                if not isinstance(error, JIRAError) and not is_retryable(error):
+                    raise
+                outcome.errors.append(_describe(error))
+                status_code = getattr(error, "status_code", None)
+                text = getattr(error, "text", None) or str(error)
+                if outcome.attempts >= attempts or not is_retryable(error):
+                    break
+                pause = self._random.uniform(
+                    0,
+                    min(
+                        policy.max_backoff_sec,
+                        policy.backoff_sec * 2 ** (outcome.attempts - 1),
+                    ),
+                )
+                if self._clock() + pause >= deadline:
+                    outcome.deadline_exceeded = True
+                    break
+                self._sleep(pause)
+                continue
+
+            if outcome.attempts > 1 or outcome.hedged > 0:
+                outcome.succeeded = True
+                outcome.elapsed_sec = self._clock() - started
+                self.report.add(outcome)
+            return result
+
+        outcome.elapsed_sec = self._clock() - started
+        self.report.add(outcome)
+        raise JiraOperationError(outcome, text, status_code)
+
+    def _attempt(
+        self,
+        call: Callable[[], T],
+        deadline: float,
+        hedge_after_sec: Optional[float],
+        outcome: JiraCallOutcome,
+    ) -> T:
+        """
+        Runs a single attempt of the call, hedging it if needed
+
+        :raises _DeadlineExceeded: when no response came before
+            the deadline
+        """
+        futures = [_start(call)]
+        if hedge_after_sec is not None:
+            done, _ = wait(
+                futures, timeout=min(hedge_after_sec, deadline - self._clock())
+            )
+            if not done and self._clock() < deadline:
+                outcome.hedged += 1
+                futures.append(_start(call))
+
+        error: Optional[BaseException] = None
+        pending = set(futures)
+        while pending:
+            remaining = deadline - self._clock()
+            if remaining <= 0:
+                break
+            done, pending = wait(
+                pending, timeout=remaining, return_when=FIRST_COMPLETED
+            )
+            for future in done:
+                if future.exception() is None:
+                    return future.result()
+                error = future.exception()
+        if error is not None and not pending:
+            raise error
+        raise _DeadlineExceeded()
+
+
+def _describe(error: Exception) -> str:
+    """Short description of the attempt error"""
+    if isinstance(error, JIRAError):
+        return f"HTTP {error.status_code}: {error.text}"
+    return f"{type(error).__name__}: {error}"
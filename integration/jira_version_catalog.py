@@ -0,0 +1,93 @@
+"""
+Jira version catalog module.
+"""
+
+from itertools import product
+from typing import Iterable, Optional
+
+from jira.resources import Version
+
+import jira_utils as ju
+
+
+class JiraVersionCatalog:
+    """
+    Versions of a Jira project indexed once they are loaded, so name
+    lookups, the latest release and versions with given flags are
+    answered without requesting, scanning and sorting the versions again.
+    Versions are compared by name case sensitively the way Jira does,
+    release dates are ISO dates (YYYY-MM-DD) compared as strings.
+    """
+
+    def __init__(self, versions: Iterable[Version]) -> None:
+        self._versions = list(versions)
+        self._by_name = {v.name: v for v in self._versions}
+        # released versions having release date, oldest first
+        self._released = sorted(
+            (
+                v
+                for v in self._versions
+                if ju.is_jira_released_version(v)
+                and getattr(v, "releaseDate", None)
+            ),
+            key=lambda v: v.releaseDate,
+        )
+        self._released_not_hotfixes = [
+            v for v in self._released if not ju.is_jira_hotfix_version(v)
+        ]
+        # (released, archived, hotfix) flags -> versions in Jira order,
+        # None in the key matches any value of the flag
+        self._by_flags: dict[
+            tuple[Optional[bool], Optional[bool], Optional[bool]],
+            list[Version],
+        ] = {}
+        for v in self._versions:
+            for key in product(
+                (None, bool(v.released)),
+                (None, bool(v.archived)),
+                (None, ju.is_jira_hotfix_version(v)),
+            ):
+                self._by_flags.setdefault(key, []).append(v)
+
+    def __len__(self):
+        return len(self._versions)
+
+    def __iter__(self):
+        return iter(self._versions)
+
+    def get(self, name: str) -> Optional[Version]:
+        """
+        Returns version by name
+
+        :param name: version name
+        :return: version or None if not found
+        """
+        return self._by_name.get(name)
+
+    def latest_released(self, include_hotfixes=False) -> Optional[Version]:
+        """
+        Returns the latest released version
+
+        :param include_hotfixes: whether hotfix versions are considered
+        :return: version or None if nothing is released
+        """
+        released = (
+            self._released if include_hotfixes else self._released_not_hotfixes
+        )
+        return released[-1] if released else None
+
+    def select(
+        self,
+        released: Optional[bool] = None,
+        archived: Optional[bool] = None,
+        hotfix: Optional[bool] = None,
+    ) -> list[Version]:
+        """
+        Returns versions matching the flags, None matches any value
+
+        :param released: released flag
+        :param archived: archived flag
+        :param hotfix: whether version is a hotfix
+        :return: list of versions in Jira order
+        """
+        return list(self._by_flags.get((released, archived, hotfix), []))
@@ -0,0 +1,123 @@
+"""
+Integration registry module.
+"""
+
+import threading
+from typing import Any, Optional
+
+from integration.git import GitIntegration
+from integration.git_mirror import GitMirrorStore
+from integration.jira import JiraIntegration
+from integration.jira_cache import JiraResponseCache, JiraResponseStore
+from integration.jira_resilience import policies_from_config
+from integration.snapshot import (
+    OfflineJiraIntegration,
+    Snapshot,
+    SnapshotGitIntegration,
+    SnapshotJiraStore,
+)
+
+
+class IntegrationRegistry:
+    """
+    Builds integration clients from the application configuration once
+    per process, so all their consumers share the same authenticated
+    session and connection pool. Clients are created on the first request.
+    When a snapshot is given, clients record what they read into it or,
+    when it is not being recorded, read everything from it offline.
+    """
+
+    def __init__(
+        self, config: Any, snapshot: Optional[Snapshot] = None
+    ) -> None:
+        """
+        :param config: application configuration
+        :param snapshot: optional snapshot to record or to replay
+        """
+        self._config = config
+        self._snapshot = snapshot
+        self._lock = threading.Lock()
+        self._git: Optional[GitIntegration] = None
+        self._jira: Optional[JiraIntegration] = None
+        self._jira_cache: Optional[JiraResponseCache] = None
+
+    @property
+    def offline(self) -> bool:
+        """True when clients read everything from a snapshot"""
+        return self._snapshot is not None and not self._snapshot.recording
+
+    @property
+    def jira_cache(self) -> Optional[JiraResponseCache]:
+        """
+        Persistent cache of Jira responses, None when it is not configured
+        or not used offline
+        """
+        settings = self._config.data["jira"]
+        if "cache" not in settings or self.offline:
+            return None
+        with self._lock:
+            if self._jira_cache is None:
+                self._jira_cache = JiraResponseCache(
+                    settings["cache"]["path"], settings["cache"].get("ttl")
+                )
+            return self._jira_cache
+
+    @property
+    def jira(self) -> JiraIntegration:
+        """
+        Jira integration shared by all consumers
+        """
+        store: Optional[JiraResponseStore] = self.jira_cache
+        with self._lock:
+            if self._jira is not None:
+                return self._jira
+            settings = self._config.data["jira"]
+            page_size = settings.get(
+                "pageSize", JiraIntegration.DEFAULT_PAGE_SIZE
+            )
+            max_workers = settings.get("maxWorkers", 1)
+            if self._snapshot is not None and self.offline:
+                self._jira = OfflineJiraIntegration(
+                    self._snapshot, page_size, max_workers
+                )
+            else:
+                if self._snapshot is not None:
+                    store = SnapshotJiraStore(self._snapshot, store)
+                self._jira = JiraIntegration(
+                    settings["host"],
+                    settings["username"],
+                    settings["password"],
+                    page_size,
+                    max_workers,
+                    cache=store,
+                    request_timeout_sec=settings.get(
+                        "requestTimeout",
+                        JiraIntegration.DEFAULT_REQUEST_TIMEOUT_SEC,
+                    ),
+                    policies=policies_from_config(
+                        settings.get("operations", {})
+                    ),
+                )
+            return self._jira
+
+    @property
+    def git(self) -> GitIntegration:
+        """
+        Git integration shared by all consumers, repositories are
+        cloned from local mirrors when they are configured
+        """
+        with self._lock:
+            if self._git is not None:
+                return self._git
+            settings = self._config.data.get("release", {})
+            mirrors = (
+                GitMirrorStore(settings["mirrors"]["path"])
+                if "mirrors" in settings and not self.offline
+                else None
+            )
+            self._git = (
+                GitIntegration(mirrors=mirrors)
+                if self._snapshot is None
+                else SnapshotGitIntegration(self._snapshot, mirrors=mirrors)
+            )
+            return self._git
@@ -0,0 +1,390 @@
+"""
+Offline snapshot module.
+
+A snapshot is a local zip archive with everything a command read from
+Jira and from git remotes: components, versions, issues, tag lists,
+annotated tag lookups and changelog files. A command run in the recording
+mode writes the snapshot, the same command run offline reads everything
+from the snapshot instead, so releases can be rehearsed and profiled on
+a reproducible input.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import zipfile
+from datetime import datetime
+from functools import partial
+from typing import Any, Callable, Optional
+
+from jira import JIRA
+
+from core.cvs import CodeRepository
+from fs_utils import search_changelog_first
+from integration.git import GitIntegration, GitTag
+from integration.git_mirror import GitMirrorStore
+from integration.jira import JiraIntegration
+from integration.jira_cache import JiraResponseStore
+
+JIRA_KIND = "jira"
+TAGS_KIND = "tags"
+ANNOTATED_TAGS_KIND = "annotated-tags"
+CHANGELOG_KIND = "changelogs"
+
+
+class SnapshotMissError(ValueError):
+    """
+    Raised when an offline command reads something the snapshot
+    was not recorded with
+    """
+
+
+class Snapshot:
+    """
+    Responses of Jira and git remotes stored by kind and key.
+    In the recording mode every read goes to the source and its result
+    is kept until the snapshot is saved, otherwise reads are served
+    from the snapshot archive.
+    """
+
+    def __init__(self, path: str, recording: bool = False) -> None:
+        """
+        :param path: path to the snapshot archive
+        :param recording: record a new snapshot instead of reading
+            the existing one
+        """
+        if not path:
+            raise ValueError("Snapshot path is not specified")
+        self._path = path
+        self._recording = recording
+        self._lock = threading.Lock()
+        self._entries: dict[tuple[str, str], Any] = {}
+        if not recording:
+            self._load()
+
+    @property
+    def path(self) -> str:
+        """Path to the snapshot archive"""
+        return self._path
+
+    @property
+    def recording(self) -> bool:
+        """True when the snapshot is being recorded"""
+        return self._recording
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _entry_name(kind: str, key: str) -> str:
+        """
+        Get archive entry name, keys are hashed since they contain
+        JQL queries and urls
+        """
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return f"{kind}/{digest}.json"
+
+    def _load(self) -> None:
+        """
+        Read all entries of the snapshot archive
+        """
+        if not os.path.isfile(self._path):
+            raise ValueError(f"Snapshot not found [{self._path}]")
+        with zipfile.ZipFile(self._path) as archive:
+            for name in archive.namelist():
+                entry = json.loads(archive.read(name))
+                self._entries[(entry["kind"], entry["key"])] = entry["value"]
+
+    def read(self, kind: str, key: str, fetch: Callable[[], Any]) -> Any:
+        """
+        Read a value from the source when recording, otherwise
+        from the snapshot.
+
+        :param kind: kind of the value, for example `jira` or `tags`
+        :param key: key of the value within its kind
+        :param fetch: function which reads the JSON serializable value
+            from the source
+        :return: value
+        """
+        if self._recording:
+            value = fetch()
+            with self._lock:
+                self._entries[(kind, key)] = value
+            return value
+
+        with self._lock:
+            if (kind, key) not in self._entries:
+                raise SnapshotMissError(
+                    f"[{kind}] [{key}] is not recorded in snapshot "
+                    + f"[{self._path}]"
+                )
+            return self._entries[(kind, key)]
+
+    def save(self) -> None:
+        """
+        Write the recorded entries to the snapshot archive
+        """
+        if not self._recording:
+            raise ValueError(f"Snapshot is not being recorded [{self._path}]")
+        directory = os.path.dirname(os.path.abspath(self._path))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        os.close(fd)
+        with self._lock, zipfile.ZipFile(
+            tmp_path, "w", zipfile.ZIP_DEFLATED
+        ) as archive:
+            for (kind, key), value in self._entries.items():
+                archive.writestr(
+                    self._entry_name(kind, key),
+                    json.dumps({"kind": kind, "key": key, "value": value}),
+                )
+        os.replace(tmp_path, self._path)
+
+
+class SnapshotJiraStore:
+    """
+    Jira response store which records responses into a snapshot or
+    serves them from it, see `integration.jira_cache.JiraResponseStore`.
+    When recording, responses are read through the persistent cache
+    if it is configured.
+    """
+
+    def __init__(
+        self, snapshot: Snapshot, inner: Optional[JiraResponseStore] = None
+    ) -> None:
+        """
+        :param snapshot: snapshot
+        :param inner: store to read responses through while recording
+        """
+        self._snapshot = snapshot
+        self._inner = inner
+
+    def get_or_fetch(
+        self,
+        resource: str,
+        key: str,
+        fetch: Callable[[], Any],
+        validate: Optional[Callable[[], str]] = None,
+    ) -> Any:
+        """
+        Returns the response from the snapshot or records it
+
+        :param resource: resource type
+        :param key: endpoint with arguments
+        :param fetch: function which downloads the response from Jira
+        :param validate: validator function passed to the inner store
+        :return: response
+        """
+        if self._inner is not None:
+            fetch = partial(
+                self._inner.get_or_fetch, resource, key, fetch, validate
+            )
+        return self._snapshot.read(JIRA_KIND, f"{resource}:{key}", fetch)
+
+    def invalidate(self, resource: str) -> None:
+        """
+        Invalidates the inner store, the snapshot keeps
+        the latest recorded responses
+
+        :param resource: resource type
+        """
+        if self._inner is not None:
+            self._inner.invalidate(resource)
+
+
+class OfflineJiraIntegration(JiraIntegration):
+    """
+    Jira integration which reads everything from a snapshot and never
+    contacts Jira. Nothing changes in a snapshot, so delta queries return
+    no issues and changes of issues and versions are skipped.
+    """
+
+    OFFLINE_HOST = "http://offline.invalid"
+
+    def __init__(
+        self,
+        snapshot: Snapshot,
+        page_size: int = JiraIntegration.DEFAULT_PAGE_SIZE,
+        max_workers: int = 1,
+    ) -> None:
+        """
+        :param snapshot: snapshot to read responses from
+        :param page_size: number of issues requested per search page
+        :param max_workers: number of concurrent workers
+        """
+        super().__init__(
+            OfflineJiraIntegration.OFFLINE_HOST,
+            "",
+            "",
+            page_size,
+            max_workers,
+            cache=SnapshotJiraStore(snapshot),
+        )
+
+    def _connect(
+        self, host, username, password, request_timeout_sec: float
+    ) -> JIRA:
+        # the client only builds resources from recorded responses
+        return JIRA(host, get_server_info=False)
+
+    # pylint: disable=too-many-arguments
+    def _get_issues(
+        self,
+        project_code: str,
+        *,
+        delivery: str | list[str],
+        component_name: str,
+        fields_profile: str,
+        updated_within_min: int,
+        raw: bool,
+    ) -> list[Any]:
+        if updated_within_min > 0:
+            return []
+        return super()._get_issues(
+            project_code,
+            delivery=delivery,
+            component_name=component_name,
+            fields_profile=fields_profile,
+            updated_within_min=updated_within_min,
+            raw=raw,
+        )
+
+    def _get_issues_validator(self, jql: str) -> str:
+        return ""
+
+    def mark_version_as_released(
+        self, project_code: str, version_name: str
+    ) -> None:
+        if self.get_versions(project_code).get(version_name) is None:
+            raise ValueError(f"Version {version_name} not found")
+
+    def transition_issues(
+        self, task_names: list[str], status: str, comment: str = ""
+    ) -> dict[str, str]:
+        return dict.fromkeys(task_names, "")
+
+    def transition_issue(
+        self, task_name: str, status: str, comment: str = ""
+    ) -> str:
+        return ""
+
+
+def tag_to_json(tag: GitTag) -> dict[str, Optional[str]]:
+    """
+    Get JSON representation of a tag
+
+    :param tag: tag
+    :return: JSON dictionary
+    """
+    return {
+        "name": tag.name,
+        "date": tag.committed_datetime.isoformat(),
+        "taggedDate": (
+            tag.tagged_datetime.isoformat() if tag.tagged_datetime else None
+        ),
+        "message": tag.message,
+    }
+
+
+def tag_from_json(data: dict[str, Optional[str]]) -> GitTag:
+    """
+    Build tag from its JSON representation
+
+    :param data: JSON dictionary
+    :return: tag
+    """
+    tagged_date = data.get("taggedDate")
+    return GitTag(
+        str(data["name"]),
+        datetime.fromisoformat(str(data["date"])),
+        datetime.fromisoformat(tagged_date) if tagged_date else None,
+        data.get("message") or "",
+    )
+
+
+class SnapshotGitIntegration(GitIntegration):
+    """
+    Git integration which records tag lists, annotated tag lookups and
+    changelog files into a snapshot or serves them from it. Offline,
+    repositories are not cloned, the recorded changelog is written into
+    an empty directory on checkout. Values are recorded by repository
+    urls without credentials.
+    """
+
+    def __init__(
+        self,
+        snapshot: Snapshot,
+        branch: str = "master",
+        mirrors: Optional[GitMirrorStore] = None,
+    ) -> None:
+        """
+        :param snapshot: snapshot
+        :param branch: branch repositories are cloned from
+        :param mirrors: optional store of repository mirrors used
+            while recording
+        """
+        super().__init__(branch, mirrors)
+        self._snapshot = snapshot
+        # sources directory -> repository url without credentials
+        self._urls: dict[str, str] = {}
+
+    def clone(self, url: str, sources_dir: Optional[str] = None) -> str:
+        if self._snapshot.recording:
+            sources_dir = super().clone(url, sources_dir)
+        elif sources_dir is None:
+            sources_dir = tempfile.mkdtemp(prefix="nova")
+        self._urls[sources_dir] = CodeRepository.sanitize_git_url(url)
+        return sources_dir
+
+    def _get_url(self, repo_dir: str) -> str:
+        """
+        Get url of a repository cloned by this integration
+        """
+        if repo_dir not in self._urls:
+            raise ValueError(f"Repository is not cloned [{repo_dir}]")
+        return self._urls[repo_dir]
+
+    def list_tags(
+        self, url: str, since: str = "", retry_times=3, retry_interval_sec=5
+    ) -> list[GitTag]:
+        list_tags = partial(
+            super().list_tags, url, since, retry_times, retry_interval_sec
+        )
+
+        def fetch() -> list[dict[str, Optional[str]]]:
+            return [tag_to_json(tag) for tag in list_tags()]
+
+        records = self._snapshot.read(
+            TAGS_KIND, f"{CodeRepository.sanitize_git_url(url)}|{since}", fetch
+        )
+        return [tag_from_json(record) for record in records]
+
+    def list_tags_with_annotation(
+        self, repo_dir: str, annotation: str
+    ) -> list[str]:
+        return self._snapshot.read(
+            ANNOTATED_TAGS_KIND,
+            f"{self._get_url(repo_dir)}|{annotation}",
+            partial(super().list_tags_with_annotation, repo_dir, annotation),
+        )
+
+    def checkout(self, repo_dir: str, tag_name: str):
+        checkout = partial(super().checkout, repo_dir, tag_name)
+
+        def fetch() -> Optional[str]:
+            checkout()
+            changelog_path = search_changelog_first(repo_dir)
+            if changelog_path is None:
+                return None
+            with open(changelog_path, "r", encoding="utf-8") as changelog:
+                return changelog.read()
+
+        content = self._snapshot.read(
+            CHANGELOG_KIND, f"{self._get_url(repo_dir)}|{tag_name}", fetch
+        )
+        if not self._snapshot.recording and content is not None:
+            changelog_path = os.path.join(repo_dir, "CHANGELOG.md")
+            with open(changelog_path, "w", encoding="utf-8") as changelog:
+                changelog.write(content)
@@ -2,7 +2,7 @@
 Jira utility helper function module.
 """
 
-from typing import Optional
+from typing import Any, Callable, Optional
 from urllib.parse import urlparse
 
 from validators.url import url  # type: ignore
@@ -17,6 +17,20 @@ from core.nova_task import NovaTask
 
 JiraComponentGitUrl = tuple[Optional[GitCloudService], Optional[str]]
 
+# Named sets of issue fields requested from Jira. Issue key is always
+# returned by Jira, so it is not listed.
+STATUS_ONLY_FIELDS_PROFILE = "status-only"
+RELEASE_PREVIEW_FIELDS_PROFILE = "release-preview"
+JIRA_FIELDS_PROFILES: dict[str, list[str]] = {
+    STATUS_ONLY_FIELDS_PROFILE: ["components", "status"],
+    RELEASE_PREVIEW_FIELDS_PROFILE: [
+        "components",
+        "status",
+        "summary",
+        "customfield_10646",
+    ],
+}
+
 
 def parse_jira_cmp_descr(
     descr: str,
@@ -48,23 +62,63 @@ def parse_jira_cmp_descr(
     return None, None
 
 
-def build_jql(project_code: str, fix_version="", component_name="") -> str:
+def build_jql(
+    project_code: str,
+    fix_version: str | list[str] = "",
+    component_name="",
+    updated_within_min: int = 0,
+) -> str:
     """
     Build JQL query string.
 
     :param project_code: Jira project code.
-    :param fix_version: Jira delivery version number.
+    :param fix_version: Jira delivery version number or several
+        version numbers, issues of any of them are selected.
     :param component: Jira component name.
+    :param updated_within_min: only issues updated within the specified
+        number of minutes. Relative date is used since it does not depend
+        on the Jira user time zone.
     :return: JQL query string.
     """
     jql = f"project={project_code}"
-    if fix_version:
+    if isinstance(fix_version, list):
+        if fix_version:
+            versions = ", ".join(f'"{version}"' for version in fix_version)
+            jql += f" AND fixVersion in ({versions})"
+    elif fix_version:
         jql += f' AND fixVersion="{fix_version}"'
     if component_name:
         jql += f' AND component="{component_name}"'
+    if updated_within_min > 0:
+        jql += f' AND updated >= "-{updated_within_min}m"'
     return jql
 
 
+def build_issue_keys_jql(issue_keys: list[str]) -> str:
+    """
+    Build JQL query string which selects issues by keys.
+
+    :param issue_keys: Jira issue keys.
+    :return: JQL query string.
+    """
+    if not issue_keys:
+        raise ValueError("Issue keys are not specified")
+    keys = ", ".join(f'"{key}"' for key in issue_keys)
+    return f"key in ({keys})"
+
+
+def get_jira_fields(fields_profile: str) -> list[str]:
+    """
+    Get the list of Jira issue fields for a named fields profile.
+
+    :param fields_profile: fields profile name.
+    :return: list of Jira issue field names.
+    """
+    if fields_profile not in JIRA_FIELDS_PROFILES:
+        raise ValueError(f"Unknown fields profile [{fields_profile}]")
+    return list(JIRA_FIELDS_PROFILES[fields_profile])
+
+
 def parse_jira_issue(issue: Issue) -> NovaTask:
     """
     Parse Jira issue into Nova task.
@@ -92,17 +146,58 @@ def parse_jira_issue(issue: Issue) -> NovaTask:
         if hasattr(issue.fields, "customfield_10646")
         else None
     )
+    # summary is not requested by the status-only fields profile
+    summary = getattr(issue.fields, "summary", "") or ""
 
-    return NovaTask(issue.key, status, issue.fields.summary, deployment_field)
+    return NovaTask(issue.key, status, summary, deployment_field)
 
 
-def parse_jira_component(cmp: object, config=None) -> NovaComponent:
+def parse_jira_issue_raw(issue: dict[str, Any]) -> NovaTask:
+    """
+    Parse Jira issue JSON dictionary into Nova task.
+    Applies the same validation rules as `parse_jira_issue`.
+
+    :param issue: Jira issue as returned by Jira REST API.
+    :return: Nova task.
+    """
+    if "key" not in issue:
+        raise ValueError("Issue has no key")
+    key = issue["key"]
+    if not key:
+        raise ValueError("Issue key is empty")
+    fields = issue.get("fields") or {}
+    components = fields.get("components") or []
+    if len(components) == 0:
+        raise ValueError(f"Issue [{key}] has no component")
+    if len(components) > 1:
+        raise ValueError(f"Issue [{key}] has more than one component")
+
+    status_name = (fields.get("status") or {}).get("name")
+    status = NovaTask.map_jira_issue_status(status_name)
+    if status == Status.UNDEFINED:
+        raise ValueError(f"[{key}] has invalid status [{status_name}]")
+
+    return NovaTask(
+        key,
+        status,
+        fields.get("summary") or "",
+        fields.get("customfield_10646"),
+    )
+
+
+def parse_jira_component(
+    cmp: object,
+    config=None,
+    classify: Callable[[str], JiraComponentGitUrl] = parse_jira_cmp_descr,
+) -> NovaComponent:
     """
     Parse Jira component into Nova component.
 
     :param cmp: Jira component.
     :param config: Application configuration,
         required to initialize repository object.
+    :param classify: Function returning cloud service and repository URL
+        of the component description.
     :return: Nova component.
     """
     if cmp is None:
@@ -122,7 +217,7 @@ def parse_jira_component(cmp: object, config=None) -> NovaComponent:
     if description is None or description.strip() == "":
         raise ValueError(f"Component [{name}] has empty description")
 
-    cloud_service, repo_url = parse_jira_cmp_descr(description)
+    cloud_service, repo_url = classify(description)
     if cloud_service is None or repo_url is None:
         raise ValueError(
             f"Component [{name}] has invalid description, "
@@ -135,22 +230,32 @@ def parse_jira_component(cmp: object, config=None) -> NovaComponent:
     return NovaComponent(name, CodeRepository(cloud_service, repo_url, config))
 
 
-def filter_jira_issue(jira_issue, component_name) -> bool:
+def get_raw_jira_issue_fix_versions(jira_issue: dict[str, Any]) -> list[str]:
+    """
+    Get fix version names of a Jira issue JSON dictionary.
+
+    :param jira_issue: Jira issue as returned by Jira REST API.
+    :return: fix version names, empty if the field was not requested.
     """
-    Filter Jira issue by component name.
+    fix_versions = (jira_issue.get("fields") or {}).get("fixVersions") or []
+    return [version["name"] for version in fix_versions]
+
 
-    :param jira_issue: Jira issue.
-    :param component_name: Jira component name.
-    :return: True if issue references component with the same name,
-        False otherwise.
+def get_raw_jira_issue_component_name(jira_issue: dict[str, Any]) -> str:
     """
-    if len(jira_issue.fields.components) == 0:
-        raise ValueError(f"Issue [{jira_issue.key}] has no component assigned")
+    Get the name of the component Jira issue JSON dictionary
+    is assigned to.
 
-    jira_name = jira_issue.fields.components[0].name.strip().lower()
-    nova_name = component_name.strip().lower()
+    :param jira_issue: Jira issue as returned by Jira REST API.
+    :return: Jira component name.
+    """
+    components = (jira_issue.get("fields") or {}).get("components") or []
+    if len(components) == 0:
+        raise ValueError(
+            f"Issue [{jira_issue.get('key')}] has no component assigned"
+        )
 
-    return jira_name == nova_name
+    return components[0]["name"]
 
 
 def is_jira_released_version(version: Version) -> bool:
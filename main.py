@@ -3,28 +3,37 @@ Start module
 """
 
 import argparse
+from datetime import datetime
 from functools import partial
 from itertools import chain
 import sys
 import os
 from typing import Optional
 
+from jira import JIRAError
+
 from config import Config
 from core.nova_component import NovaComponent
+from core.nova_hotfix import NovaHotfix
 from core.nova_release import NovaRelease
-from core.nova_tag_list import NovaTagList
 from csv_utils import (
     export_tags_to_csv,
     map_tag_csv_row_to_dict,
     map_to_csv_rows,
     sort_tag_csv_rows_by_date,
 )
-from integration.git import GitIntegration
 from integration.jira import JiraIntegration
+from integration.registry import IntegrationRegistry
+from integration.snapshot import Snapshot
+import jira_utils as ju
 import mappers as m
 from notes_generator import NotesGenerator
+from nova_component_catalog import NovaComponentCatalog
+from nova_component_parser import NovaComponentParser
 from nova_release_repository import NovaReleaseRepository
 from release_manager import ReleaseManager
+from release_watcher import ReleaseWatcher
+from tag_discovery import TagDiscovery
 from ui.console import preview_component_release
 from zipper import Zipper
 
@@ -46,6 +55,58 @@ def choose_component_from_release(rel: NovaRelease) -> Optional[NovaComponent]:
     return cmp
 
 
+def get_since_date(
+    requested_since: Optional[str], jira: JiraIntegration, project_code: str
+) -> str:
+    """
+    Date to start listing tags from, the latest release date is
+    requested from Jira only if the date is not specified
+    """
+    return (
+        requested_since
+        or jira.get_latest_released_version(project_code).releaseDate
+    )
+
+
+def print_tag_discovery_failures(tag_discovery: TagDiscovery) -> None:
+    """Prints repositories tags could not be listed for"""
+    failures = tag_discovery.failures
+    if not failures:
+        return
+    print(f"Tags could not be listed for {len(failures)} repositories:")
+    for url, failure in sorted(failures.items()):
+        print(f"[{url}] {failure}")
+
+
+def load_release(  # pylint: disable=too-many-arguments
+    repository: NovaReleaseRepository,
+    project_code: str,
+    nova_version: str,
+    delivery_number: str,
+    *,
+    hotfix: Optional[str],
+    fields_profile: str = ju.RELEASE_PREVIEW_FIELDS_PROFILE,
+) -> NovaRelease:
+    """
+    Loads the delivery or, if hotfix is specified, the hotfix built
+    on the delivery
+
+    :param repository: release repository
+    :param project_code: project code
+    :param nova_version: NOVA version
+    :param delivery_number: delivery number
+    :param hotfix: hotfix number, optional
+    :param fields_profile: Jira issue fields profile
+    :return: release or hotfix model
+    """
+    base = repository.get(
+        project_code, nova_version, delivery_number, fields_profile
+    )
+    if not hotfix:
+        return base
+    return repository.get_hotfix(base, hotfix, fields_profile)
+
+
 if __name__ == "__main__":
     print("#" * 33)
     print("Nova Release Manager, version 1.3")
@@ -62,6 +123,7 @@ if __name__ == "__main__":
             "release",
             "generate-notes",
             "list-services",
+            "watch",
         ],
         default="release",
     )
@@ -72,7 +134,7 @@ if __name__ == "__main__":
         required=False,
         help="""
         NOVA version number. Default is 2.
-        Applicable only for 'release' and 'generate-notes' commands.
+        Applicable only for 'release', 'generate-notes' and 'watch' commands.
         """,
         default=2,
     )
@@ -83,10 +145,32 @@ if __name__ == "__main__":
         required=True,
         help="""
         NOVA delivery number.
-        Applicable only for 'release' and 'generate-notes' commands.
+        Applicable only for 'release', 'generate-notes' and 'watch' commands.
         """,
     )
 
+    parser.add_argument(
+        "--hotfix",
+        type=str,
+        required=False,
+        help="""
+        Hotfix number of the delivery, optional. Only the components
+        the hotfix changes are processed.
+        Applicable only for 'release', 'generate-notes' and 'watch' commands.
+        """,
+    )
+
+    parser.add_argument(
+        "--interval",
+        type=int,
+        required=False,
+        help="""
+        Time in seconds between Jira polls. Default is 60.
+        Applicable only for 'watch' command.
+        """,
+        default=60,
+    )
+
     parser.add_argument(
         "--since",
         type=str,
@@ -97,6 +181,18 @@ if __name__ == "__main__":
         """,
     )
 
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        required=False,
+        help="""
+        The number of repositories tags are listed for concurrently.
+        Default is 4.
+        Applicable only for 'list-packages' and 'list-services' commands.
+        """,
+        default=4,
+    )
+
     parser.add_argument(
         "--config-path",
         type=str,
@@ -107,180 +203,313 @@ if __name__ == "__main__":
         """,
     )
 
-    args = parser.parse_args()
-
-    config = Config(args.config_path)
-
-    ji = JiraIntegration(
-        config.data["jira"]["host"],
-        config.data["jira"]["username"],
-        config.data["jira"]["password"],
+    parser.add_argument(
+        "--record",
+        type=str,
+        required=False,
+        help="""
+        The path to a snapshot archive to record everything the command
+        reads from Jira and git remotes to, optional.
+        """,
     )
-    release_repository = NovaReleaseRepository(ji)
 
-    since = (
-        args.since
-        or ji.get_latest_released_version(
-            config.data["jira"]["project"]
-        ).releaseDate
+    parser.add_argument(
+        "--offline",
+        type=str,
+        required=False,
+        help="""
+        The path to a recorded snapshot archive, optional. The command
+        reads everything from the snapshot and does not contact Jira
+        and git remotes, components are not tagged and published.
+        """,
     )
 
-    if args.command == "release":
-        version = args.version
-        delivery = args.delivery
-        manager = ReleaseManager()
+    args = parser.parse_args()
+    if args.record and args.offline:
+        parser.error("--record and --offline can not be used together")
 
-        while True:
-            print("Getting release information..." + "\n")
-            release = release_repository.get(
-                config.data["jira"]["project"], version, delivery
-            )
-            print(release.describe_status())
+    config = Config(args.config_path)
 
-            component = choose_component_from_release(release)
-            if component is None:
-                break
-            preview_component_release(release, component)
-            release_component_decision = input(
-                "Do you want to release this component [Y/n/q]?"
-            )
-            if release_component_decision == "q":
-                break
-            if release_component_decision == "n":
-                continue
-            try:
-                component_release = manager.release_component(
-                    release, component
-                )
-            except Exception as e:
-                print(f"Error occurred: {e}")
-                continue
-            print(
-                f"[{component.name}] released, tag: [{component_release.tag_name}], url: [{component_release.url}]"
+    snapshot: Optional[Snapshot] = None
+    if args.offline:
+        snapshot = Snapshot(args.offline)
+        print(f"Offline, reading from snapshot [{args.offline}]" + "\n")
+    elif args.record:
+        snapshot = Snapshot(args.record, recording=True)
+    registry = IntegrationRegistry(config, snapshot)
+    jira_cache = registry.jira_cache
+    ji = registry.jira
+    gi = registry.git
+    component_parser = NovaComponentParser(
+        path=(
+            os.path.join(
+                config.data["jira"]["cache"]["path"], "components.json"
             )
+            if "cache" in config.data["jira"]
+            else ""
+        )
+    )
+    release_repository = NovaReleaseRepository(
+        ji, NovaComponentCatalog(ji, parser=component_parser)
+    )
 
-            if release.can_release_version():
-                release_version_decision = input(
-                    "Looks like all components are released."
-                    + "Do you want to release version [Y/n]?"
-                )
-                if release_version_decision == "Y":
-                    if release_repository.set_released(release):
-                        print(
-                            f"[{release.title}] has been successfully released"
+    try:
+        if args.command == "release":
+            version = args.version
+            delivery = args.delivery
+            manager = ReleaseManager(ji, rehearsal=registry.offline, gi=gi)
+
+            release: Optional[NovaRelease] = None
+            while True:
+                print("Getting release information..." + "\n")
+                # only issues changed since the previous iteration are loaded,
+                # task details are loaded for the chosen component only
+                try:
+                    release = (
+                        load_release(
+                            release_repository,
+                            config.data["jira"]["project"],
+                            version,
+                            delivery,
+                            hotfix=args.hotfix,
+                            fields_profile=ju.STATUS_ONLY_FIELDS_PROFILE,
+                        )
+                        if release is None
+                        else release_repository.refresh(
+                            release, ju.STATUS_ONLY_FIELDS_PROFILE
                         )
+                    )
+                except JIRAError as e:
+                    print(f"Error occurred: {e}")
+                    if input("Do you want to retry [Y/n]?") == "n":
                         break
-                    print(f"[{release.title}] has not been released")
+                    continue
+                print(release.describe_status())
 
-    if args.command == "list-services":
-        print(f"'Since' date to be used: {since}")
-        services = release_repository.get_services(
-            config.data["jira"]["project"]
-        )
-        gi = GitIntegration()
-        all_tags_info_services: list[dict[str, str]] = []
-
-        csv_rows = [
-            map_tag_csv_row_to_dict(row)
-            for row in chain.from_iterable(
-                list(
-                    sort_tag_csv_rows_by_date(map_to_csv_rows(nova_tag_list))
-                    for nova_tag_list in (
-                        NovaTagList.from_component(service, since, gi)
-                        for service in services
+                component = choose_component_from_release(release)
+                if component is None:
+                    break
+                try:
+                    release_repository.load_task_details(release, component)
+                except JIRAError as e:
+                    print(f"Error occurred: {e}")
+                    continue
+                preview_component_release(release, component)
+                release_component_decision = input(
+                    "Do you want to release this component [Y/n/q]?"
+                )
+                if release_component_decision == "q":
+                    break
+                if release_component_decision == "n":
+                    continue
+                try:
+                    component_release = manager.release_component(
+                        release, component
                     )
+                except Exception as e:
+                    print(f"Error occurred: {e}")
+                    continue
+                print(
+                    f"[{component.name}] released, "
+                    + f"tag: [{component_release.tag_name}], "
+                    + f"url: [{component_release.url}]"
                 )
-            )
-        ]
-        output_path = config.get_artifacts_folder_path(
-            args.version, args.delivery, ""
-        )
-        csv_file_path = export_tags_to_csv(
-            csv_rows, output_path, "services-output.csv"
-        )
-        print(f"CSV file has been created: {csv_file_path}")
 
-    if args.command == "list-packages":
-        print(f"'Since' date to be used: {since}")
-        packages = release_repository.get_packages(
-            config.data["jira"]["project"]
-        )
-        gi = GitIntegration()
-        all_tags_info: list[dict[str, str]] = []
-        counter = 0
-        for package in packages:
-            counter += 1
-            package_tags = NovaTagList.from_component(package, since, gi)
-
-            # if exception is specified for package, filter out tags which
-            # do not match the exception
-            tag_exception = config.get_package_tag_exception(package.name)
-            if tag_exception:
-                package_tags = package_tags.filter(tag_exception.tag_template)
-
-            # skip packages with no tags
-            if len(package_tags) == 0:
-                continue
-
-            package_tags_info = list(
-                map(
-                    lambda tag, pkg=package: m.map_to_tag_info(pkg, tag),  # type: ignore
-                    package_tags,
-                )
-            )
+                if release.can_release_version():
+                    release_version_decision = input(
+                        "Looks like all components are released."
+                        + "Do you want to release version [Y/n]?"
+                    )
+                    if release_version_decision == "Y":
+                        if release_repository.set_released(release):
+                            print(
+                                f"[{release.title}] has been "
+                                + "successfully released"
+                            )
+                            break
+                        print(f"[{release.title}] has not been released")
 
-            package_tags_info_sorted = sorted(
-                package_tags_info,
-                key=lambda tag_info: tag_info["date"],
-                reverse=True,
+        if args.command == "watch":
+            release = load_release(
+                release_repository,
+                config.data["jira"]["project"],
+                args.version,
+                args.delivery,
+                hotfix=args.hotfix,
+                fields_profile=ju.STATUS_ONLY_FIELDS_PROFILE,
             )
-            all_tags_info.extend(package_tags_info_sorted)
-
-            percents_done = round(counter / len(packages) * 100)
+            print(release.describe_status() + "\n")
             print(
-                f"{package.name:<50} processed, {len(package_tags):<3} tags discovered {'with exceptions' if tag_exception else ''}, ({percents_done:<3}% done)"
+                f"Watching component statuses every {args.interval} seconds, "
+                + "press Ctrl+C to stop"
+            )
+            try:
+                for change in ReleaseWatcher(release_repository, release).watch(
+                    args.interval
+                ):
+                    print(f"{datetime.now():%H:%M:%S} {change}")
+            except KeyboardInterrupt:
+                print(release.describe_status())
+
+        if args.command == "list-services":
+            since = get_since_date(
+                args.since, ji, config.data["jira"]["project"]
+            )
+            print(f"'Since' date to be used: {since}")
+            services = release_repository.get_services(
+                config.data["jira"]["project"]
             )
+            all_tags_info_services: list[dict[str, str]] = []
+            discovery = TagDiscovery(gi, since)
 
-        if all_tags_info:
+            csv_rows = [
+                map_tag_csv_row_to_dict(row)
+                for row in chain.from_iterable(
+                    list(
+                        sort_tag_csv_rows_by_date(
+                            map_to_csv_rows(nova_tag_list)
+                        )
+                        for nova_tag_list in discovery.discover(
+                            services, args.jobs
+                        )
+                    )
+                )
+            ]
             output_path = config.get_artifacts_folder_path(
                 args.version, args.delivery, ""
             )
             csv_file_path = export_tags_to_csv(
-                all_tags_info, output_path, "packages-output.csv"
+                csv_rows, output_path, "services-output.csv"
             )
             print(f"CSV file has been created: {csv_file_path}")
-        else:
-            print("No tags found")
-
-    if args.command == "generate-notes":
-        version = args.version
-        delivery = args.delivery
-        manager = ReleaseManager()
-        release = release_repository.get(
-            config.data["jira"]["project"], version, delivery
-        )
-        print(release.describe_status())
-        notes_generator = NotesGenerator(release, GitIntegration())
-        if not notes_generator.can_generate():
-            print(
-                "Release is not ready to generate notes. Please, check the status of the release."
+            print_tag_discovery_failures(discovery)
+
+        if args.command == "list-packages":
+            since = get_since_date(
+                args.since, ji, config.data["jira"]["project"]
             )
-            sys.exit()
-        notes = notes_generator.generate()
-        succeeded_notes = m.only_succeeded_notes(notes)
-        zipper = Zipper(version, delivery, config=config)
-        zip_path = zipper.zip_notes(succeeded_notes)
-        # remove original files
-        for _, result in notes.items():
-            if result.path:
-                os.remove(result.path)
-        print(f"Release notes zipped: {zip_path}")
-        err_components = [
-            (c_name, result.error)
-            for c_name, result in notes.items()
-            if result.error
-        ]
-        for c_name, error in err_components:
-            print(
-                f"Error occurred while generating notes for component [{c_name}]: {error}"
+            print(f"'Since' date to be used: {since}")
+            packages = release_repository.get_packages(
+                config.data["jira"]["project"]
             )
+            all_tags_info: list[dict[str, str]] = []
+            counter = 0
+            # packages sharing a repository list its tags once
+            discovery = TagDiscovery(gi, since)
+            for package, package_tags in zip(
+                packages, discovery.discover(packages, args.jobs)
+            ):
+                counter += 1
+
+                # if exception is specified for package, filter out tags which
+                # do not match the exception
+                tag_exception = config.get_package_tag_exception(package.name)
+                if tag_exception:
+                    package_tags = package_tags.filter(
+                        tag_exception.tag_template
+                    )
+
+                # skip packages with no tags
+                if len(package_tags) == 0:
+                    continue
+
+                package_tags_info = list(
+                    map(
+                        lambda tag, pkg=package: m.map_to_tag_info(pkg, tag),  # type: ignore
+                        package_tags,
+                    )
+                )
+
+                package_tags_info_sorted = sorted(
+                    package_tags_info,
+                    key=lambda tag_info: tag_info["date"],
+                    reverse=True,
+                )
+                all_tags_info.extend(package_tags_info_sorted)
+
+                percents_done = round(counter / len(packages) * 100)
+                print(
+                    f"{package.name:<50} processed, "
+                    + f"{len(package_tags):<3} tags discovered "
+                    + f"{'with exceptions' if tag_exception else ''}, "
+                    + f"({percents_done:<3}% done)"
+                )
+
+            if all_tags_info:
+                output_path = config.get_artifacts_folder_path(
+                    args.version, args.delivery, ""
+                )
+                csv_file_path = export_tags_to_csv(
+                    all_tags_info, output_path, "packages-output.csv"
+                )
+                print(f"CSV file has been created: {csv_file_path}")
+            else:
+                print("No tags found")
+            print_tag_discovery_failures(discovery)
+
+        if args.command == "generate-notes":
+            version = args.version
+            delivery = args.delivery
+            manager = ReleaseManager(ji, rehearsal=registry.offline, gi=gi)
+            # release notes are taken from CHANGELOG.md, tasks details
+            # are not required
+            release = load_release(
+                release_repository,
+                config.data["jira"]["project"],
+                version,
+                delivery,
+                hotfix=args.hotfix,
+                fields_profile=ju.STATUS_ONLY_FIELDS_PROFILE,
+            )
+            print(release.describe_status())
+            notes_generator = NotesGenerator(release, gi)
+            if not notes_generator.can_generate():
+                print(
+                    "Release is not ready to generate notes. "
+                    + "Please, check the status of the release."
+                )
+                sys.exit()
+            notes = notes_generator.generate()
+            succeeded_notes = m.only_succeeded_notes(notes)
+            zipper = Zipper(version, delivery, args.hotfix, config=config)
+            reused_notes: dict[str, str] = {}
+            if isinstance(release, NovaHotfix):
+                # notes of the components the hotfix does not change are
+                # taken from the base delivery
+                reused_notes = zipper.extract_notes(
+                    Zipper(version, delivery, config=config).notes_file_path,
+                    [c.name for c in release.get_unchanged_components()],
+                    [c.name for c in chain(release, release.base or [])],
+                )
+                print(
+                    f"Release notes reused from [{release.base}]: "
+                    + f"{len(reused_notes)} component(s)"
+                )
+            zip_path = zipper.zip_notes({**reused_notes, **succeeded_notes})
+            # remove original files
+            for _, result in notes.items():
+                if result.path:
+                    os.remove(result.path)
+            for path in reused_notes.values():
+                os.remove(path)
+            print(f"Release notes zipped: {zip_path}")
+            err_components = [
+                (c_name, result.error)
+                for c_name, result in notes.items()
+                if result.error
+            ]
+            for c_name, error in err_components:
+                print(
+                    "Error occurred while generating notes "
+                    + f"for component [{c_name}]: {error}"
+                )
+    finally:
+        component_parser.save()
+        if jira_cache is not None:
+            print(f"Jira cache: {jira_cache.stats}")
+        # the report is most useful when a command fails
+        if len(ji.call_report) > 0:
+            print(f"Jira calls retried, hedged or failed:\n{ji.call_report}")
+    if snapshot is not None and snapshot.recording:
+        snapshot.save()
+        print(f"Snapshot recorded: [{snapshot.path}], {len(snapshot)} entries")
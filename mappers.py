@@ -2,16 +2,16 @@
 Data mapping and filtering functions
 """
 
-from git import TagReference
 from core.nova_component import NovaComponent
 from core.nova_component_type import NovaComponentType
 
 from git_utils import get_git_tag_url
+from integration.git import GitTag
 from notes_generator import NotesGenerator
 
 
 def map_to_tag_info(
-    package: NovaComponent, tag: TagReference
+    package: NovaComponent, tag: GitTag
 ) -> dict[str, str]:
     """
     Map package and tag to tag info
@@ -26,14 +26,14 @@ def map_to_tag_info(
     return {
         "component": package.name,
         "tag": tag.name,
-        "date": tag.commit.committed_datetime.strftime("%Y-%m-%d"),
+        "date": tag.committed_datetime.strftime("%Y-%m-%d"),
         "url": get_git_tag_url(
             package.repo.git_cloud, package.repo.sanitized_url, tag.name
         ),
     }
 
 
-def is_service_tag(service: NovaComponent, tag: TagReference) -> bool:
+def is_service_tag(service: NovaComponent, tag: GitTag) -> bool:
     """
     Detects if tag is service tag.
     """
@@ -49,7 +49,7 @@ def is_service_tag(service: NovaComponent, tag: TagReference) -> bool:
     return False
 
 
-def is_package_tag(package: NovaComponent, tag: TagReference) -> bool:
+def is_package_tag(package: NovaComponent, tag: GitTag) -> bool:
     """
     Detects if tag is package tag.
     Taking into account that git repositories can host not only nuget packages
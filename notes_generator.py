@@ -9,6 +9,7 @@ from typing import Optional
 import fs_utils as fs
 from config import Config
 from core.nova_component import NovaComponent
+from core.nova_hotfix import NovaHotfix
 from core.nova_release import NovaRelease
 from core.nova_status import Status
 from integration.git import GitIntegration
@@ -85,7 +86,9 @@ class NotesGenerator:
         self._gi = gi
 
         self._output_path = config.get_artifacts_folder_path(
-            self._release.version, self._release.delivery, ""
+            self._release.version,
+            self._release.delivery,
+            release.hotfix if isinstance(release, NovaHotfix) else "",
         )
 
     def _ensure_output_folder_exists(self) -> None:
@@ -0,0 +1,154 @@
+"""
+Component catalog module
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+from core.cvs import GitCloudService
+from core.nova_component import NovaComponent, NovaEmptyComponent
+from core.nova_component_index import normalize_component_name
+from core.nova_component_type import NovaComponentType
+from integration.jira import JiraIntegration
+from nova_component_parser import NovaComponentParser
+
+
+@dataclass
+class _CatalogEntry:
+    """
+    Parsed components of a single project
+    """
+
+    loaded_at: float
+    components: list[NovaComponent]
+    by_name: dict[str, NovaComponent] = field(default_factory=dict)
+    by_type: dict[NovaComponentType, list[NovaComponent]] = field(
+        default_factory=dict
+    )
+    by_git_cloud: dict[GitCloudService, list[NovaComponent]] = field(
+        default_factory=dict
+    )
+
+    def __post_init__(self):
+        for component in self.components:
+            self.by_name[normalize_component_name(component.name)] = component
+            self.by_type.setdefault(component.ctype, []).append(component)
+            if component.repo is not None:
+                self.by_git_cloud.setdefault(
+                    component.repo.git_cloud, []
+                ).append(component)
+
+
+class NovaComponentCatalog:
+    """
+    Loads the components of a project from Jira and parses them once,
+    then serves them from memory until the TTL expires.
+    Components are registered in Jira rarely, while parsing them means
+    validating repository URLs and building repository objects.
+    Reloaded components which are not changed are not parsed again.
+    Every component returned is a copy of the catalog one without tasks,
+    so callers are free to add tasks to it.
+    """
+
+    DEFAULT_TTL_SEC = 300
+
+    def __init__(
+        self,
+        jira: JiraIntegration,
+        ttl_sec: float = DEFAULT_TTL_SEC,
+        clock: Callable[[], float] = time.monotonic,
+        parser: Optional[NovaComponentParser] = None,
+    ) -> None:
+        self._ji = jira
+        self._parser = parser if parser is not None else NovaComponentParser()
+        self._ttl_sec = ttl_sec
+        self._clock = clock
+        self._entries: dict[str, _CatalogEntry] = {}
+
+    def _get_entry(self, project_code: str) -> _CatalogEntry:
+        """
+        Returns parsed components of the project loading them
+        from Jira if they are not loaded yet or the TTL is expired.
+
+        :param project_code: project code
+        :return: catalog entry
+        """
+        entry = self._entries.get(project_code)
+        now = self._clock()
+        if entry is None or now - entry.loaded_at >= self._ttl_sec:
+            entry = _CatalogEntry(
+                now,
+                [
+                    self._parser.parse(cmp)
+                    for cmp in self._ji.get_components(project_code)
+                ],
+            )
+            self._entries[project_code] = entry
+        return entry
+
+    def invalidate(self, project_code: str = "") -> None:
+        """
+        Forces the components to be loaded from Jira on the next request
+
+        :param project_code: project code, all projects if not specified
+        """
+        if project_code:
+            self._entries.pop(project_code, None)
+        else:
+            self._entries.clear()
+
+    def components(self, project_code: str) -> list[NovaComponent]:
+        """
+        Returns all components of the project, including empty ones
+
+        :param project_code: project code
+        :return: list of components
+        """
+        return [c.copy() for c in self._get_entry(project_code).components]
+
+    def get(self, project_code: str, name: str) -> Optional[NovaComponent]:
+        """
+        Returns component by name, comparison is case insensitive
+
+        :param project_code: project code
+        :param name: component name
+        :return: component or None if not found
+        """
+        component = self._get_entry(project_code).by_name.get(
+            normalize_component_name(name)
+        )
+        return component.copy() if component is not None else None
+
+    def by_type(
+        self, project_code: str, *ctypes: NovaComponentType
+    ) -> list[NovaComponent]:
+        """
+        Returns non-empty components of the specified types
+
+        :param project_code: project code
+        :param ctypes: component types
+        :return: list of components in Jira order
+        """
+        entry = self._get_entry(project_code)
+        selected = {
+            id(c) for ctype in ctypes for c in entry.by_type.get(ctype, [])
+        }
+        return [
+            c.copy()
+            for c in entry.components
+            if id(c) in selected and not isinstance(c, NovaEmptyComponent)
+        ]
+
+    def by_git_cloud(
+        self, project_code: str, git_cloud: GitCloudService
+    ) -> list[NovaComponent]:
+        """
+        Returns components hosted in the specified git cloud
+
+        :param project_code: project code
+        :param git_cloud: git cloud service
+        :return: list of components
+        """
+        entry = self._get_entry(project_code)
+        return [c.copy() for c in entry.by_git_cloud.get(git_cloud, [])]
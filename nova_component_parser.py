@@ -0,0 +1,149 @@
+"""
+Memoized component parser module
+"""
+
+import json
+import os
+import tempfile
+from collections import OrderedDict
+from typing import Optional
+
+from core.cvs import GitCloudService
+from core.nova_component import NovaComponent
+import jira_utils as ju
+
+ComponentKey = tuple[Optional[str], Optional[str]]
+
+
+class NovaComponentParser:
+    """
+    Parses Jira components into Nova components remembering the result.
+    Parsing a component means validating the repository URL of its
+    description and building the repository object with credentials,
+    while components are changed in Jira rarely. Parsed components are
+    kept as templates keyed by (name, description), every caller gets
+    a copy of the template with its own task list.
+    Both templates and URL classifications are evicted in LRU order once
+    the limit is reached. Classifications can be persisted to a file to
+    be reused by the next run, repository credentials are never stored.
+    """
+
+    DEFAULT_MAX_SIZE = 1024
+
+    def __init__(
+        self, max_size: int = DEFAULT_MAX_SIZE, path: str = "", config=None
+    ) -> None:
+        """
+        :param max_size: maximum number of components to remember
+        :param path: path to the file to persist classifications to,
+            classifications are not persisted if not specified
+        :param config: application configuration, required to build
+            repository objects
+        """
+        if max_size < 1:
+            raise ValueError(f"Invalid max size [{max_size}]")
+
+        self._max_size = max_size
+        self._path = path
+        self._config = config
+        self._templates: OrderedDict[ComponentKey, NovaComponent] = (
+            OrderedDict()
+        )
+        self._classified: OrderedDict[str, tuple[GitCloudService, str]] = (
+            OrderedDict()
+        )
+        self._load()
+
+    def __len__(self):
+        return len(self._templates)
+
+    def parse(self, cmp: object) -> NovaComponent:
+        """
+        Parses Jira component into Nova component.
+
+        :param cmp: Jira component
+        :return: Nova component without tasks
+        """
+        key = (getattr(cmp, "name", None), getattr(cmp, "description", None))
+        template = self._templates.get(key)
+        if template is None:
+            # invalid components raise and are not remembered
+            template = ju.parse_jira_component(
+                cmp, self._config, self._classify
+            )
+            self._templates[key] = template
+            self._evict(self._templates)
+        else:
+            self._templates.move_to_end(key)
+        return template.copy()
+
+    def _classify(self, description: str) -> ju.JiraComponentGitUrl:
+        """
+        Returns cloud service and repository URL of the component
+        description, validates the URL only once for every description.
+
+        :param description: Jira component description
+        :return: cloud service and repository URL
+        """
+        classification = self._classified.get(description)
+        if classification is not None:
+            self._classified.move_to_end(description)
+            return classification
+
+        cloud_service, repo_url = ju.parse_jira_cmp_descr(description)
+        if cloud_service is not None and repo_url is not None:
+            self._classified[description] = (cloud_service, repo_url)
+            self._evict(self._classified)
+        return cloud_service, repo_url
+
+    def _evict(self, entries: OrderedDict) -> None:
+        """Removes least recently used entries above the limit"""
+        while len(entries) > self._max_size:
+            entries.popitem(last=False)
+
+    def _load(self) -> None:
+        """
+        Loads persisted classifications, a missing or damaged file
+        is treated as empty.
+        """
+        if not self._path or not os.path.exists(self._path):
+            return
+        try:
+            with open(self._path, "r", encoding="utf-8") as file:
+                entries = json.load(file)
+            for description, cloud_service, repo_url in entries:
+                self._classified[description] = (
+                    GitCloudService(cloud_service),
+                    repo_url,
+                )
+        except (OSError, TypeError, ValueError):
+            self._classified.clear()
+            return
+        self._evict(self._classified)
+
+    def save(self) -> None:
+        """
+        Persists URL classifications, does nothing if the path
+        is not specified.
+        """
+        if not self._path:
+            return
+
+        directory = os.path.dirname(os.path.abspath(self._path))
+        os.makedirs(directory, exist_ok=True)
+        entries = [
+            [description, cloud_service.value, repo_url]
+            for description, (cloud_service, repo_url) in (
+                self._classified.items()
+            )
+        ]
+        # write to a temporary file first, so the file is never
+        # left half-written
+        handle, tmp_path = tempfile.mkstemp(dir=directory)
+        try:
+            with os.fdopen(handle, "w", encoding="utf-8") as file:
+                json.dump(entries, file)
+            os.replace(tmp_path, self._path)
+        except OSError:
+            os.remove(tmp_path)
+            raise
@@ -2,13 +2,20 @@
 Release repository module
 """
 
-from functools import partial
-from jira import Issue
+import logging
+import math
+import time
+from dataclasses import replace
+from typing import Optional
 from core.nova_component import NovaComponent, NovaEmptyComponent
+from core.nova_component_index import ComponentIndex
 from core.nova_component_type import NovaComponentType
+from core.nova_hotfix import NovaHotfix
 from core.nova_release import NovaRelease
+from core.nova_task import NovaTask
 import jira_utils as ju
 from integration.jira import JiraIntegration
+from nova_component_catalog import NovaComponentCatalog
 
 
 class NovaReleaseRepository:
@@ -16,8 +23,25 @@ class NovaReleaseRepository:
     Loads a release domain object from Jira
     """
 
-    def __init__(self, jira: JiraIntegration) -> None:
+    # Jira evaluates relative dates with minute precision, the overlap
+    # guarantees no change is lost between two refreshes
+    delta_overlap_min = 1
+
+    def __init__(
+        self,
+        jira: JiraIntegration,
+        catalog: Optional[NovaComponentCatalog] = None,
+    ) -> None:
         self._ji = jira
+        self._catalog = catalog or NovaComponentCatalog(jira)
+        # release title -> (monotonic time of the last sync, components)
+        self._sync_state: dict[
+            str, tuple[float, ComponentIndex[NovaComponent]]
+        ] = {}
+        # release title -> names of components with task details loaded
+        self._detailed: dict[str, set[str]] = {}
+        # hotfix title -> names of tasks released with the base delivery
+        self._base_tasks: dict[str, set[str]] = {}
 
     def get_packages(self, project_code: str) -> list[NovaComponent]:
         """
@@ -26,16 +50,11 @@ class NovaReleaseRepository:
         :param project_code: project code
         :return: list of packages
         """
-        packages = [
-            pkg
-            for cmp in self._ji.get_components(project_code)
-            if (pkg := ju.parse_jira_component(cmp))
-            and pkg.ctype
-            in (NovaComponentType.PACKAGE, NovaComponentType.PACKAGE_LIBRARY)
-            and not isinstance(pkg, NovaEmptyComponent)
-        ]
-
-        return packages
+        return self._catalog.by_type(
+            project_code,
+            NovaComponentType.PACKAGE,
+            NovaComponentType.PACKAGE_LIBRARY,
+        )
 
     def get_services(self, project_code: str) -> list[NovaComponent]:
         """
@@ -44,18 +63,14 @@ class NovaReleaseRepository:
         :param project_code: project code
         :return: list of services
         """
-        services = [
-            svc
-            for cmp in self._ji.get_components(project_code)
-            if (svc := ju.parse_jira_component(cmp))
-            and svc.ctype == NovaComponentType.SERVICE
-            and not isinstance(svc, NovaEmptyComponent)
-        ]
-
-        return services
+        return self._catalog.by_type(project_code, NovaComponentType.SERVICE)
 
     def get(
-        self, project_code: str, version: str, delivery: str
+        self,
+        project_code: str,
+        version: str,
+        delivery: str,
+        fields_profile: str = ju.RELEASE_PREVIEW_FIELDS_PROFILE,
     ) -> NovaRelease:
         """
         Loads a release model by project code, version and delivery
@@ -63,39 +78,324 @@ class NovaReleaseRepository:
         :param project_code: project code
         :param version: version to release
         :param delivery: delivery number
+        :param fields_profile: Jira issue fields profile, use
+            `jira_utils.STATUS_ONLY_FIELDS_PROFILE` when tasks summary
+            and deployment notes are not required
         :return: release model
         """
-        release = NovaRelease(project_code, version, delivery)
+        return self.get_many(
+            project_code, [(version, delivery)], fields_profile
+        )[0]
 
-        components = [
-            ju.parse_jira_component(cmp)
-            for cmp in self._ji.get_components(project_code)
-        ]
+    def get_many(
+        self,
+        project_code: str,
+        deliveries: list[tuple[str, str]],
+        fields_profile: str = ju.RELEASE_PREVIEW_FIELDS_PROFILE,
+    ) -> list[NovaRelease]:
+        """
+        Loads release models of several deliveries with a single Jira
+        search, issues are assigned to releases by their fix versions.
+        Components are taken from the shared catalog, so loading several
+        deliveries costs about as much as loading one.
 
-        release_jira_issues = self._ji.get_issues(project_code, str(release))
+        :param project_code: project code
+        :param deliveries: list of (version, delivery) pairs
+        :param fields_profile: Jira issue fields profile
+        :return: release models in the order of the deliveries
+        """
+        if not deliveries:
+            raise ValueError("Deliveries are not specified")
 
-        for component in components:
-            if isinstance(component, NovaEmptyComponent):
-                continue
+        # release title is the name of its Jira fix version
+        releases: dict[str, NovaRelease] = {}
+        titles: list[str] = []
+        for version, delivery in deliveries:
+            release = NovaRelease(project_code, version, delivery)
+            releases.setdefault(release.title, release)
+            titles.append(release.title)
+        self._load(project_code, releases, fields_profile)
+
+        return [releases[title] for title in titles]
+
+    def get_hotfix(
+        self,
+        base: NovaRelease,
+        hotfix: str,
+        fields_profile: str = ju.RELEASE_PREVIEW_FIELDS_PROFILE,
+    ) -> NovaHotfix:
+        """
+        Loads a hotfix of a delivery loaded by this repository before.
+        Only the hotfix fix version is requested, the hotfix consists of
+        the components which have tasks not released with the base
+        delivery, the rest of the components are left to the base delivery.
+
+        :param base: base delivery model previously loaded by `get`
+        :param hotfix: hotfix number
+        :param fields_profile: Jira issue fields profile
+        :return: hotfix model
+        """
+        if base.title not in self._sync_state:
+            raise ValueError(f"[{base.title}] was not loaded before")
+
+        result = NovaHotfix(
+            base.project, base.version, base.delivery, hotfix, base
+        )
+        # membership is kept by refresh, a component joins the hotfix
+        # once it gets a task not released with the base delivery
+        self._base_tasks[result.title] = {
+            task.name for c in base for task in c.tasks
+        }
+        self._load(base.project, {result.title: result}, fields_profile)
+
+        for component in list(result):
+            if not self._belongs_to(result, component):
+                result.remove_component(component)
+        return result
 
-            filter_func = partial(
-                ju.filter_jira_issue, component_name=component.name
+    def _load(
+        self,
+        project_code: str,
+        releases: dict[str, NovaRelease],
+        fields_profile: str,
+    ) -> None:
+        """
+        Fills release models with their components and tasks using
+        a single Jira search
+
+        :param project_code: project code
+        :param releases: release title -> empty release model
+        :param fields_profile: Jira issue fields profile
+        """
+        sync_started = time.monotonic()
+        components: dict[str, list[NovaComponent]] = {
+            title: self._catalog.components(project_code) for title in releases
+        }
+        components_indexes = {
+            title: ComponentIndex(lambda c: c.name, release_components)
+            for title, release_components in components.items()
+        }
+
+        # issues are parsed while the next pages are being downloaded
+        for jira_issue in self._ji.iter_raw_issues(
+            project_code, list(releases), fields_profile=fields_profile
+        ):
+            component_name = ju.get_raw_jira_issue_component_name(jira_issue)
+            issue_components = [
+                c
+                for title in ju.get_raw_jira_issue_fix_versions(jira_issue)
+                if title in components_indexes
+                for c in components_indexes[title].get(component_name)
+                if not isinstance(c, NovaEmptyComponent)
+            ]
+            # issues of unknown and empty components are not parsed
+            if issue_components:
+                task = ju.parse_jira_issue_raw(jira_issue)
+                for component in issue_components:
+                    component.add_task(task)
+
+        status_only = fields_profile == ju.STATUS_ONLY_FIELDS_PROFILE
+        for title, release in releases.items():
+            for component in components[title]:
+                if len(component.tasks) > 0:
+                    release.add_component(component)
+            self._sync_state[title] = (sync_started, components_indexes[title])
+            self._detailed[title] = (
+                set() if status_only else {c.name for c in release}
             )
-            component_jira_issues: list[Issue] = list(
-                filter(
-                    filter_func,
-                    release_jira_issues,
+
+    def refresh(
+        self,
+        release: NovaRelease,
+        fields_profile: str = ju.RELEASE_PREVIEW_FIELDS_PROFILE,
+    ) -> NovaRelease:
+        """
+        Brings a release model loaded by this repository up to date.
+        Only issues updated since the previous sync are requested and
+        merged into their components, components which got their first
+        task are added to the release and components which lost all their
+        tasks are removed from it. Tasks moved to unknown or empty components
+        or left without a component are removed from the release. Changed
+        issues which cannot be parsed, for example the ones in a status
+        unknown to the release workflow, are logged and skipped. Issues
+        removed from the delivery are not detected, use `get` to reload
+        the release from scratch.
+        With `jira_utils.STATUS_ONLY_FIELDS_PROFILE` only task statuses
+        are updated, summaries and deployment notes loaded before are kept.
+
+        :param release: release model previously loaded by `get`
+        :param fields_profile: Jira issue fields profile
+        :return: the same release model
+        """
+        if release.title not in self._sync_state:
+            raise ValueError(f"[{release.title}] was not loaded before")
+
+        synced_at, components = self._sync_state[release.title]
+        sync_started = time.monotonic()
+        window_min = (
+            math.ceil((sync_started - synced_at) / 60)
+            + NovaReleaseRepository.delta_overlap_min
+        )
+
+        changed_jira_issues = self._ji.get_raw_issues(
+            release.project,
+            str(release),
+            fields_profile=fields_profile,
+            updated_within_min=window_min,
+        )
+        for issue in changed_jira_issues:
+            try:
+                issue_components = components.get(
+                    ju.get_raw_jira_issue_component_name(issue)
                 )
-            )
-            component_tasks = [
-                ju.parse_jira_issue(issue) for issue in component_jira_issues
-            ]
-            if len(component_tasks) > 0:
-                component.add_tasks(component_tasks)
-                release.add_component(component)
+            except ValueError:
+                # the component of the issue was cleared
+                issue_components = []
+            if not issue_components or isinstance(
+                issue_components[0], NovaEmptyComponent
+            ):
+                self._remove_task(release, issue["key"])
+                continue
+            try:
+                task = ju.parse_jira_issue_raw(issue)
+            except ValueError as error:
+                # an issue moved to a status outside of the release
+                # workflow keeps its previous state until it comes back
+                logging.warning(
+                    "Could not refresh issue of release %s due to error: %s",
+                    release,
+                    error,
+                )
+                continue
+            if not self._merge_task(
+                release,
+                issue_components[0],
+                task,
+                fields_profile == ju.STATUS_ONLY_FIELDS_PROFILE,
+            ):
+                self._detailed[release.title].discard(issue_components[0].name)
 
+        self._sync_state[release.title] = (sync_started, components)
         return release
 
+    def _merge_task(
+        self,
+        release: NovaRelease,
+        component: NovaComponent,
+        task: NovaTask,
+        status_only: bool = False,
+    ) -> bool:
+        """
+        Moves the task into the component of the release model
+
+        :param release: release model
+        :param component: component the task belongs to now
+        :param task: updated task
+        :param status_only: the task has only status loaded, other task
+            details are taken from the existing task
+        :return: False if the task is new and has only status loaded
+        """
+        components = self._get_components(release)
+        existing = next(
+            (t for c in components for t in c.tasks if t.name == task.name),
+            None,
+        )
+        if status_only and existing is not None:
+            task = replace(existing, status=task.status)
+
+        # the task might have been moved to another component
+        self._remove_task(release, task.name, component)
+        component.upsert_task(task)
+        if component not in release and self._belongs_to(release, component):
+            release.add_component(component)
+        return existing is not None or not status_only
+
+    def _remove_task(
+        self,
+        release: NovaRelease,
+        task_name: str,
+        keep_in: Optional[NovaComponent] = None,
+    ) -> None:
+        """
+        Removes the task from components of the release model, components
+        left without changes are removed from the release
+
+        :param release: release model
+        :param task_name: task name
+        :param keep_in: component the task is kept in
+        """
+        for component in self._get_components(release):
+            if component is keep_in or not component.remove_task(task_name):
+                continue
+            if component in release and not self._belongs_to(
+                release, component
+            ):
+                release.remove_component(component)
+
+    def _get_components(self, release: NovaRelease) -> list[NovaComponent]:
+        """
+        Get all components the release model was loaded with, including
+        the ones which are not part of the release
+        """
+        _, index = self._sync_state[release.title]
+        return [c for name in index for c in index.get(name)]
+
+    def _belongs_to(
+        self, release: NovaRelease, component: NovaComponent
+    ) -> bool:
+        """
+        Check whether the component belongs to the release model.
+        A component belongs to a delivery when it has tasks and to
+        a hotfix when it has tasks not released with the base delivery.
+        """
+        base_tasks = self._base_tasks.get(release.title, set())
+        return any(task.name not in base_tasks for task in component.tasks)
+
+    def load_task_details(
+        self,
+        release: NovaRelease,
+        component: NovaComponent,
+        fields_profile: str = ju.RELEASE_PREVIEW_FIELDS_PROFILE,
+    ) -> NovaComponent:
+        """
+        Loads task summaries and deployment notes of a release component,
+        when the release was loaded with
+        `jira_utils.STATUS_ONLY_FIELDS_PROFILE`. Details are requested
+        only for the component and only once, until a status-only refresh
+        brings a new task into the component. Issues which cannot be
+        parsed are logged and skipped.
+
+        :param release: release model previously loaded by `get`
+        :param component: release component
+        :param fields_profile: Jira issue fields profile with task details
+        :return: the same component
+        """
+        if release.title not in self._sync_state:
+            raise ValueError(f"[{release.title}] was not loaded before")
+
+        detailed = self._detailed[release.title]
+        if component.name in detailed:
+            return component
+
+        for issue in self._ji.get_raw_issues(
+            release.project,
+            release.title,
+            component.name,
+            fields_profile=fields_profile,
+        ):
+            try:
+                component.upsert_task(ju.parse_jira_issue_raw(issue))
+            except ValueError as error:
+                # the task keeps its status loaded before, as on refresh
+                logging.warning(
+                    "Could not load details of issue of release %s "
+                    "due to error: %s",
+                    release,
+                    error,
+                )
+        detailed.add(component.name)
+        return component
+
     def set_released(self, rel: NovaRelease) -> bool:
         """
         Update JIRA's release status to RELEASED
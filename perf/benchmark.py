@@ -0,0 +1,110 @@
+"""
+Jira paths benchmark module.
+
+Measures loading releases through `JiraIntegration` and
+`NovaReleaseRepository` against the local Jira stand-in server.
+
+Usage: python -m perf.benchmark --issues 5000 --latency-ms 80 --jitter-ms 40
+"""
+
+import argparse
+import time
+from typing import Any, Callable
+
+from integration.jira import JiraIntegration
+from nova_component_catalog import NovaComponentCatalog
+from nova_component_parser import NovaComponentParser
+from nova_release_repository import NovaReleaseRepository
+from perf.jira_stand_in import JiraDataset, JiraStandIn, JiraStandInServer
+
+
+class BenchmarkConfig:  # pylint: disable=too-few-public-methods
+    """
+    Application configuration with empty repository credentials
+    """
+
+    data: dict[str, Any] = {
+        "github": {"username": "", "accessToken": ""},
+        "bitbucket": {"username": "", "password": ""},
+    }
+
+
+def measure(name: str, action: Callable[[], Any], repeat: int) -> None:
+    """
+    Runs the action several times and prints the best and mean time
+
+    :param name: action name
+    :param action: action to measure
+    :param repeat: number of runs
+    """
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        action()
+        timings.append(time.perf_counter() - started)
+    print(
+        f"{name:<40} best {min(timings):8.3f}s, "
+        f"mean {sum(timings) / len(timings):8.3f}s"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Jira paths benchmark")
+    parser.add_argument("--components", type=int, default=200)
+    parser.add_argument("--issues", type=int, default=5000)
+    parser.add_argument("--deliveries", type=int, default=10)
+    parser.add_argument("--latency-ms", type=float, default=50)
+    parser.add_argument("--jitter-ms", type=float, default=20)
+    parser.add_argument("--page-size", type=int, default=50)
+    parser.add_argument("--max-workers", type=int, default=4)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    dataset = JiraDataset.generate(
+        args.components, args.issues, args.deliveries
+    )
+    stand_in = JiraStandIn(dataset, args.latency_ms, args.jitter_ms, seed=0)
+    with JiraStandInServer(stand_in) as server:
+        ji = JiraIntegration(
+            server.url, "user", "password", args.page_size, args.max_workers
+        )
+        repository = NovaReleaseRepository(
+            ji,
+            NovaComponentCatalog(
+                ji, parser=NovaComponentParser(config=BenchmarkConfig())
+            ),
+        )
+        last_delivery = str(args.deliveries)
+        recent_deliveries = [
+            ("2", str(d))
+            for d in range(max(1, args.deliveries - 9), args.deliveries + 1)
+        ]
+
+        measure(
+            "get_raw_issues (one delivery)",
+            lambda: ji.get_raw_issues(
+                dataset.project_code, f"Nova 2. Delivery {last_delivery}"
+            ),
+            args.repeat,
+        )
+        release = repository.get(dataset.project_code, "2", last_delivery)
+        measure(
+            "repository.get",
+            lambda: repository.get(dataset.project_code, "2", last_delivery),
+            args.repeat,
+        )
+        measure(
+            "repository.refresh",
+            lambda: repository.refresh(release),
+            args.repeat,
+        )
+        measure(
+            f"repository.get_many ({len(recent_deliveries)} deliveries)",
+            lambda: repository.get_many(
+                dataset.project_code, recent_deliveries
+            ),
+            args.repeat,
+        )
+        print("Requests served:")
+        for endpoint, count in sorted(stand_in.requests.items()):
+            print(f"  {endpoint:<40} {count}")
@@ -0,0 +1,673 @@
+"""
+Local Jira stand-in server module.
+
+Implements the part of Jira REST API v2 the application uses, so Jira
+paths can be benchmarked and load-tested without a live Jira:
+server info, fields, issue search with pagination, project components
+and versions, version update, issue transitions and comments, and
+the bulk transition tasks of Jira Cloud REST API v3.
+The server works on a generated dataset and delays every response by
+the configured latency with jitter.
+
+Usage: python -m perf.jira_stand_in --components 200 --issues 5000
+"""
+
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Optional, cast
+from urllib.parse import parse_qs, unquote, urlparse
+
+API_PREFIX = "/rest/api/2/"
+BULK_API_PREFIX = "/rest/api/3/"
+
+# workflow statuses, every status can be reached from any other one
+# with the transition named after the target status
+WORKFLOW_STATUSES = [
+    "Open",
+    "In Development",
+    "Ready for testing",
+    "In Testing",
+    "Selected For Release",
+    "Done",
+]
+
+DEPLOYMENT_FIELD = "customfield_10646"
+ALL_FIELDS = [
+    "summary",
+    "status",
+    "components",
+    "fixVersions",
+    "updated",
+    "issuetype",
+    "project",
+    DEPLOYMENT_FIELD,
+]
+
+
+class StandInError(Exception):
+    """
+    Error returned to the client as Jira error response
+    """
+
+    def __init__(self, status: int, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+@dataclass
+class StandInIssue:  # pylint: disable=too-many-instance-attributes
+    """
+    Jira issue of the stand-in dataset
+    """
+
+    key: str
+    component: str
+    fix_version: str
+    status: str
+    summary: str
+    deployment: Optional[str] = None
+    updated_at: float = 0.0
+    comments: list[str] = field(default_factory=list)
+
+
+@dataclass
+class JiraDataset:
+    """
+    Jira project data served by the stand-in server
+    """
+
+    project_code: str
+    components: list[dict[str, Any]]
+    versions: list[dict[str, Any]]
+    issues: list[StandInIssue]
+
+    # pylint: disable=too-many-arguments,too-many-locals
+    @staticmethod
+    def generate(
+        components: int = 100,
+        issues: int = 1000,
+        deliveries: int = 10,
+        project_code: str = "NOVA",
+        seed: int = 0,
+    ) -> "JiraDataset":
+        """
+        Generates a project with components of all types, deliveries
+        released two weeks apart (the last one is not released) with
+        a hotfix for every third one, and issues spread randomly over
+        components, deliveries and workflow statuses.
+
+        :param components: number of components
+        :param issues: number of issues
+        :param deliveries: number of deliveries
+        :param project_code: project code
+        :param seed: random generator seed
+        :return: dataset
+        """
+        if components < 1 or deliveries < 1 or issues < 0:
+            raise ValueError("Invalid dataset size")
+
+        rnd = random.Random(seed)
+        component_raws = [
+            JiraDataset._generate_component(index)
+            for index in range(components)
+        ]
+        # issues of the empty component are skipped by the application
+        component_raws.append(
+            {"id": str(10000 + components), "name": "n/a", "description": ""}
+        )
+
+        first_release = date(2023, 1, 2)
+        version_raws: list[dict[str, Any]] = []
+        for delivery in range(1, deliveries + 1):
+            release_date = first_release + timedelta(weeks=2 * delivery)
+            released = delivery < deliveries
+            version_raws.append(
+                {
+                    "id": str(20000 + len(version_raws)),
+                    "name": f"Nova 2. Delivery {delivery}",
+                    "archived": False,
+                    "released": released,
+                    "releaseDate": release_date.isoformat(),
+                }
+            )
+            if released and delivery % 3 == 0:
+                version_raws.append(
+                    {
+                        "id": str(20000 + len(version_raws)),
+                        "name": f"Nova 2. Delivery {delivery}. Hotfix 1",
+                        "archived": False,
+                        "released": True,
+                        "releaseDate": (
+                            release_date + timedelta(days=3)
+                        ).isoformat(),
+                    }
+                )
+
+        now = time.time()
+        issue_components = [c["name"] for c in component_raws[:-1]]
+        issue_versions = [
+            v["name"] for v in version_raws if "Hotfix" not in v["name"]
+        ]
+        issue_list = [
+            StandInIssue(
+                key=f"{project_code}-{index + 1}",
+                component=rnd.choice(issue_components),
+                fix_version=rnd.choice(issue_versions),
+                status=rnd.choice(WORKFLOW_STATUSES),
+                summary=f"[{project_code}-{index + 1}] Generated task {index}",
+                deployment=("Run migrations" if rnd.random() < 0.1 else None),
+                # issues were updated within the last thirty days
+                updated_at=now - rnd.uniform(0, 30 * 24 * 3600),
+            )
+            for index in range(issues)
+        ]
+        return JiraDataset(
+            project_code, component_raws, version_raws, issue_list
+        )
+
+    @staticmethod
+    def _generate_component(index: int) -> dict[str, Any]:
+        """
+        Generates a component, services and packages are hosted on GitHub,
+        libraries on Bitbucket
+
+        :param index: component index
+        :return: component JSON
+        """
+        kind = index % 4
+        if kind == 2:
+            name = f"Nova.Service{index - 2}.Client"
+            description = f"https://github.com/nova/service{index - 2}"
+        elif kind == 3:
+            name = f"Nova.Infra{index}.Library"
+            description = f"https://bitbucket.org/nova/infra{index}"
+        else:
+            name = f"Nova.Service{index}"
+            description = f"https://github.com/nova/service{index}"
+        return {
+            "id": str(10000 + index),
+            "name": name,
+            "description": description,
+        }
+
+
+# JQL clauses the application builds, see `jira_utils.build_jql`
+_JQL_CLAUSES = [
+    ("project", re.compile(r'^project\s*=\s*"?([^"]+?)"?$')),
+    ("fix_version", re.compile(r'^fixVersion\s*=\s*"([^"]*)"$')),
+    ("fix_versions", re.compile(r"^fixVersion\s+in\s*\((.*)\)$")),
+    ("component", re.compile(r'^component\s*=\s*"([^"]*)"$')),
+    ("updated_within", re.compile(r'^updated\s*>=\s*"-(\d+)m"$')),
+    ("keys", re.compile(r"^key\s+in\s*\((.*)\)$")),
+]
+_JQL_ORDER_BY_UPDATED = re.compile(
+    r"\s+ORDER\s+BY\s+updated\s+DESC\s*$", re.IGNORECASE
+)
+
+
+def _parse_jql_values(values: str) -> set[str]:
+    """Parses comma separated list of quoted JQL values"""
+    return {value.strip().strip('"') for value in values.split(",")}
+
+
+class JiraStandIn:  # pylint: disable=too-many-instance-attributes
+    """
+    State and request handling of the stand-in server
+    """
+
+    def __init__(
+        self,
+        dataset: JiraDataset,
+        latency_ms: float = 0,
+        jitter_ms: float = 0,
+        max_results_limit: int = 100,
+        seed: Optional[int] = None,
+    ) -> None:
+        """
+        :param dataset: project data
+        :param latency_ms: mean response latency
+        :param jitter_ms: maximum deviation from the mean latency
+        :param max_results_limit: maximum search page size, the way
+            Jira limits it
+        :param seed: latency random generator seed
+        """
+        self.dataset = dataset
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.max_results_limit = max_results_limit
+        self.requests: Counter[str] = Counter()
+        self._issues = {issue.key: issue for issue in dataset.issues}
+        self._versions = {v["id"]: v for v in dataset.versions}
+        self._versions_by_name = {v["name"]: v for v in dataset.versions}
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        # whether bulk transition tasks are provided, the way
+        # Jira Cloud does, Jira Server does not
+        self.bulk_operations = True
+        # task id -> task progress and the number of polls left
+        # until the task is reported complete
+        self._bulk_tasks: dict[str, tuple[dict[str, Any], int]] = {}
+
+    def delay(self) -> None:
+        """Sleeps for the configured latency with jitter"""
+        with self._lock:
+            jitter = self._random.uniform(-self.jitter_ms, self.jitter_ms)
+        latency_sec = max(0.0, self.latency_ms + jitter) / 1000
+        if latency_sec > 0:
+            time.sleep(latency_sec)
+
+    # pylint: disable=too-many-return-statements
+    def handle(
+        self, method: str, path: str, query: dict[str, list[str]], body: Any
+    ) -> tuple[int, Any]:
+        """
+        Handles an API request
+
+        :param method: HTTP method
+        :param path: path relative to the API prefix
+        :param query: query string parameters
+        :param body: JSON body
+        :return: HTTP status and JSON response
+        """
+        parts = [unquote(part) for part in path.strip("/").split("/")]
+        route = (
+            # bulk/issues/transition and bulk/queue/{task id}
+            (method, *parts[:2], "*")
+            if parts[0] == "bulk"
+            else (
+                method,
+                *[p if i % 2 == 0 else "*" for i, p in enumerate(parts)],
+            )
+        )
+        with self._lock:
+            self.requests[" ".join(route)] += 1
+
+        match route:
+            case ("GET", "serverInfo"):
+                return 200, {
+                    "version": "9.4.0",
+                    "versionNumbers": [9, 4, 0],
+                    "deploymentType": "Server",
+                    "buildNumber": 940000,
+                    "serverTitle": "Jira stand-in",
+                }
+            case ("GET", "field"):
+                return 200, [
+                    {"id": name, "name": name, "clauseNames": [name]}
+                    for name in ALL_FIELDS
+                ]
+            case ("GET", "search"):
+                return 200, self._search(query)
+            case ("GET", "project", "*", "components"):
+                self._check_project(parts[1])
+                return 200, self.dataset.components
+            case ("GET", "project", "*", "versions"):
+                self._check_project(parts[1])
+                return 200, [
+                    self._render_version(v) for v in self._versions.values()
+                ]
+            case ("GET", "version", "*"):
+                return 200, self._render_version(self._get_version(parts[1]))
+            case ("PUT", "version", "*"):
+                with self._lock:
+                    version = self._get_version(parts[1])
+                    version.update(
+                        {k: v for k, v in (body or {}).items() if k != "id"}
+                    )
+                return 200, self._render_version(version)
+            case ("GET", "issue", "*", "transitions"):
+                issue = self._get_issue(parts[1])
+                return 200, {"transitions": self._render_transitions(issue)}
+            case ("POST", "issue", "*", "transitions"):
+                self._transition(self._get_issue(parts[1]), body or {})
+                return 204, None
+            case ("POST", "issue", "*", "comment"):
+                issue = self._get_issue(parts[1])
+                with self._lock:
+                    issue.comments.append((body or {}).get("body", ""))
+                    comment_id = len(issue.comments)
+                return 201, {"id": str(comment_id), "body": issue.comments[-1]}
+            case ("POST", "bulk", "issues", "*") if self.bulk_operations:
+                return 201, {"taskId": self._bulk_transition(body or {})}
+            case ("GET", "bulk", "queue", "*") if self.bulk_operations:
+                return 200, self._get_bulk_task(parts[2])
+        raise StandInError(404, f"Resource [{method} {path}] is not found")
+
+    def _check_project(self, project_code: str) -> None:
+        if project_code != self.dataset.project_code:
+            raise StandInError(404, f"Project [{project_code}] is not found")
+
+    def _get_version(self, version_id: str) -> dict[str, Any]:
+        if version_id not in self._versions:
+            raise StandInError(404, f"Version [{version_id}] is not found")
+        return self._versions[version_id]
+
+    def _get_issue(self, key: str) -> StandInIssue:
+        if key not in self._issues:
+            raise StandInError(404, f"Issue [{key}] does not exist")
+        return self._issues[key]
+
+    @staticmethod
+    def _render_version(version: dict[str, Any]) -> dict[str, Any]:
+        # resources are updated by their `self` URL, the request
+        # handler makes it absolute
+        return {**version, "self": f"{API_PREFIX}version/{version['id']}"}
+
+    @staticmethod
+    def _render_transitions(issue: StandInIssue) -> list[dict[str, Any]]:
+        return [
+            {"id": str(index + 1), "name": status, "to": {"name": status}}
+            for index, status in enumerate(WORKFLOW_STATUSES)
+            if status != issue.status
+        ]
+
+    def _transition(self, issue: StandInIssue, body: dict[str, Any]) -> None:
+        transition_id = str(body.get("transition", {}).get("id", ""))
+        with self._lock:
+            transition = next(
+                (
+                    t
+                    for t in self._render_transitions(issue)
+                    if t["id"] == transition_id
+                ),
+                None,
+            )
+            if transition is None:
+                raise StandInError(
+                    400, f"Transition [{transition_id}] is not valid"
+                )
+            issue.status = transition["to"]["name"]
+            issue.updated_at = time.time()
+            for comment in body.get("update", {}).get("comment", []):
+                issue.comments.append(comment["add"]["body"])
+
+    def _bulk_transition(self, body: dict[str, Any]) -> str:
+        """
+        Transitions issues at once, the task is reported running
+        on the first poll
+
+        :param body: bulk transition request
+        :return: task id
+        """
+        processed: list[int] = []
+        failed: dict[str, list[str]] = {}
+        invalid = 0
+        for bulk_input in body.get("bulkTransitionInputs", []):
+            transition = {"transition": {"id": bulk_input["transitionId"]}}
+            for key in bulk_input["selectedIssueIdsOrKeys"]:
+                if key not in self._issues:
+                    invalid += 1
+                    continue
+                issue_id = key.rsplit("-", 1)[-1]
+                try:
+                    self._transition(self._issues[key], transition)
+                except StandInError as error:
+                    failed[issue_id] = [str(error)]
+                    continue
+                processed.append(int(issue_id))
+        with self._lock:
+            task_id = str(30000 + len(self._bulk_tasks))
+            self._bulk_tasks[task_id] = (
+                {
+                    "taskId": task_id,
+                    "status": "COMPLETE",
+                    "progressPercent": 100,
+                    "processedAccessibleIssues": processed,
+                    "failedAccessibleIssues": failed,
+                    "invalidOrInaccessibleIssueCount": invalid,
+                },
+                1,
+            )
+        return task_id
+
+    def _get_bulk_task(self, task_id: str) -> dict[str, Any]:
+        with self._lock:
+            if task_id not in self._bulk_tasks:
+                raise StandInError(404, f"Task [{task_id}] is not found")
+            task, polls_left = self._bulk_tasks[task_id]
+            if polls_left > 0:
+                self._bulk_tasks[task_id] = (task, polls_left - 1)
+                return {"taskId": task_id, "status": "RUNNING"}
+            return task
+
+    def _search(self, query: dict[str, list[str]]) -> dict[str, Any]:
+        jql = query.get("jql", [""])[0]
+        start_at = int(query.get("startAt", ["0"])[0])
+        max_results = min(
+            int(query.get("maxResults", ["50"])[0]), self.max_results_limit
+        )
+        fields = {
+            f for value in query.get("fields", []) for f in value.split(",")
+        } or {"*navigable"}
+        if fields & {"*all", "*navigable"}:
+            fields = set(ALL_FIELDS)
+
+        issues = self._filter(jql)
+        page = issues[start_at : start_at + max_results]
+        return {
+            "startAt": start_at,
+            "maxResults": max_results,
+            "total": len(issues),
+            "issues": [self._render_issue(issue, fields) for issue in page],
+        }
+
+    def _filter(self, jql: str) -> list[StandInIssue]:
+        """
+        Selects issues matching JQL query built by the application
+
+        :param jql: JQL query
+        :return: issues in the order of the query
+        """
+        order_by_updated = _JQL_ORDER_BY_UPDATED.search(jql) is not None
+        jql = _JQL_ORDER_BY_UPDATED.sub("", jql)
+        now = time.time()
+        with self._lock:
+            issues = list(self._issues.values())
+        for clause in (c.strip() for c in jql.split(" AND ") if c.strip()):
+            name, value = self._parse_clause(clause)
+            if name == "project":
+                if value != self.dataset.project_code:
+                    return []
+            elif name == "fix_version":
+                issues = [i for i in issues if i.fix_version == value]
+            elif name == "fix_versions":
+                versions = _parse_jql_values(value)
+                issues = [i for i in issues if i.fix_version in versions]
+            elif name == "component":
+                issues = [
+                    i
+                    for i in issues
+                    if i.component.lower() == value.strip().lower()
+                ]
+            elif name == "updated_within":
+                since = now - int(value) * 60
+                issues = [i for i in issues if i.updated_at >= since]
+            elif name == "keys":
+                keys = _parse_jql_values(value)
+                issues = [i for i in issues if i.key in keys]
+        if order_by_updated:
+            issues.sort(key=lambda i: i.updated_at, reverse=True)
+        return issues
+
+    @staticmethod
+    def _parse_clause(clause: str) -> tuple[str, str]:
+        for name, pattern in _JQL_CLAUSES:
+            match = pattern.match(clause)
+            if match is not None:
+                return name, match.group(1)
+        raise StandInError(400, f"JQL clause [{clause}] is not supported")
+
+    def _render_issue(
+        self, issue: StandInIssue, fields: set[str]
+    ) -> dict[str, Any]:
+        version = self._versions_by_name.get(
+            issue.fix_version, {"id": "", "name": issue.fix_version}
+        )
+        updated = datetime.fromtimestamp(issue.updated_at, timezone.utc)
+        all_fields: dict[str, Any] = {
+            "summary": issue.summary,
+            "status": {
+                "id": str(WORKFLOW_STATUSES.index(issue.status) + 1),
+                "name": issue.status,
+            },
+            "components": [{"name": issue.component}],
+            "fixVersions": [{"id": version["id"], "name": version["name"]}],
+            "updated": updated.strftime("%Y-%m-%dT%H:%M:%S.000+0000"),
+            "issuetype": {"id": "1", "name": "Task"},
+            "project": {"id": "1", "key": self.dataset.project_code},
+            DEPLOYMENT_FIELD: issue.deployment,
+        }
+        return {
+            "id": issue.key.rsplit("-", 1)[-1],
+            "key": issue.key,
+            "self": f"{API_PREFIX}issue/{issue.key}",
+            "fields": {k: v for k, v in all_fields.items() if k in fields},
+        }
+
+
+class _StandInRequestHandler(BaseHTTPRequestHandler):
+    """
+    Translates HTTP requests to the stand-in calls
+    """
+
+    server: "JiraStandInServer"
+
+    def log_message(self, *_):
+        """Requests are not logged"""
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """Handles GET request"""
+        self._handle("GET")
+
+    def do_PUT(self):  # pylint: disable=invalid-name
+        """Handles PUT request"""
+        self._handle("PUT")
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        """Handles POST request"""
+        self._handle("POST")
+
+    def _handle(self, method: str) -> None:
+        stand_in = self.server.stand_in
+        stand_in.delay()
+        url = urlparse(self.path)
+        length = int(self.headers.get("Content-Length") or 0)
+        try:
+            prefix = next(
+                (
+                    p
+                    for p in (API_PREFIX, BULK_API_PREFIX)
+                    if url.path.startswith(p)
+                ),
+                None,
+            )
+            if prefix is None:
+                raise StandInError(404, f"Resource [{url.path}] is not found")
+            body = json.loads(self.rfile.read(length)) if length else None
+            status, response = stand_in.handle(
+                method,
+                url.path[len(prefix) :],
+                parse_qs(url.query),
+                body,
+            )
+        except StandInError as error:
+            status, response = error.status, {"errorMessages": [str(error)]}
+        except ValueError as error:
+            status, response = 400, {"errorMessages": [str(error)]}
+
+        payload = b"" if response is None else json.dumps(response).encode()
+        # resources refer to themselves by absolute URL
+        payload = payload.replace(
+            f'"{API_PREFIX}'.encode(),
+            f'"{self.server.url}{API_PREFIX}'.encode(),
+        )
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json;charset=UTF-8")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+class JiraStandInServer(ThreadingHTTPServer):
+    """
+    HTTP server of the stand-in, serves requests in the background
+    thread once started. Port 0 binds a free port.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self, stand_in: JiraStandIn, host: str = "127.0.0.1", port: int = 0
+    ) -> None:
+        super().__init__((host, port), _StandInRequestHandler)
+        self.stand_in = stand_in
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """Server URL to be used as Jira host"""
+        host, port = self.server_address[:2]
+        return f"http://{cast(str, host)}:{port}"
+
+    def start(self) -> "JiraStandInServer":
+        """Starts serving requests in the background thread"""
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stops serving requests and releases the port"""
+        self.shutdown()
+        self.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *_):
+        self.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local Jira stand-in server")
+    parser.add_argument("--components", type=int, default=100)
+    parser.add_argument("--issues", type=int, default=1000)
+    parser.add_argument("--deliveries", type=int, default=10)
+    parser.add_argument("--project", type=str, default="NOVA")
+    parser.add_argument("--latency-ms", type=float, default=0)
+    parser.add_argument("--jitter-ms", type=float, default=0)
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    server = JiraStandInServer(
+        JiraStandIn(
+            JiraDataset.generate(
+                args.components,
+                args.issues,
+                args.deliveries,
+                args.project,
+                args.seed,
+            ),
+            args.latency_ms,
+            args.jitter_ms,
+            seed=args.seed,
+        ),
+        port=args.port,
+    )
+    print(f"Jira stand-in is listening on {server.url}, press Ctrl+C to stop")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
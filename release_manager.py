@@ -3,10 +3,12 @@ The release manager is responsible for managing the release process.
 """
 
 import logging
-from config import Config
+from typing import Optional
+
 from core.nova_component import NovaComponent
 from core.nova_component_release import NovaComponentRelease
 from core.nova_release import NovaRelease
+from integration.git import GitIntegration
 from integration.jira import JiraIntegration
 from workers.release_worker_factory import ReleaseWorkerFactory
 
@@ -14,14 +16,21 @@ from workers.release_worker_factory import ReleaseWorkerFactory
 class ReleaseManager:
     """The release manager is responsible for managing the release process."""
 
-    def __init__(self) -> None:
-        config = Config()
-
-        self._ji = JiraIntegration(
-            config.data["jira"]["host"],
-            config.data["jira"]["username"],
-            config.data["jira"]["password"],
-        )
+    def __init__(
+        self,
+        ji: JiraIntegration,
+        rehearsal: bool = False,
+        gi: Optional[GitIntegration] = None,
+    ) -> None:
+        """
+        :param ji: Jira integration shared with the release repository
+        :param rehearsal: only go through the release process without
+            tagging and publishing components, used offline
+        :param gi: git integration release workers clone repositories with
+        """
+        self._ji = ji
+        self._rehearsal = rehearsal
+        self._gi = gi
 
     def release_component(
         self, release: NovaRelease, component: NovaComponent
@@ -37,10 +46,19 @@ class ReleaseManager:
         if component.repo is None:
             raise ValueError("Component repository is not specified")
 
-        worker = ReleaseWorkerFactory.create_worker(
-            component.repo.git_cloud.value, component.ctype, release
-        )
-        component_release = worker.release_component(component)
+        component_release: Optional[NovaComponentRelease]
+        if self._rehearsal:
+            component_release = NovaComponentRelease(
+                f"{component.name} (rehearsal)", component.repo.sanitized_url
+            )
+        else:
+            worker = ReleaseWorkerFactory.create_worker(
+                component.repo.git_cloud.value,
+                component.ctype,
+                release,
+                self._gi,
+            )
+            component_release = worker.release_component(component)
 
         if component_release is None:
             raise IOError(
@@ -48,14 +66,16 @@ class ReleaseManager:
             )
 
         # moving jira issues to DONE
-        for task in component.tasks:
-            error_text = self._ji.transition_issue(
-                task.name, "Done", f"{release.title} released"
-            )
+        errors = self._ji.transition_issues(
+            [task.name for task in component.tasks],
+            "Done",
+            f"{release.title} released",
+        )
+        for task_name, error_text in errors.items():
             if error_text:
                 logging.warning(
                     "Could not transition issue %s due to error: %s",
-                    task.name,
+                    task_name,
                     error_text,
                 )
 
@@ -0,0 +1,135 @@
+"""
+Release watcher module
+"""
+
+import logging
+import time
+from dataclasses import dataclass
+from typing import Callable, Iterator, Optional
+
+from jira import JIRAError
+
+import jira_utils as ju
+from core.nova_release import NovaRelease
+from core.nova_status import Status
+from nova_release_repository import NovaReleaseRepository
+
+
+@dataclass(frozen=True)
+class ComponentStatusChange:
+    """
+    Status transition of a release component, None status means
+    the component has no tasks in the release
+    """
+
+    component: str
+    previous: Optional[Status]
+    current: Optional[Status]
+
+    def __str__(self):
+        previous = "NOT IN RELEASE" if self.previous is None else self.previous
+        current = "NOT IN RELEASE" if self.current is None else self.current
+        return f"[{self.component}] {previous} -> {current}"
+
+
+def get_component_statuses(release: NovaRelease) -> dict[str, Status]:
+    """
+    Get statuses of the release components
+
+    :param release: release model
+    :return: component name -> status, in the order of the components
+    """
+    return {component.name: component.status for component in release}
+
+
+def diff_component_statuses(
+    previous: dict[str, Status], current: dict[str, Status]
+) -> list[ComponentStatusChange]:
+    """
+    Get status transitions between two snapshots of component statuses
+
+    :param previous: component statuses before
+    :param current: component statuses after
+    :return: changed, added and then removed components
+    """
+    changes = [
+        ComponentStatusChange(name, previous.get(name), status)
+        for name, status in current.items()
+        if previous.get(name) != status
+    ]
+    changes.extend(
+        ComponentStatusChange(name, status, None)
+        for name, status in previous.items()
+        if name not in current
+    )
+    return changes
+
+
+class ReleaseWatcher:
+    """
+    Keeps a release model up to date with cheap delta queries, which
+    request only the issues updated since the previous poll with their
+    status fields, and reports component status transitions
+    """
+
+    def __init__(
+        self,
+        repository: NovaReleaseRepository,
+        release: NovaRelease,
+        fields_profile: str = ju.STATUS_ONLY_FIELDS_PROFILE,
+    ) -> None:
+        """
+        :param repository: repository the release was loaded by
+        :param release: release model to keep up to date
+        :param fields_profile: Jira issue fields profile of delta queries
+        """
+        self._repository = repository
+        self._release = release
+        self._fields_profile = fields_profile
+        self._statuses = get_component_statuses(release)
+
+    @property
+    def release(self) -> NovaRelease:
+        """Release model being watched"""
+        return self._release
+
+    def poll(self) -> list[ComponentStatusChange]:
+        """
+        Brings the release model up to date
+
+        :return: component status transitions since the previous poll
+        """
+        self._repository.refresh(self._release, self._fields_profile)
+        statuses = get_component_statuses(self._release)
+        changes = diff_component_statuses(self._statuses, statuses)
+        self._statuses = statuses
+        return changes
+
+    def watch(
+        self,
+        interval_sec: float,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> Iterator[ComponentStatusChange]:
+        """
+        Polls Jira until the caller stops iterating.
+        Failed polls are logged and retried on the next cycle, changes
+        made meanwhile are picked up by the next successful poll.
+
+        :param interval_sec: pause between polls
+        :param sleep: sleep function
+        :return: component status transitions as they are detected
+        """
+        if interval_sec <= 0:
+            raise ValueError(f"Invalid polling interval [{interval_sec}]")
+        while True:
+            sleep(interval_sec)
+            try:
+                changes = self.poll()
+            except JIRAError as error:
+                logging.warning(
+                    "Could not poll release %s due to error: %s",
+                    self._release,
+                    error,
+                )
+                continue
+            yield from changes
@@ -0,0 +1,142 @@
+"""
+Tag discovery module
+"""
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Iterable, Iterator
+
+from git.exc import GitCommandError
+
+from core.cvs import CodeRepository
+from core.nova_component import NovaComponent
+from core.nova_tag_list import NovaTagList
+from integration.git import GitIntegration, GitTag
+
+
+def normalize_repo_url(url: str) -> str:
+    """
+    Get repository url components pointing to the same repository
+    share, regardless of credentials, scheme, case and `.git` suffix
+
+    :param url: repository url
+    :return: normalized url
+    """
+    normalized = CodeRepository.sanitize_git_url(url).strip().lower()
+    normalized = normalized.split("://", 1)[-1].rstrip("/")
+    return normalized.removesuffix(".git")
+
+
+class TagDiscovery:
+    """
+    Lists tags of component repositories. Several components, for example
+    a service and its contracts and client packages, often live in the
+    same repository, so tags of every repository are listed once and
+    classified for each of its components. Concurrent requests for the
+    same repository wait for the first one instead of listing its tags
+    again (single-flight), failures are shared the same way.
+    Repositories are processed concurrently by a bounded pool of threads
+    since listing tags is network-bound.
+    """
+
+    def __init__(self, git_integration: GitIntegration, since: str) -> None:
+        """
+        :param git_integration: git integration tags are listed with
+        :param since: date to list tags from, in the format YYYY-MM-DD
+        """
+        self._gi = git_integration
+        self._since = since
+        self._lock = threading.Lock()
+        # normalized repository url -> tags of the repository
+        self._flights: dict[str, Future[list[GitTag]]] = {}
+        # repository url without credentials -> error
+        self._failures: dict[str, str] = {}
+
+    @property
+    def failures(self) -> dict[str, str]:
+        """
+        Repositories tags could not be listed for by `discover`,
+        repository url without credentials -> error
+        """
+        with self._lock:
+            return dict(self._failures)
+
+    def get_tags(self, url: str) -> list[GitTag]:
+        """
+        Get tags of a repository, listed once per normalized url
+
+        :param url: repository url
+        :return: tags of the repository since the discovery date
+        """
+        key = normalize_repo_url(url)
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if flight is None:
+                flight = Future()
+                self._flights[key] = flight
+
+        if leader:
+            try:
+                flight.set_result(self._gi.list_tags(url, self._since))
+            except Exception as error:  # pylint: disable=broad-except
+                flight.set_exception(error)
+        return flight.result()
+
+    def get_tag_list(self, component: NovaComponent) -> NovaTagList:
+        """
+        Get tags of a component
+
+        :param component: component
+        :return: tags of the component repository relevant to the component
+        """
+        if component.repo is None:
+            return NovaTagList(component, self._since)
+        return NovaTagList.from_tags(
+            component, self._since, self.get_tags(component.repo.url)
+        )
+
+    def _try_get_tag_list(self, component: NovaComponent) -> NovaTagList:
+        """
+        Get tags of a component, the component gets no tags if tags
+        of its repository could not be listed, the error is recorded
+        """
+        try:
+            return self.get_tag_list(component)
+        except (ValueError, GitCommandError, OSError) as error:
+            assert component.repo is not None
+            # git errors contain the url with credentials
+            message = str(error).replace(
+                component.repo.url, component.repo.sanitized_url
+            )
+            with self._lock:
+                self._failures[component.repo.sanitized_url] = message
+            return NovaTagList(component, self._since)
+
+    def discover(
+        self, components: Iterable[NovaComponent], jobs: int = 1
+    ) -> Iterator[NovaTagList]:
+        """
+        Get tags of components. Tag lists are yielded in the order of
+        the components as soon as they are ready, while the next
+        repositories are processed. Components of repositories which
+        tags could not be listed get empty tag lists, see `failures`.
+
+        :param components: components
+        :param jobs: number of repositories processed concurrently
+        :return: tag lists in the order of the components
+        """
+        if jobs < 1:
+            raise ValueError(f"Invalid number of jobs [{jobs}]")
+
+        executor = ThreadPoolExecutor(max_workers=jobs)
+        try:
+            futures = [
+                executor.submit(self._try_get_tag_list, component)
+                for component in components
+            ]
+            for future in futures:
+                yield future.result()
+        finally:
+            # the caller might stop iterating early
+            executor.shutdown(wait=False, cancel_futures=True)
@@ -25,3 +25,19 @@ def test_when_all_params_are_provided():
                     component_name='component')
     assert 'fixVersion=' in jql
     assert 'component=' in jql
+
+
+def test_when_updated_within_is_provided():
+    jql = build_jql('project', fix_version='fix_version',
+                    updated_within_min=5)
+    assert 'updated >= "-5m"' in jql
+
+
+def test_when_updated_within_is_not_positive():
+    jql = build_jql('project', updated_within_min=0)
+    assert 'updated' not in jql
+
+
+def test_when_several_fix_versions_are_provided():
+    jql = build_jql('project', fix_version=['v1', 'v2'])
+    assert 'fixVersion in ("v1", "v2")' in jql
@@ -0,0 +1,117 @@
+"""
+Git integration tests
+"""
+
+from unittest.mock import patch
+
+import pytest
+from git import Git
+from git.repo import Repo
+
+from integration.git import GitIntegration, parse_raw_git_date
+
+
+@pytest.fixture(name="origin")
+def fixture_origin(tmp_path):
+    repo = Repo.init(tmp_path / "origin", initial_branch="master")
+    repo.config_writer().set_value("user", "name", "nova").release()
+    repo.config_writer().set_value("user", "email", "nova@test").release()
+    for version in ["1.0.0", "1.1.0"]:
+        repo.index.commit(
+            version, commit_date="2024-01-01T00:00:00", author_date=None
+        )
+    repo.create_tag("1.0.0", ref="HEAD~1")
+    repo.create_tag("1.1.0", message="Nova 2. Delivery 5")
+    return repo
+
+
+def test_remote_tags_point_to_commits(origin):
+    tags = GitIntegration.list_remote_tags(f"file://{origin.working_dir}")
+
+    assert tags == {
+        "1.0.0": origin.commit("HEAD~1").hexsha,
+        "1.1.0": origin.head.commit.hexsha,
+    }
+
+
+def test_tags_are_listed_without_clone(origin):
+    tags = GitIntegration().list_tags(f"file://{origin.working_dir}")
+
+    assert [tag.name for tag in tags] == ["1.0.0", "1.1.0"]
+    assert not tags[0].annotated
+    assert tags[1].message == "Nova 2. Delivery 5"
+
+
+def test_tags_are_filtered_by_commit_date(origin):
+    url = f"file://{origin.working_dir}"
+
+    assert len(GitIntegration().list_tags(url, "2024-01-01")) == 2
+    assert not GitIntegration().list_tags(url, "2024-01-02")
+
+
+def test_tags_are_fetched_without_listing_them_first(origin):
+    with patch.object(GitIntegration, "list_remote_tags") as list_remote_tags:
+        tags = GitIntegration().list_tags(f"file://{origin.working_dir}")
+
+    assert len(tags) == 2
+    list_remote_tags.assert_not_called()
+
+
+def test_no_tags_are_listed_without_tags(tmp_path):
+    repo = Repo.init(tmp_path / "origin")
+
+    assert not GitIntegration().list_tags(
+        f"file://{repo.working_dir}", retry_interval_sec=0
+    )
+
+
+def test_list_tags_fails_after_retries(tmp_path):
+    with pytest.raises(ValueError):
+        GitIntegration().list_tags(
+            f"file://{tmp_path}/missing", retry_times=2, retry_interval_sec=0
+        )
+
+
+def test_tag_metadata_is_read_with_single_call(origin):
+    origin.create_tag("2.0.0", message="Nova 2. Delivery 6\n\nHotfix notes")
+
+    with patch.object(
+        Git, "execute", autospec=True, side_effect=Git.execute
+    ) as execute:
+        tags = GitIntegration.read_tags(origin)
+
+    # names, dates and annotations are read without cat-file calls
+    assert execute.call_count == 1
+    assert [(tag.name, tag.annotated) for tag in tags] == [
+        ("1.0.0", False),
+        ("1.1.0", True),
+        ("2.0.0", True),
+    ]
+    assert tags[0].message == "1.0.0"
+    assert tags[2].message == "Nova 2. Delivery 6\n\nHotfix notes"
+    assert (
+        tags[0].committed_datetime == origin.commit("HEAD~1").committed_datetime
+    )
+    assert tags[2].committed_datetime == origin.head.commit.committed_datetime
+    assert tags[2].tagged_datetime is not None
+
+
+def test_latest_tag_is_found_by_commit_date(origin):
+    assert GitIntegration.get_latest_tag(origin.working_dir) == "1.1.0"
+    assert GitIntegration().list_tags_with_annotation(
+        origin.working_dir, "Delivery 5"
+    ) == ["1.1.0"]
+
+
+@pytest.mark.parametrize(
+    "raw_date,expected",
+    [
+        ("1700000000 +0000", "2023-11-14T22:13:20+00:00"),
+        ("1700000000 -0130", "2023-11-14T20:43:20-01:30"),
+    ],
+)
+def test_raw_git_date_is_parsed_with_time_zone(raw_date, expected):
+    parsed = parse_raw_git_date(raw_date)
+
+    assert parsed is not None
+    assert parsed.isoformat() == expected
@@ -0,0 +1,82 @@
+"""
+Integration registry tests
+"""
+
+from unittest.mock import Mock
+
+import pytest
+
+from integration.jira_cache import JiraResponseCache
+from integration.registry import IntegrationRegistry
+from integration.snapshot import (
+    OfflineJiraIntegration,
+    Snapshot,
+    SnapshotGitIntegration,
+)
+from perf.jira_stand_in import JiraDataset, JiraStandIn, JiraStandInServer
+
+
+@pytest.fixture(name="stand_in")
+def fixture_stand_in():
+    return JiraStandIn(JiraDataset.generate(components=3, issues=10))
+
+
+@pytest.fixture(name="config")
+def fixture_config(stand_in):
+    with JiraStandInServer(stand_in) as server:
+        config = Mock()
+        config.data = {
+            "jira": {
+                "host": server.url,
+                "username": "user",
+                "password": "password",
+                "maxWorkers": 16,
+            }
+        }
+        yield config
+
+
+def test_jira_is_created_once(config, stand_in):
+    sut = IntegrationRegistry(config)
+
+    first = sut.jira
+    second = sut.jira
+
+    assert first is second
+    assert stand_in.requests["GET serverInfo"] == 1
+
+
+def test_jira_connection_pool_fits_concurrent_requests(config):
+    sut = IntegrationRegistry(config)
+
+    # pylint: disable=protected-access
+    adapter = sut.jira._j._session.get_adapter(config.data["jira"]["host"])
+
+    assert adapter._pool_maxsize == 32
+
+
+def test_jira_cache_is_not_created_when_not_configured(config):
+    assert IntegrationRegistry(config).jira_cache is None
+
+
+def test_jira_cache_is_shared(config, tmp_path):
+    config.data["jira"]["cache"] = {"path": str(tmp_path)}
+    sut = IntegrationRegistry(config)
+
+    first = sut.jira_cache
+    second = sut.jira_cache
+
+    assert isinstance(first, JiraResponseCache)
+    assert first is second
+
+
+def test_clients_read_snapshot_offline(config, stand_in, tmp_path):
+    config.data["jira"]["cache"] = {"path": str(tmp_path)}
+    snapshot_path = str(tmp_path / "snapshot.zip")
+    Snapshot(snapshot_path, recording=True).save()
+    sut = IntegrationRegistry(config, Snapshot(snapshot_path))
+
+    assert isinstance(sut.jira, OfflineJiraIntegration)
+    assert isinstance(sut.git, SnapshotGitIntegration)
+    assert sut.jira_cache is None
+    assert stand_in.requests["GET serverInfo"] == 0
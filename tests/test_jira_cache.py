@@ -0,0 +1,131 @@
+"""
+Jira response cache tests
+"""
+
+from unittest.mock import Mock
+
+import pytest
+
+from integration.jira_cache import (
+    COMPONENTS_RESOURCE,
+    ISSUES_RESOURCE,
+    JiraResponseCache,
+)
+
+
+@pytest.fixture(name="clock")
+def fixture_clock():
+    # manually advanced clock
+    return Mock(return_value=1000.0)
+
+
+@pytest.fixture(name="cache")
+def fixture_cache(tmp_path, clock):
+    return JiraResponseCache(
+        str(tmp_path), {COMPONENTS_RESOURCE: 60, ISSUES_RESOURCE: 0}, clock
+    )
+
+
+def test_first_request_is_miss(cache):
+    fetch = Mock(return_value=[{"name": "c1"}])
+
+    payload = cache.get_or_fetch(COMPONENTS_RESOURCE, "key", fetch)
+
+    assert payload == [{"name": "c1"}]
+    assert fetch.call_count == 1
+    assert (cache.stats.hits, cache.stats.misses) == (0, 1)
+
+
+def test_fresh_entry_is_served_without_fetch(cache, clock):
+    fetch = Mock(return_value=[{"name": "c1"}])
+    cache.get_or_fetch(COMPONENTS_RESOURCE, "key", fetch)
+    clock.return_value += 59
+
+    payload = cache.get_or_fetch(COMPONENTS_RESOURCE, "key", fetch)
+
+    assert payload == [{"name": "c1"}]
+    assert fetch.call_count == 1
+    assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+
+def test_expired_entry_is_fetched_again(cache, clock):
+    fetch = Mock(return_value=[{"name": "c1"}])
+    cache.get_or_fetch(COMPONENTS_RESOURCE, "key", fetch)
+    clock.return_value += 60
+
+    cache.get_or_fetch(COMPONENTS_RESOURCE, "key", fetch)
+
+    assert fetch.call_count == 2
+    assert cache.stats.misses == 2
+
+
+def test_entries_survive_cache_instances(tmp_path, clock):
+    fetch = Mock(return_value=[{"name": "c1"}])
+    JiraResponseCache(str(tmp_path), clock=clock).get_or_fetch(
+        COMPONENTS_RESOURCE, "key", fetch
+    )
+
+    other_run_cache = JiraResponseCache(str(tmp_path), clock=clock)
+    other_run_cache.get_or_fetch(COMPONENTS_RESOURCE, "key", fetch)
+
+    assert fetch.call_count == 1
+    assert other_run_cache.stats.hits == 1
+
+
+def test_different_keys_do_not_collide(cache):
+    cache.get_or_fetch(COMPONENTS_RESOURCE, "key1", lambda: ["first"])
+
+    payload = cache.get_or_fetch(COMPONENTS_RESOURCE, "key2", lambda: ["2nd"])
+
+    assert payload == ["2nd"]
+
+
+def test_stale_entry_with_same_validator_is_revalidated(cache):
+    fetch = Mock(return_value=[{"key": "T-1"}])
+    validate = Mock(return_value="1:2024-01-01T00:00:00.000+0000")
+    cache.get_or_fetch(ISSUES_RESOURCE, "jql", fetch, validate)
+
+    payload = cache.get_or_fetch(ISSUES_RESOURCE, "jql", fetch, validate)
+
+    assert payload == [{"key": "T-1"}]
+    assert fetch.call_count == 1
+    assert validate.call_count == 2
+    assert cache.stats.revalidated == 1
+
+
+def test_stale_entry_with_changed_validator_is_fetched_again(cache):
+    fetch = Mock(side_effect=[["old"], ["new"]])
+    validate = Mock(side_effect=["1:old", "1:new"])
+    cache.get_or_fetch(ISSUES_RESOURCE, "jql", fetch, validate)
+
+    payload = cache.get_or_fetch(ISSUES_RESOURCE, "jql", fetch, validate)
+
+    assert payload == ["new"]
+    assert cache.stats.misses == 2
+
+
+def test_invalidate_removes_only_resource_entries(cache):
+    cache.get_or_fetch(COMPONENTS_RESOURCE, "key", lambda: ["components"])
+    cache.get_or_fetch(ISSUES_RESOURCE, "key", lambda: ["issues"], lambda: "v")
+
+    cache.invalidate(ISSUES_RESOURCE)
+
+    fetch = Mock(return_value=["fresh"])
+    cache.get_or_fetch(COMPONENTS_RESOURCE, "key", fetch)
+    cache.get_or_fetch(ISSUES_RESOURCE, "key", fetch, lambda: "v")
+    assert fetch.call_count == 1
+
+
+def test_damaged_entry_is_treated_as_missing(cache, tmp_path):
+    cache.get_or_fetch(COMPONENTS_RESOURCE, "key", lambda: ["components"])
+    for entry_path in tmp_path.iterdir():
+        entry_path.write_text("{", encoding="utf-8")
+
+    payload = cache.get_or_fetch(COMPONENTS_RESOURCE, "key", lambda: ["new"])
+
+    assert payload == ["new"]
+
+
+def test_cache_directory_is_required():
+    with pytest.raises(ValueError):
+        JiraResponseCache("")
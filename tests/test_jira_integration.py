@@ -0,0 +1,529 @@
+"""
+Jira integration tests
+"""
+
+from unittest.mock import Mock, patch
+
+import pytest
+from jira import JIRAError
+from jira.client import ResultList
+
+from integration.jira import JiraIntegration
+from integration.jira_cache import JiraResponseCache
+from integration.jira_resilience import JiraOperationError
+
+# pylint: disable=protected-access
+
+
+def fake_search_issues(total: int):
+    """
+    Builds a fake `search_issues` function which returns issues
+    numbered from 0 to total - 1 split into pages.
+    """
+
+    def search_issues(_, **kwargs):
+        start_at = kwargs["startAt"]
+        keys = range(start_at, min(start_at + kwargs["maxResults"], total))
+        return ResultList(
+            [f"ISSUE-{key}" for key in keys], start_at, _total=total
+        )
+
+    return search_issues
+
+
+@pytest.fixture(name="jira_client")
+def fixture_jira_client():
+    with patch("integration.jira.JIRA") as jira_class_mock:
+        client = Mock()
+        jira_class_mock.return_value = client
+        yield client
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+@pytest.mark.parametrize(
+    "total, page_size, expected_calls",
+    [(0, 50, 1), (10, 50, 1), (50, 50, 1), (51, 50, 2), (1500, 50, 30)],
+)
+def test_get_issues_returns_all_pages_in_order(
+    jira_client, max_workers, total, page_size, expected_calls
+):
+    jira_client.search_issues.side_effect = fake_search_issues(total)
+    sut = JiraIntegration("host", "user", "pass", page_size, max_workers)
+
+    issues = sut.get_issues("project", "delivery")
+
+    assert issues == [f"ISSUE-{key}" for key in range(total)]
+    assert jira_client.search_issues.call_count == expected_calls
+
+
+def test_get_issues_uses_page_size(jira_client):
+    jira_client.search_issues.side_effect = fake_search_issues(25)
+    sut = JiraIntegration("host", "user", "pass", page_size=10, max_workers=3)
+
+    sut.get_issues("project", "delivery")
+
+    requested_starts = sorted(
+        c.kwargs["startAt"] for c in jira_client.search_issues.call_args_list
+    )
+    assert requested_starts == [0, 10, 20]
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_get_issues_raises_on_jira_error(jira_client, max_workers):
+    search_issues = fake_search_issues(200)
+
+    def failing_search_issues(jql, **kwargs):
+        if kwargs["startAt"] == 100:
+            raise JIRAError("error")
+        return search_issues(jql, **kwargs)
+
+    jira_client.search_issues.side_effect = failing_search_issues
+    sut = JiraIntegration("host", "user", "pass", 50, max_workers)
+
+    with pytest.raises(JiraOperationError) as error:
+        sut.get_issues("project", "delivery")
+    assert "startAt=100" in str(error.value)
+    assert len(sut.call_report.failed) == 1
+
+
+@pytest.mark.usefixtures("jira_client")
+@pytest.mark.parametrize("page_size, max_workers", [(0, 1), (50, 0)])
+def test_init_validates_paging_settings(page_size, max_workers):
+    with pytest.raises(ValueError):
+        JiraIntegration("host", "user", "pass", page_size, max_workers)
+
+
+@pytest.mark.parametrize(
+    "fields_profile, expected_fields",
+    [
+        ("", None),
+        ("status-only", ["components", "status"]),
+        (
+            "release-preview",
+            ["components", "status", "summary", "customfield_10646"],
+        ),
+    ],
+)
+def test_get_issues_requests_profile_fields(
+    jira_client, fields_profile, expected_fields
+):
+    jira_client.search_issues.side_effect = fake_search_issues(120)
+    sut = JiraIntegration("host", "user", "pass", 50, 2)
+
+    sut.get_issues("project", "delivery", fields_profile=fields_profile)
+
+    for call in jira_client.search_issues.call_args_list:
+        assert call.kwargs["fields"] == expected_fields
+
+
+@pytest.mark.usefixtures("jira_client")
+def test_get_issues_rejects_unknown_fields_profile():
+    sut = JiraIntegration("host", "user", "pass")
+
+    with pytest.raises(ValueError):
+        sut.get_issues("project", "delivery", fields_profile="unknown")
+
+
+def test_cached_components_are_not_requested_again(jira_client, tmp_path):
+    component = Mock()
+    component.raw = {"name": "c1", "description": "org/repo"}
+    jira_client.project_components.return_value = [component]
+    cache = JiraResponseCache(str(tmp_path))
+    sut = JiraIntegration("host", "user", "pass", cache=cache)
+
+    sut.get_components("project")
+    components = sut.get_components("project")
+
+    assert jira_client.project_components.call_count == 1
+    assert components[0].name == "c1"
+    assert components[0].description == "org/repo"
+
+
+def test_cached_issues_are_revalidated(jira_client, tmp_path):
+    search_issues = fake_search_issues(3)
+
+    def search_issues_with_validator(jql, **kwargs):
+        if "ORDER BY updated" in jql:
+            newest = Mock()
+            newest.fields.updated = "2024-01-01T00:00:00.000+0000"
+            return ResultList([newest], 0, _total=3)
+        page = search_issues(jql, **kwargs)
+        return ResultList(
+            [Mock(raw={"key": key}) for key in page],
+            kwargs["startAt"],
+            _total=3,
+        )
+
+    jira_client.search_issues.side_effect = search_issues_with_validator
+    cache = JiraResponseCache(str(tmp_path))
+    sut = JiraIntegration("host", "user", "pass", cache=cache)
+
+    sut.get_issues("project", "delivery")
+    issues = sut.get_issues("project", "delivery")
+
+    assert [issue.key for issue in issues] == ["ISSUE-0", "ISSUE-1", "ISSUE-2"]
+    # validator twice and a single page once
+    assert jira_client.search_issues.call_count == 3
+    assert cache.stats.revalidated == 1
+
+
+def fake_transition_issue(key: str, status_id: str = "10", issuetype="1"):
+    issue = Mock()
+    issue.key = key
+    issue.id = key.split("-")[1]
+    issue.fields.project.id = "100"
+    issue.fields.issuetype.id = issuetype
+    issue.fields.status.id = status_id
+    return issue
+
+
+@pytest.fixture(name="transition_client")
+def fixture_transition_client(jira_client):
+    issues = [
+        fake_transition_issue("T-1"),
+        fake_transition_issue("T-2"),
+        fake_transition_issue("T-3", status_id="20"),
+        fake_transition_issue("T-4", issuetype="2"),
+    ]
+    jira_client.search_issues.return_value = ResultList(issues, 0, _total=4)
+    jira_client.transitions.return_value = [
+        {"id": "11", "name": "In Progress"},
+        {"id": "31", "name": "Done"},
+    ]
+    # Jira Server has no bulk operations API
+    jira_client._session.post.side_effect = JIRAError(status_code=404)
+    return jira_client
+
+
+def test_transition_issues_resolves_transition_once_per_workflow_and_status(
+    transition_client,
+):
+    sut = JiraIntegration("host", "user", "pass", max_workers=4)
+
+    result = sut.transition_issues(
+        ["T-1", "T-2", "T-3", "T-4"], "done", "released"
+    )
+
+    assert result == {"T-1": "", "T-2": "", "T-3": "", "T-4": ""}
+    # T-1 and T-2 share workflow and status
+    assert transition_client.transitions.call_count == 3
+    transitioned = sorted(
+        c.args for c in transition_client.transition_issue.call_args_list
+    )
+    assert transitioned == [
+        ("T-1", "31"),
+        ("T-2", "31"),
+        ("T-3", "31"),
+        ("T-4", "31"),
+    ]
+    for c in transition_client.transition_issue.call_args_list:
+        assert c.kwargs["comment"] == "released"
+
+
+def test_transition_ids_are_reused_between_calls(transition_client):
+    sut = JiraIntegration("host", "user", "pass")
+
+    sut.transition_issues(["T-1"], "Done")
+    sut.transition_issues(["T-2"], "Done")
+
+    assert transition_client.transitions.call_count == 1
+
+
+def test_transition_issues_reports_per_issue_errors(transition_client):
+    def transition_issue(key, *_, **__):
+        if key == "T-2":
+            raise JIRAError(text="Field is required")
+
+    transition_client.transition_issue.side_effect = transition_issue
+    sut = JiraIntegration("host", "user", "pass", max_workers=2)
+
+    result = sut.transition_issues(["T-1", "T-2", "T-9"], "Done")
+
+    assert list(result) == ["T-1", "T-2", "T-9"]
+    assert result["T-1"] == ""
+    assert result["T-2"] == "Field is required"
+    assert "not found" in result["T-9"]
+
+
+def test_transition_issues_reports_unavailable_transition(transition_client):
+    sut = JiraIntegration("host", "user", "pass")
+
+    result = sut.transition_issues(["T-1"], "Closed")
+
+    assert result["T-1"]
+    transition_client.transition_issue.assert_not_called()
+
+
+@pytest.fixture(name="bulk_client")
+def fixture_bulk_client(transition_client):
+    transition_client._session.post.side_effect = None
+    transition_client._session.post.return_value.json.return_value = {
+        "taskId": "500"
+    }
+    transition_client._session.get.return_value.json.return_value = {
+        "taskId": "500",
+        "status": "COMPLETE",
+        "processedAccessibleIssues": [1, 2, 4],
+        "failedAccessibleIssues": {"3": ["Field is required"]},
+    }
+    return transition_client
+
+
+def test_transition_issues_uses_bulk_transition(bulk_client):
+    sut = JiraIntegration("host", "user", "pass", max_workers=4)
+
+    result = sut.transition_issues(["T-1", "T-2", "T-4"], "Done", "released")
+
+    assert result == {"T-1": "", "T-2": "", "T-4": ""}
+    assert bulk_client._session.post.call_count == 1
+    bulk_client.transition_issue.assert_not_called()
+    assert sorted(c.args for c in bulk_client.add_comment.call_args_list) == [
+        ("T-1", "released"),
+        ("T-2", "released"),
+        ("T-4", "released"),
+    ]
+
+
+def test_transition_issues_falls_back_for_bulk_rejected_issues(bulk_client):
+    sut = JiraIntegration("host", "user", "pass")
+
+    result = sut.transition_issues(["T-1", "T-3"], "Done", "released")
+
+    assert result == {"T-1": "", "T-3": ""}
+    bulk_client.transition_issue.assert_called_once_with(
+        "T-3", "31", comment="released"
+    )
+    bulk_client.add_comment.assert_called_once_with("T-1", "released")
+
+
+def test_failed_bulk_request_is_not_repeated_per_issue(bulk_client):
+    bulk_client._session.post.side_effect = JIRAError(status_code=502)
+    bulk_client.search_issues.side_effect = [
+        ResultList(
+            [fake_transition_issue("T-1"), fake_transition_issue("T-2")],
+            0,
+            _total=2,
+        ),
+        # Jira has transitioned T-1 before the response was lost
+        ResultList(
+            [
+                fake_transition_issue("T-1", status_id="30"),
+                fake_transition_issue("T-2"),
+            ],
+            0,
+            _total=2,
+        ),
+    ]
+    sut = JiraIntegration("host", "user", "pass")
+
+    result = sut.transition_issues(["T-1", "T-2"], "Done", "released")
+
+    assert result["T-1"] == ""
+    assert "unknown" in result["T-2"]
+    bulk_client.transition_issue.assert_not_called()
+    bulk_client.add_comment.assert_called_once_with("T-1", "released")
+
+
+def test_issues_of_dead_bulk_task_are_not_transitioned_again(bulk_client):
+    bulk_client._session.get.return_value.json.return_value = {
+        "taskId": "500",
+        "status": "DEAD",
+    }
+    sut = JiraIntegration("host", "user", "pass")
+
+    result = sut.transition_issues(["T-1"], "Done")
+
+    assert "unknown" in result["T-1"]
+    bulk_client.transition_issue.assert_not_called()
+
+
+def test_transition_issues_reports_not_added_comment(bulk_client):
+    bulk_client.add_comment.side_effect = JIRAError(text="Forbidden")
+    sut = JiraIntegration("host", "user", "pass")
+
+    result = sut.transition_issues(["T-1"], "Done", "released")
+
+    assert "Forbidden" in result["T-1"]
+
+
+def test_not_available_bulk_transition_is_not_requested_again(
+    transition_client,
+):
+    sut = JiraIntegration("host", "user", "pass")
+
+    first = sut.transition_issues(["T-1"], "Done")
+    second = sut.transition_issues(["T-2"], "Done")
+
+    assert first == {"T-1": ""} and second == {"T-2": ""}
+    assert transition_client._session.post.call_count == 1
+    assert transition_client.transition_issue.call_count == 2
+
+
+def test_transition_issues_falls_back_to_transition_by_name(jira_client):
+    jira_client.search_issues.side_effect = JIRAError("error")
+    sut = JiraIntegration("host", "user", "pass")
+
+    result = sut.transition_issues(["T-1", "T-2"], "Done", "released")
+
+    assert result == {"T-1": "", "T-2": ""}
+    jira_client.transition_issue.assert_any_call(
+        "T-1", "Done", comment="released"
+    )
+
+
+def fake_raw_search_issues(total: int):
+    """
+    Builds a fake `search_issues` function which returns JSON pages
+    """
+
+    def search_issues(_, json_result=False, **kwargs):
+        assert json_result
+        start_at = kwargs["startAt"]
+        keys = range(start_at, min(start_at + kwargs["maxResults"], total))
+        return {
+            "startAt": start_at,
+            "total": total,
+            "issues": [{"key": f"ISSUE-{key}"} for key in keys],
+        }
+
+    return search_issues
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_get_raw_issues_returns_json_dictionaries(jira_client, max_workers):
+    jira_client.search_issues.side_effect = fake_raw_search_issues(120)
+    sut = JiraIntegration("host", "user", "pass", 50, max_workers)
+
+    issues = sut.get_raw_issues("project", "delivery")
+
+    assert issues == [{"key": f"ISSUE-{key}"} for key in range(120)]
+
+
+def test_get_raw_issues_raises_on_jira_error(jira_client):
+    jira_client.search_issues.side_effect = JIRAError("error")
+    sut = JiraIntegration("host", "user", "pass")
+
+    with pytest.raises(JiraOperationError):
+        sut.get_raw_issues("project", "delivery")
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+@pytest.mark.parametrize("total", [0, 10, 120])
+def test_iter_raw_issues_yields_all_pages_in_order(
+    jira_client, max_workers, total
+):
+    jira_client.search_issues.side_effect = fake_raw_search_issues(total)
+    sut = JiraIntegration("host", "user", "pass", 50, max_workers)
+
+    issues = list(sut.iter_raw_issues("project", "delivery"))
+
+    assert issues == [{"key": f"ISSUE-{key}"} for key in range(total)]
+
+
+def test_iter_issues_prefetches_limited_number_of_pages(jira_client):
+    jira_client.search_issues.side_effect = fake_search_issues(500)
+    sut = JiraIntegration("host", "user", "pass", 50, max_workers=2)
+
+    issues = sut.iter_issues("project", "delivery")
+    first = next(issues)
+
+    assert first == "ISSUE-0"
+    # the first page and no more than two pages in the background
+    assert jira_client.search_issues.call_count <= 3
+    issues.close()
+
+
+def test_iter_issues_raises_on_first_page_error(jira_client):
+    jira_client.search_issues.side_effect = JIRAError("error")
+    sut = JiraIntegration("host", "user", "pass")
+
+    with pytest.raises(JiraOperationError):
+        list(sut.iter_issues("project", "delivery"))
+
+
+def test_iter_issues_raises_on_following_page_error(jira_client):
+    search_issues = fake_search_issues(200)
+
+    def failing_search_issues(jql, **kwargs):
+        if kwargs["startAt"] == 100:
+            raise JIRAError("error")
+        return search_issues(jql, **kwargs)
+
+    jira_client.search_issues.side_effect = failing_search_issues
+    sut = JiraIntegration("host", "user", "pass", 50)
+
+    with pytest.raises(JIRAError):
+        list(sut.iter_issues("project", "delivery"))
+
+
+def test_iter_issues_uses_cache(jira_client):
+    cache = Mock(spec=JiraResponseCache)
+    cache.get_or_fetch.return_value = [{"key": "ISSUE-0"}]
+    sut = JiraIntegration("host", "user", "pass", cache=cache)
+
+    issues = list(sut.iter_raw_issues("project", "delivery"))
+
+    assert issues == [{"key": "ISSUE-0"}]
+    jira_client.search_issues.assert_not_called()
+
+
+def test_several_deliveries_request_fix_versions(jira_client):
+    jira_client.search_issues.side_effect = fake_raw_search_issues(1)
+    sut = JiraIntegration("host", "user", "pass")
+
+    list(
+        sut.iter_raw_issues(
+            "project", ["d1", "d2"], fields_profile="status-only"
+        )
+    )
+
+    call = jira_client.search_issues.call_args
+    assert 'fixVersion in ("d1", "d2")' in call.args[0]
+    assert call.kwargs["fields"] == ["components", "status", "fixVersions"]
+
+
+def fake_version(name: str, released: bool, release_date: str = ""):
+    version = Mock()
+    version.name = name
+    version.released = released
+    version.archived = False
+    version.releaseDate = release_date
+    return version
+
+
+def test_versions_are_requested_once(jira_client):
+    jira_client.project_versions.return_value = [
+        fake_version("Nova 2. Delivery 1", True, "2023-01-01"),
+        fake_version("Nova 2. Delivery 2", False),
+    ]
+    sut = JiraIntegration("host", "user", "pass")
+
+    latest = sut.get_latest_released_version("project")
+    can_release = sut.can_release_version("project", "Nova 2. Delivery 2")
+    sut.mark_version_as_released("project", "Nova 2. Delivery 2")
+
+    assert latest.name == "Nova 2. Delivery 1"
+    assert can_release
+    assert jira_client.project_versions.call_count == 1
+    jira_client.get_project_version_by_name.assert_not_called()
+
+
+def test_versions_are_reloaded_after_release(jira_client):
+    version = fake_version("Nova 2. Delivery 2", False)
+    jira_client.project_versions.return_value = [version]
+    sut = JiraIntegration("host", "user", "pass")
+
+    sut.mark_version_as_released("project", "Nova 2. Delivery 2")
+    version.released = True
+
+    assert not sut.can_release_version("project", "Nova 2. Delivery 2")
+    version.update.assert_called_once_with(released=True)
+    assert jira_client.project_versions.call_count == 2
+
+
+def test_latest_released_version_is_required(jira_client):
+    jira_client.project_versions.return_value = []
+    sut = JiraIntegration("host", "user", "pass")
+
+    with pytest.raises(ValueError):
+        sut.get_latest_released_version("project")
@@ -3,7 +3,13 @@ Jira issues validation tests
 """
 from collections import namedtuple
 import pytest
-from jira_utils import parse_jira_issue, filter_jira_issue
+from core.nova_status import Status
+from jira_utils import (
+    get_raw_jira_issue_component_name,
+    get_raw_jira_issue_fix_versions,
+    parse_jira_issue,
+    parse_jira_issue_raw,
+)
 
 FakeComponent = namedtuple("FakeComponent", ["name"])
 FakeStatus = namedtuple("FakeStatus", ["name"])
@@ -74,35 +80,77 @@ def test_when_issue_is_valid(issue_key, issue_status):
     assert nova_task is not None
 
 
-@pytest.mark.parametrize(
-    "jira_cmp_name,nova_cmp_name,expected",
-    [
-        ("c1", "c1", True),
-        ("c1", "c2", False),
-        (" c1", "c1 ", True),
-        ("C1", "c1", True),
-        ("C1", "C1", True),
-        (" C1", " c1 ", True),
-    ],
-)
-def test_if_jira_issue_belongs_to_component(
-    jira_cmp_name, nova_cmp_name, expected
-):
+def test_when_issue_is_loaded_with_status_only_fields():
+    FakeStatusOnlyFields = namedtuple(
+        "FakeStatusOnlyFields", ["components", "status"]
+    )
     issue = FakeIssue(
-        FakeFields(
-            [FakeComponent(jira_cmp_name)],
-            FakeStatus("Selected For Release"),
-            "",
+        FakeStatusOnlyFields(
+            [FakeComponent("c1")], FakeStatus("Selected For Release")
         ),
         "issue key",
     )
-    result = filter_jira_issue(issue, nova_cmp_name)
-    assert result == expected
+    nova_task = parse_jira_issue(issue)  # type: ignore
+    assert nova_task.summary == ""
+    assert nova_task.deployment is None
 
 
-def test_when_jira_issue_has_no_component():
-    issue = FakeIssue(
-        FakeFields([], FakeStatus("Selected For Release"), ""), "issue key"
-    )
+def raw_issue(key="issue key", components=("c1",), status="Done", **fields):
+    return {
+        "key": key,
+        "fields": {
+            "components": [{"name": name} for name in components],
+            "status": {"name": status},
+            **fields,
+        },
+    }
+
+
+@pytest.mark.parametrize(
+    "issue",
+    [
+        {"fields": {}},
+        raw_issue(key=""),
+        raw_issue(key=None),
+        raw_issue(components=()),
+        raw_issue(components=("c1", "c2")),
+        raw_issue(status="invalid status"),
+    ],
+)
+def test_when_raw_issue_is_invalid(issue):
     with pytest.raises(ValueError):
-        filter_jira_issue(issue, "c1")
+        parse_jira_issue_raw(issue)
+
+
+def test_when_raw_issue_is_valid():
+    issue = raw_issue(summary="summary", customfield_10646="deploy")
+
+    nova_task = parse_jira_issue_raw(issue)
+
+    assert nova_task.name == "issue key"
+    assert nova_task.status == Status.DONE
+    assert nova_task.summary == "summary"
+    assert nova_task.deployment == "deploy"
+
+
+def test_when_raw_issue_is_loaded_with_status_only_fields():
+    nova_task = parse_jira_issue_raw(raw_issue())
+
+    assert nova_task.summary == ""
+    assert nova_task.deployment is None
+
+
+def test_raw_issue_component_name():
+    assert get_raw_jira_issue_component_name(raw_issue()) == "c1"
+
+
+def test_when_raw_issue_has_no_component_name():
+    with pytest.raises(ValueError):
+        get_raw_jira_issue_component_name(raw_issue(components=()))
+
+
+def test_raw_issue_fix_versions():
+    issue = raw_issue(fixVersions=[{"name": "v1"}, {"name": "v2"}])
+
+    assert get_raw_jira_issue_fix_versions(issue) == ["v1", "v2"]
+    assert get_raw_jira_issue_fix_versions(raw_issue()) == []
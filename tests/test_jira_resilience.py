@@ -0,0 +1,173 @@
+"""
+Jira calls deadlines, retries and hedging tests
+"""
+
+import random
+import threading
+from typing import Callable, Iterator
+from unittest.mock import Mock
+
+import pytest
+from jira import JIRAError
+from requests.exceptions import (  # type: ignore
+    ConnectionError as RequestsConnectionError,
+)
+
+from integration.jira_resilience import (
+    DEFAULT_POLICIES,
+    SEARCH_OPERATION,
+    JiraCallPolicy,
+    JiraCallRunner,
+    JiraOperationError,
+    policies_from_config,
+)
+
+
+def runner(**policy_args) -> JiraCallRunner:
+    policy = JiraCallPolicy(**{"deadline_sec": 5, "attempts": 3, **policy_args})
+    return JiraCallRunner(
+        {SEARCH_OPERATION: policy}, sleep=Mock(), rnd=random.Random(0)
+    )
+
+
+def test_successful_call_is_not_reported():
+    sut = runner()
+
+    assert sut.run(SEARCH_OPERATION, "jql", lambda: "result") == "result"
+    assert len(sut.report) == 0
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        JIRAError("unavailable", status_code=503),
+        JIRAError("too many requests", status_code=429),
+        RequestsConnectionError("reset"),
+    ],
+)
+def test_retryable_error_is_retried(error):
+    call = Mock(side_effect=[error, "result"])
+    sut = runner()
+
+    assert sut.run(SEARCH_OPERATION, "jql", call) == "result"
+    assert call.call_count == 2
+    assert sut.report.outcomes[0].succeeded
+    assert sut.report.outcomes[0].attempts == 2
+
+
+def test_backoff_pauses_are_jittered_and_bounded():
+    call = Mock(side_effect=JIRAError("unavailable", status_code=503))
+    sleep = Mock()
+    sut = JiraCallRunner(
+        {
+            SEARCH_OPERATION: JiraCallPolicy(
+                deadline_sec=60, attempts=4, backoff_sec=1, max_backoff_sec=3
+            )
+        },
+        sleep=sleep,
+        rnd=random.Random(0),
+    )
+
+    with pytest.raises(JiraOperationError):
+        sut.run(SEARCH_OPERATION, "jql", call)
+
+    pauses = [c.args[0] for c in sleep.call_args_list]
+    assert len(pauses) == 3
+    assert all(0 <= pause <= limit for pause, limit in zip(pauses, [1, 2, 3]))
+
+
+def test_failed_call_raises_with_report():
+    call = Mock(side_effect=JIRAError("unavailable", status_code=503))
+    sut = runner()
+
+    with pytest.raises(JiraOperationError) as error:
+        sut.run(SEARCH_OPERATION, "jql", call)
+
+    assert call.call_count == 3
+    assert error.value.status_code == 503
+    assert error.value.text == "unavailable"
+    assert error.value.outcome.attempts == 3
+    assert sut.report.failed == [error.value.outcome]
+    assert "[search] jql: failed after 3 attempt(s)" in str(sut.report)
+
+
+def test_not_retryable_error_is_not_retried():
+    call = Mock(side_effect=JIRAError("bad request", status_code=400))
+    sut = runner()
+
+    with pytest.raises(JiraOperationError):
+        sut.run(SEARCH_OPERATION, "jql", call)
+
+    assert call.call_count == 1
+
+
+def test_non_idempotent_call_is_not_retried():
+    call = Mock(side_effect=JIRAError("unavailable", status_code=503))
+    sut = runner()
+
+    with pytest.raises(JiraOperationError):
+        sut.run(SEARCH_OPERATION, "jql", call, idempotent=False)
+
+    assert call.call_count == 1
+
+
+def test_other_errors_are_raised_as_is():
+    sut = runner()
+
+    with pytest.raises(KeyError):
+        sut.run(SEARCH_OPERATION, "jql", Mock(side_effect=KeyError("key")))
+
+
+def test_hung_call_exceeds_deadline():
+    released = threading.Event()
+    sut = runner(deadline_sec=0.05)
+
+    with pytest.raises(JiraOperationError) as error:
+        sut.run(SEARCH_OPERATION, "jql", released.wait)
+    released.set()
+
+    assert error.value.outcome.deadline_exceeded
+
+
+def test_slow_call_is_hedged():
+    released = threading.Event()
+    responses: Iterator[Callable[[], object]] = iter(
+        [released.wait, lambda: "hedged result"]
+    )
+    sut = runner(hedge_after_sec=0.01)
+
+    def call():
+        return next(responses)()
+
+    result = sut.run(SEARCH_OPERATION, "jql", call)
+    released.set()
+
+    assert result == "hedged result"
+    assert sut.report.outcomes[0].hedged == 1
+
+
+def test_unknown_operation_is_rejected():
+    with pytest.raises(ValueError):
+        runner().run("unknown", "target", lambda: None)
+
+
+@pytest.mark.parametrize("deadline, attempts", [(0, 1), (1, 0)])
+def test_policy_is_validated(deadline, attempts):
+    with pytest.raises(ValueError):
+        JiraCallPolicy(deadline, attempts)
+
+
+def test_policies_from_config_override_defaults():
+    policies = policies_from_config(
+        {"search": {"deadline": 10, "hedgeAfter": 2}, "versions": {}}
+    )
+
+    assert policies[SEARCH_OPERATION] == JiraCallPolicy(
+        deadline_sec=10, attempts=3, hedge_after_sec=2
+    )
+    assert policies["versions"] == DEFAULT_POLICIES["versions"]
+
+
+def test_policies_from_config_reject_unknown_operation():
+    with pytest.raises(ValueError):
+        policies_from_config({"unknown": {"deadline": 10}})
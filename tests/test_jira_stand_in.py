@@ -0,0 +1,135 @@
+"""
+Local Jira stand-in server tests, the real Jira client is used
+"""
+
+from unittest.mock import Mock
+
+import pytest
+
+from core.nova_component import NovaComponent
+from integration.jira import JiraIntegration
+from nova_component_catalog import NovaComponentCatalog
+from nova_component_parser import NovaComponentParser
+from nova_release_repository import NovaReleaseRepository
+from perf.jira_stand_in import (
+    JiraDataset,
+    JiraStandIn,
+    JiraStandInServer,
+    StandInError,
+)
+
+DELIVERY = "Nova 2. Delivery 3"
+
+
+@pytest.fixture(name="dataset")
+def fixture_dataset():
+    return JiraDataset.generate(components=12, issues=300, deliveries=3)
+
+
+@pytest.fixture(name="stand_in")
+def fixture_stand_in(dataset):
+    return JiraStandIn(dataset, latency_ms=1, jitter_ms=1, seed=0)
+
+
+@pytest.fixture(name="jira")
+def fixture_jira(stand_in):
+    with JiraStandInServer(stand_in) as server:
+        yield JiraIntegration(server.url, "user", "password", 50, 4)
+
+
+def delivery_issues(dataset, delivery=DELIVERY):
+    return [i for i in dataset.issues if i.fix_version == delivery]
+
+
+def test_dataset_is_reproducible():
+    first = JiraDataset.generate(components=5, issues=20, seed=1)
+    second = JiraDataset.generate(components=5, issues=20, seed=1)
+
+    assert [(i.key, i.component, i.status) for i in first.issues] == [
+        (i.key, i.component, i.status) for i in second.issues
+    ]
+
+
+def test_search_returns_all_pages(jira, dataset, stand_in):
+    issues = jira.get_raw_issues(
+        "NOVA", DELIVERY, fields_profile="release-preview"
+    )
+
+    assert [i["key"] for i in issues] == [
+        i.key for i in delivery_issues(dataset)
+    ]
+    assert stand_in.requests["GET search"] > 1
+
+
+def test_repository_loads_release(jira, dataset):
+    config = Mock()
+    config.data = {
+        "github": {"username": "", "accessToken": ""},
+        "bitbucket": {"username": "", "password": ""},
+    }
+    repository = NovaReleaseRepository(
+        jira,
+        NovaComponentCatalog(jira, parser=NovaComponentParser(config=config)),
+    )
+
+    release = repository.get("NOVA", "2", "3")
+
+    assert sum(len(c.tasks) for c in release) == len(delivery_issues(dataset))
+
+
+def test_versions_are_updated(jira):
+    assert jira.get_latest_released_version("NOVA").name == "Nova 2. Delivery 2"
+    assert jira.can_release_version("NOVA", DELIVERY)
+
+    jira.mark_version_as_released("NOVA", DELIVERY)
+
+    assert not jira.can_release_version("NOVA", DELIVERY)
+
+
+def test_issues_are_transitioned(jira, dataset, stand_in):
+    keys = [i.key for i in delivery_issues(dataset) if i.status != "Done"][:5]
+
+    results = jira.transition_issues(keys, "Done", "released")
+
+    assert results == {key: "" for key in keys}
+    assert all(
+        i.status == "Done" and i.comments == ["released"]
+        for i in dataset.issues
+        if i.key in keys
+    )
+    statuses = {
+        i["key"]: i["fields"]["status"]["name"]
+        for i in jira.get_raw_issues(
+            "NOVA", DELIVERY, fields_profile="status-only"
+        )
+    }
+    assert all(statuses[key] == "Done" for key in keys)
+    assert stand_in.requests["POST bulk issues *"] == 1
+    assert stand_in.requests["POST issue * transitions"] == 0
+
+
+def test_issues_are_transitioned_one_by_one_without_bulk_api(
+    jira, dataset, stand_in
+):
+    stand_in.bulk_operations = False
+    keys = [i.key for i in delivery_issues(dataset) if i.status != "Done"][:5]
+
+    results = jira.transition_issues(keys, "Done", "released")
+
+    assert results == {key: "" for key in keys}
+    assert stand_in.requests["POST issue * transitions"] == len(keys)
+
+
+def test_unsupported_jql_is_rejected(stand_in):
+    with pytest.raises(StandInError):
+        stand_in.handle("GET", "search", {"jql": ["assignee=me"]}, None)
+
+
+def test_unknown_resource_is_not_found(stand_in):
+    with pytest.raises(StandInError):
+        stand_in.handle("GET", "issue/NOVA-1/comment", {}, None)
+
+
+def teardown_module():
+    """Teardown module"""
+    NovaComponent.longest_component_name = 0
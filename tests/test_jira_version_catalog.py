@@ -0,0 +1,83 @@
+"""
+Jira version catalog tests
+"""
+
+from typing import Optional
+from unittest.mock import Mock
+
+import pytest
+
+from integration.jira_version_catalog import JiraVersionCatalog
+
+
+def fake_version(
+    name: str, released: bool, archived: bool, release_date: Optional[str]
+):
+    version = Mock(
+        released=released, archived=archived, releaseDate=release_date
+    )
+    # name is Mock constructor argument, so it is set separately
+    version.name = name
+    return version
+
+
+@pytest.fixture(name="sut")
+def fixture_sut():
+    return JiraVersionCatalog(
+        [
+            fake_version("Nova 2. Delivery 2", True, True, "2023-01-10"),
+            fake_version("Nova 2. Delivery 3", True, False, "2023-02-10"),
+            fake_version(
+                "Nova 2. Delivery 3. Hotfix 1", True, False, "2023-02-15"
+            ),
+            fake_version("Nova 2. Delivery 1", True, True, "2022-12-10"),
+            fake_version("Nova 2. Delivery 4", False, False, None),
+        ]
+    )
+
+
+def test_get_by_name(sut):
+    version = sut.get("Nova 2. Delivery 3")
+
+    assert version is not None
+    assert version.releaseDate == "2023-02-10"
+    assert sut.get("Nova 2. Delivery 5") is None
+
+
+def test_latest_released_excludes_hotfixes(sut):
+    assert sut.latest_released().name == "Nova 2. Delivery 3"
+
+
+def test_latest_released_with_hotfixes(sut):
+    latest = sut.latest_released(include_hotfixes=True)
+
+    assert latest.name == "Nova 2. Delivery 3. Hotfix 1"
+
+
+def test_latest_released_when_nothing_is_released():
+    sut = JiraVersionCatalog(
+        [fake_version("Nova 2. Delivery 1", False, False, None)]
+    )
+
+    assert sut.latest_released() is None
+
+
+def test_select_by_flags(sut):
+    assert [v.name for v in sut.select(archived=True)] == [
+        "Nova 2. Delivery 2",
+        "Nova 2. Delivery 1",
+    ]
+    assert [v.name for v in sut.select(released=False)] == [
+        "Nova 2. Delivery 4"
+    ]
+    assert [v.name for v in sut.select(hotfix=True)] == [
+        "Nova 2. Delivery 3. Hotfix 1"
+    ]
+    assert len(sut.select()) == len(sut) == 5
+
+
+def test_select_by_several_flags(sut):
+    versions = sut.select(released=True, archived=False, hotfix=False)
+
+    assert [v.name for v in versions] == ["Nova 2. Delivery 3"]
+    assert not JiraVersionCatalog([]).select(released=True)
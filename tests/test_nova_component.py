@@ -369,3 +369,33 @@ def test_describe_status_returns_text_with_3_columns(mock_config):
 
     assert text_status
     assert text_status.count("|") == 2
+
+
+def test_upsert_task_replaces_task_with_same_name():
+    component = NovaComponent("foo", None)
+    component.add_task(NovaTask("boo", Status.IN_DEVELOPMENT))
+    component.add_task(NovaTask("boo2", Status.IN_DEVELOPMENT))
+
+    component.upsert_task(NovaTask("boo", Status.DONE))
+
+    assert [(t.name, t.status) for t in component.tasks] == [
+        ("boo", Status.DONE),
+        ("boo2", Status.IN_DEVELOPMENT),
+    ]
+
+
+def test_upsert_task_adds_new_task():
+    component = NovaComponent("foo", None)
+
+    component.upsert_task(NovaTask("boo", Status.DONE))
+
+    assert len(component.tasks) == 1
+
+
+def test_remove_task():
+    component = NovaComponent("foo", None)
+    component.add_task(NovaTask("boo", Status.DONE))
+
+    assert component.remove_task("boo")
+    assert not component.remove_task("boo")
+    assert not component.tasks
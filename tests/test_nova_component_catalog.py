@@ -0,0 +1,150 @@
+"""
+Nova component catalog tests
+"""
+
+from collections import namedtuple
+from unittest.mock import Mock, patch
+
+import pytest
+
+from core.cvs import GitCloudService
+from core.nova_component import NovaComponent, NovaEmptyComponent
+from core.nova_component_type import NovaComponentType
+from core.nova_task import NovaTask
+from core.nova_status import Status
+from integration.jira import JiraIntegration
+from nova_component_catalog import NovaComponentCatalog
+from nova_component_parser import NovaComponentParser
+
+FakeJiraComponent = namedtuple("FakeJiraComponent", ["name", "description"])
+
+
+@pytest.fixture(name="clock")
+def fixture_clock():
+    # manually advanced clock
+    return Mock(return_value=0.0)
+
+
+@pytest.fixture(name="jira")
+def fixture_jira():
+    mock_config = Mock()
+    mock_config.data = {
+        "github": {"username": "", "accessToken": ""},
+        "bitbucket": {"username": "", "password": ""},
+    }
+    with patch("core.cvs.Config", return_value=mock_config):
+        jira = Mock(spec=JiraIntegration)
+        jira.get_components.return_value = [
+            FakeJiraComponent("Svc", "https://github.com/org/svc"),
+            FakeJiraComponent("Svc.Client", "https://github.com/org/svc"),
+            FakeJiraComponent("Infra.Library", "https://bitbucket.org/infra"),
+            FakeJiraComponent("Svc.Contracts", "https://github.com/org/svc"),
+            FakeJiraComponent("N/A", ""),
+        ]
+        yield jira
+
+
+@pytest.fixture(name="sut")
+def fixture_sut(jira, clock):
+    return NovaComponentCatalog(jira, 60, clock)
+
+
+def test_components_are_loaded_once_within_ttl(sut, jira, clock):
+    sut.components("project")
+    sut.by_type("project", NovaComponentType.SERVICE)
+    clock.return_value = 59
+    sut.get("project", "svc")
+
+    assert jira.get_components.call_count == 1
+
+
+def test_components_are_reloaded_after_ttl(sut, jira, clock):
+    sut.components("project")
+    clock.return_value = 60
+    sut.components("project")
+
+    assert jira.get_components.call_count == 2
+
+
+def test_invalidate_forces_reload(sut, jira):
+    sut.components("project")
+    sut.invalidate("project")
+    sut.components("project")
+
+    assert jira.get_components.call_count == 2
+
+
+def test_projects_are_cached_separately(sut, jira):
+    sut.components("project1")
+    sut.components("project2")
+
+    assert jira.get_components.call_count == 2
+
+
+def test_components_include_empty_component(sut):
+    components = sut.components("project")
+
+    assert len(components) == 5
+    assert isinstance(components[-1], NovaEmptyComponent)
+
+
+def test_components_are_copies_without_tasks(sut):
+    component = sut.components("project")[0]
+    component.add_task(NovaTask("T-1", Status.DONE))
+
+    assert not sut.components("project")[0].tasks
+    assert sut.components("project")[0].repo is component.repo
+
+
+def test_get_by_name_is_case_insensitive(sut):
+    component = sut.get("project", " svc.client ")
+
+    assert component is not None
+    assert component.name == "Svc.Client"
+    assert sut.get("project", "unknown") is None
+
+
+def test_by_type_keeps_jira_order(sut):
+    packages = sut.by_type(
+        "project", NovaComponentType.PACKAGE, NovaComponentType.PACKAGE_LIBRARY
+    )
+
+    assert [p.name for p in packages] == [
+        "Svc.Client",
+        "Infra.Library",
+        "Svc.Contracts",
+    ]
+
+
+def test_by_type_excludes_empty_components(sut):
+    services = sut.by_type("project", NovaComponentType.SERVICE)
+
+    assert [s.name for s in services] == ["Svc"]
+
+
+def test_by_git_cloud(sut):
+    components = sut.by_git_cloud("project", GitCloudService.BITBUCKET)
+
+    assert [c.name for c in components] == ["Infra.Library"]
+
+
+def test_injected_parser_is_used(jira, clock):
+    parser = NovaComponentParser(
+        config=Mock(
+            data={
+                "github": {"username": "", "accessToken": ""},
+                "bitbucket": {"username": "", "password": ""},
+            }
+        )
+    )
+    sut = NovaComponentCatalog(jira, 60, clock, parser)
+
+    with patch.object(parser, "parse", wraps=parser.parse) as parse:
+        sut.components("project")
+
+    assert parse.call_count == 5
+
+
+def teardown_module():
+    """Teardown module"""
+    NovaComponent.longest_component_name = 0
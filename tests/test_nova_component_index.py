@@ -0,0 +1,57 @@
+"""
+Nova component index tests
+"""
+
+import pytest
+
+from core.nova_component_index import ComponentIndex, normalize_component_name
+
+
+@pytest.mark.parametrize(
+    "name, expected",
+    [("c1", "c1"), (" C1 ", "c1"), ("Service.Client", "service.client")],
+)
+def test_normalize_component_name(name, expected):
+    assert normalize_component_name(name) == expected
+
+
+def test_items_are_grouped_by_normalized_name():
+    items = [("c1", 1), (" C1", 2), ("c2", 3), ("c1 ", 4)]
+
+    sut = ComponentIndex(lambda item: item[0], items)
+
+    assert [value for _, value in sut.get("c1")] == [1, 2, 4]
+    assert [value for _, value in sut.get("C2")] == [3]
+    assert len(sut) == 2
+
+
+def test_unknown_component_has_no_items():
+    sut = ComponentIndex(lambda item: item, ["c1"])
+
+    assert not sut.get("c2")
+    assert "c2" not in sut
+    assert " C1 " in sut
+
+
+def test_get_returns_copy_of_bucket():
+    sut = ComponentIndex(lambda item: item, ["c1"])
+
+    sut.get("c1").append("c1")
+
+    assert sut.get("c1") == ["c1"]
+
+
+def test_items_can_be_added_later():
+    sut: ComponentIndex[str] = ComponentIndex(lambda item: item)
+
+    sut.add("c1")
+
+    assert list(sut) == ["c1"]
+
+
+def test_key_errors_are_propagated():
+    def key(_):
+        raise ValueError("Issue has no component assigned")
+
+    with pytest.raises(ValueError):
+        ComponentIndex(key, ["issue"])
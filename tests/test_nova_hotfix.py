@@ -0,0 +1,46 @@
+"""
+Nova hotfix tests
+"""
+
+from core.nova_component import NovaComponent
+from core.nova_hotfix import NovaHotfix
+from core.nova_release import NovaRelease
+
+
+def test_hotfix_title_is_jira_fix_version_name():
+    hotfix = NovaHotfix("project", "2", "42", "1")
+
+    assert hotfix.title == "Nova 2. Delivery 42. Hotfix 1"
+
+
+def test_unchanged_components_are_taken_from_base():
+    base = NovaRelease("project", "2", "42")
+    for name in ["svc1", "svc2", "svc3"]:
+        base.add_component(NovaComponent(name, None))
+    hotfix = NovaHotfix("project", "2", "42", "1", base)
+    hotfix.add_component(NovaComponent("svc2", None))
+
+    unchanged = hotfix.get_unchanged_components()
+
+    assert [c.name for c in unchanged] == ["svc1", "svc3"]
+
+
+def test_unchanged_components_are_matched_by_normalized_name():
+    base = NovaRelease("project", "2", "42")
+    for name in ["svc1", "svc2"]:
+        base.add_component(NovaComponent(name, None))
+    hotfix = NovaHotfix("project", "2", "42", "1", base)
+    hotfix.add_component(NovaComponent(" SVC2", None))
+
+    unchanged = hotfix.get_unchanged_components()
+
+    assert [c.name for c in unchanged] == ["svc1"]
+
+
+def test_hotfix_without_base_has_no_unchanged_components():
+    assert not NovaHotfix("project", "2", "42", "1").get_unchanged_components()
+
+
+def teardown_module():
+    """Teardown module"""
+    NovaComponent.longest_component_name = 0
@@ -76,6 +76,7 @@ def test_get_component_by_name_strict_equality():
 
     component = sut.get_component_by_name("name1!")
     assert component == fake_component1
+    assert sut.get_component_by_name(" NAME1 !") == fake_component1
 
 
 def test_get_component_by_name_strict_equality_special_symbol_used_twice():
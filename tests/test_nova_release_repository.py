@@ -0,0 +1,405 @@
+"""
+Nova release repository tests
+"""
+
+from collections import namedtuple
+from unittest.mock import Mock, patch
+
+import pytest
+
+from core.nova_component import NovaComponent
+from core.nova_status import Status
+import jira_utils as ju
+from integration.jira import JiraIntegration
+from nova_release_repository import NovaReleaseRepository
+
+FakeJiraComponent = namedtuple("FakeJiraComponent", ["name", "description"])
+
+
+def fake_issue(
+    key: str,
+    component_name: str,
+    status: str,
+    fix_versions: tuple[str, ...] = ("Nova 2. Delivery 5",),
+) -> dict:
+    return {
+        "key": key,
+        "fields": {
+            "components": [{"name": component_name}],
+            "status": {"name": status},
+            "summary": key,
+            "fixVersions": [{"name": name} for name in fix_versions],
+        },
+    }
+
+
+@pytest.fixture(name="mock_config")
+def fixture_mock_config():
+    mock_config = Mock()
+    mock_config.data = {
+        "github": {"username": "", "accessToken": ""},
+        "bitbucket": {"username": "", "password": ""},
+    }
+    return mock_config
+
+
+@pytest.fixture(name="jira")
+def fixture_jira(mock_config):
+    with patch("core.cvs.Config", return_value=mock_config):
+        jira = Mock(spec=JiraIntegration)
+        jira.get_components.return_value = [
+            FakeJiraComponent("svc1", "https://github.com/org/svc1"),
+            FakeJiraComponent("svc2", "https://github.com/org/svc2"),
+            FakeJiraComponent("n/a", ""),
+        ]
+        jira.iter_raw_issues.side_effect = lambda *_, **__: iter(
+            [
+                fake_issue("T-1", "svc1", "Selected For Release"),
+                fake_issue("T-2", "svc1", "In Development"),
+                fake_issue("T-3", "n/a", "Unknown Status"),
+                fake_issue("T-4", "unknown", "Unknown Status"),
+            ]
+        )
+        yield jira
+
+
+def test_get_groups_tasks_by_component(jira):
+    sut = NovaReleaseRepository(jira)
+
+    release = sut.get("project", "2", "5")
+
+    assert [c.name for c in release] == ["svc1"]
+    assert [t.name for t in list(release)[0].tasks] == ["T-1", "T-2"]
+
+
+def test_get_streams_issues(jira):
+    sut = NovaReleaseRepository(jira)
+
+    sut.get("project", "2", "5")
+
+    jira.iter_raw_issues.assert_called_once()
+    jira.get_raw_issues.assert_not_called()
+
+
+def test_get_many_splits_issues_by_fix_version(jira):
+    jira.iter_raw_issues.side_effect = lambda *_, **__: iter(
+        [
+            fake_issue("T-1", "svc1", "Done", ("Nova 2. Delivery 5",)),
+            fake_issue("T-2", "svc2", "Done", ("Nova 2. Delivery 6",)),
+            fake_issue("T-3", "svc1", "Done", ("Nova 2. Delivery 6",)),
+            fake_issue("T-4", "svc1", "Done", ("Nova 2. Delivery 7",)),
+        ]
+    )
+    sut = NovaReleaseRepository(jira)
+
+    releases = sut.get_many("project", [("2", "5"), ("2", "6")])
+
+    assert [r.title for r in releases] == [
+        "Nova 2. Delivery 5",
+        "Nova 2. Delivery 6",
+    ]
+    assert [(c.name, [t.name for t in c.tasks]) for c in releases[0]] == [
+        ("svc1", ["T-1"])
+    ]
+    assert [(c.name, [t.name for t in c.tasks]) for c in releases[1]] == [
+        ("svc1", ["T-3"]),
+        ("svc2", ["T-2"]),
+    ]
+
+
+def test_get_many_uses_single_search_and_catalog_load(jira):
+    sut = NovaReleaseRepository(jira)
+
+    sut.get_many("project", [("2", "5"), ("2", "6"), ("2", "7")])
+
+    jira.iter_raw_issues.assert_called_once()
+    assert jira.iter_raw_issues.call_args.args[1] == [
+        "Nova 2. Delivery 5",
+        "Nova 2. Delivery 6",
+        "Nova 2. Delivery 7",
+    ]
+    jira.get_components.assert_called_once()
+
+
+def test_get_many_puts_issue_into_every_fix_version(jira):
+    jira.iter_raw_issues.side_effect = lambda *_, **__: iter(
+        [
+            fake_issue(
+                "T-1",
+                "svc1",
+                "Done",
+                ("Nova 2. Delivery 5", "Nova 2. Delivery 6"),
+            ),
+        ]
+    )
+    sut = NovaReleaseRepository(jira)
+
+    releases = sut.get_many("project", [("2", "5"), ("2", "6")])
+
+    assert all(len(list(release)) == 1 for release in releases)
+    assert list(releases[0])[0] is not list(releases[1])[0]
+
+
+def test_get_many_requires_deliveries(jira):
+    with pytest.raises(ValueError):
+        NovaReleaseRepository(jira).get_many("project", [])
+
+
+def test_refresh_requires_loaded_release(jira):
+    sut = NovaReleaseRepository(jira)
+    release = sut.get("project", "2", "5")
+
+    with pytest.raises(ValueError):
+        NovaReleaseRepository(jira).refresh(release)
+
+
+def test_refresh_requests_only_recently_updated_issues(jira):
+    sut = NovaReleaseRepository(jira)
+    release = sut.get("project", "2", "5")
+    jira.get_raw_issues.return_value = []
+
+    with patch("time.monotonic", return_value=10**6):
+        sut.refresh(release)
+
+    updated_within_min = jira.get_raw_issues.call_args.kwargs[
+        "updated_within_min"
+    ]
+    assert updated_within_min > 0
+
+
+def test_refresh_updates_changed_task(jira):
+    sut = NovaReleaseRepository(jira)
+    release = sut.get("project", "2", "5")
+    jira.get_raw_issues.return_value = [fake_issue("T-2", "svc1", "Done")]
+
+    sut.refresh(release)
+
+    component = release.get_component_by_name("svc1")
+    assert component is not None
+    assert [(t.name, t.status) for t in component.tasks] == [
+        ("T-1", Status.READY_FOR_RELEASE),
+        ("T-2", Status.DONE),
+    ]
+
+
+def test_refresh_adds_component_with_first_task(jira):
+    sut = NovaReleaseRepository(jira)
+    release = sut.get("project", "2", "5")
+    jira.get_raw_issues.return_value = [fake_issue("T-4", "svc2", "Open")]
+
+    sut.refresh(release)
+
+    assert [c.name for c in release] == ["svc1", "svc2"]
+
+
+def test_refresh_moves_task_between_components(jira):
+    sut = NovaReleaseRepository(jira)
+    release = sut.get("project", "2", "5")
+    jira.get_raw_issues.return_value = [
+        fake_issue("T-1", "svc2", "Open"),
+        fake_issue("T-2", "svc2", "Open"),
+    ]
+
+    sut.refresh(release)
+
+    assert [c.name for c in release] == ["svc2"]
+    assert len(list(release)[0].tasks) == 2
+
+
+@pytest.mark.parametrize("component_name", ["unknown", "n/a"])
+def test_refresh_removes_task_moved_to_unknown_component(jira, component_name):
+    sut = NovaReleaseRepository(jira)
+    release = sut.get("project", "2", "5")
+    jira.get_raw_issues.return_value = [
+        fake_issue("T-2", component_name, "Open")
+    ]
+
+    sut.refresh(release)
+
+    component = release.get_component_by_name("svc1")
+    assert component is not None
+    assert [t.name for t in component.tasks] == ["T-1"]
+
+    jira.get_raw_issues.return_value = [
+        fake_issue("T-1", component_name, "Open")
+    ]
+    sut.refresh(release)
+
+    assert not list(release)
+
+
+def test_refresh_removes_task_without_component(jira):
+    sut = NovaReleaseRepository(jira)
+    release = sut.get("project", "2", "5")
+    componentless_issue = fake_issue("T-2", "svc1", "Open")
+    componentless_issue["fields"]["components"] = []
+    jira.get_raw_issues.return_value = [componentless_issue]
+
+    sut.refresh(release)
+
+    component = release.get_component_by_name("svc1")
+    assert component is not None
+    assert [t.name for t in component.tasks] == ["T-1"]
+
+
+def test_refresh_skips_issue_in_unknown_status(jira):
+    sut = NovaReleaseRepository(jira)
+    release = sut.get("project", "2", "5")
+    jira.get_raw_issues.return_value = [
+        fake_issue("T-1", "svc1", "Blocked"),
+        fake_issue("T-2", "svc1", "Done"),
+    ]
+
+    sut.refresh(release)
+
+    component = release.get_component_by_name("svc1")
+    assert component is not None
+    assert [(t.name, t.status) for t in component.tasks] == [
+        ("T-1", Status.READY_FOR_RELEASE),
+        ("T-2", Status.DONE),
+    ]
+
+
+def test_status_only_refresh_keeps_task_details(jira):
+    sut = NovaReleaseRepository(jira)
+    release = sut.get("project", "2", "5")
+    status_only_issue = fake_issue("T-2", "svc1", "Done")
+    del status_only_issue["fields"]["summary"]
+    jira.get_raw_issues.return_value = [status_only_issue]
+
+    sut.refresh(release, ju.STATUS_ONLY_FIELDS_PROFILE)
+
+    component = release.get_component_by_name("svc1")
+    assert component is not None
+    assert [(t.name, t.status, t.summary) for t in component.tasks] == [
+        ("T-1", Status.READY_FOR_RELEASE, "T-1"),
+        ("T-2", Status.DONE, "T-2"),
+    ]
+
+
+def test_task_details_are_loaded_once_for_chosen_component(jira):
+    sut = NovaReleaseRepository(jira)
+    release = sut.get("project", "2", "5", ju.STATUS_ONLY_FIELDS_PROFILE)
+    component = release.get_component_by_name("svc1")
+    assert component is not None
+    detailed_issue = fake_issue("T-1", "svc1", "Selected For Release")
+    detailed_issue["fields"]["customfield_10646"] = "restart"
+    jira.get_raw_issues.return_value = [detailed_issue]
+
+    sut.load_task_details(release, component)
+    sut.load_task_details(release, component)
+
+    jira.get_raw_issues.assert_called_once_with(
+        "project",
+        release.title,
+        "svc1",
+        fields_profile=ju.RELEASE_PREVIEW_FIELDS_PROFILE,
+    )
+    assert component.tasks[0].deployment == "restart"
+
+
+def test_task_details_skip_issue_in_unknown_status(jira):
+    sut = NovaReleaseRepository(jira)
+    release = sut.get("project", "2", "5", ju.STATUS_ONLY_FIELDS_PROFILE)
+    component = release.get_component_by_name("svc1")
+    assert component is not None
+    jira.get_raw_issues.return_value = [
+        fake_issue("T-1", "svc1", "Blocked"),
+        fake_issue("T-2", "svc1", "In Development"),
+    ]
+
+    sut.load_task_details(release, component)
+
+    assert [(t.name, t.status) for t in component.tasks] == [
+        ("T-1", Status.READY_FOR_RELEASE),
+        ("T-2", Status.IN_DEVELOPMENT),
+    ]
+
+
+def test_task_details_are_not_requested_when_loaded_with_release(jira):
+    sut = NovaReleaseRepository(jira)
+    release = sut.get("project", "2", "5")
+    component = release.get_component_by_name("svc1")
+    assert component is not None
+
+    sut.load_task_details(release, component)
+
+    jira.get_raw_issues.assert_not_called()
+
+
+def test_task_details_are_reloaded_after_new_task_is_added(jira):
+    sut = NovaReleaseRepository(jira)
+    release = sut.get("project", "2", "5", ju.STATUS_ONLY_FIELDS_PROFILE)
+    component = release.get_component_by_name("svc1")
+    assert component is not None
+    jira.get_raw_issues.return_value = []
+    sut.load_task_details(release, component)
+    jira.get_raw_issues.return_value = [fake_issue("T-5", "svc1", "Open")]
+
+    sut.refresh(release, ju.STATUS_ONLY_FIELDS_PROFILE)
+    sut.load_task_details(release, component)
+
+    assert jira.get_raw_issues.call_count == 3
+
+
+def test_get_hotfix_keeps_only_changed_components(jira):
+    sut = NovaReleaseRepository(jira)
+    base = sut.get("project", "2", "5")
+    hotfix_version = ("Nova 2. Delivery 5", "Nova 2. Delivery 5. Hotfix 1")
+    jira.iter_raw_issues.side_effect = lambda *_, **__: iter(
+        [
+            # released with the base delivery
+            fake_issue("T-1", "svc1", "Done", hotfix_version),
+            fake_issue("T-5", "svc2", "Done", hotfix_version[1:]),
+        ]
+    )
+
+    hotfix = sut.get_hotfix(base, "1")
+
+    assert hotfix.title == "Nova 2. Delivery 5. Hotfix 1"
+    assert jira.iter_raw_issues.call_args.args[1] == [hotfix.title]
+    assert [c.name for c in hotfix] == ["svc2"]
+    assert [c.name for c in hotfix.get_unchanged_components()] == ["svc1"]
+
+
+def test_refresh_adds_component_with_new_hotfix_task(jira):
+    sut = NovaReleaseRepository(jira)
+    base = sut.get("project", "2", "5")
+    hotfix_version = ("Nova 2. Delivery 5", "Nova 2. Delivery 5. Hotfix 1")
+    jira.iter_raw_issues.side_effect = lambda *_, **__: iter(
+        [
+            fake_issue("T-1", "svc1", "Done", hotfix_version),
+            fake_issue("T-5", "svc2", "Done", hotfix_version[1:]),
+        ]
+    )
+    hotfix = sut.get_hotfix(base, "1")
+    jira.get_raw_issues.return_value = [
+        fake_issue("T-6", "svc1", "Open", hotfix_version[1:])
+    ]
+
+    sut.refresh(hotfix)
+
+    component = hotfix.get_component_by_name("svc1")
+    assert component is not None
+    assert [t.name for t in component.tasks] == ["T-1", "T-6"]
+    assert [c.name for c in hotfix.get_unchanged_components()] == []
+
+    # the component is left to the base delivery once it has no changes
+    jira.get_raw_issues.return_value = [
+        fake_issue("T-6", "svc2", "Open", hotfix_version[1:])
+    ]
+    sut.refresh(hotfix)
+
+    assert [c.name for c in hotfix] == ["svc2"]
+
+
+def test_get_hotfix_requires_loaded_base(jira):
+    base = NovaReleaseRepository(jira).get("project", "2", "5")
+
+    with pytest.raises(ValueError):
+        NovaReleaseRepository(jira).get_hotfix(base, "1")
+
+
+def teardown_module():
+    """Teardown module"""
+    NovaComponent.longest_component_name = 0
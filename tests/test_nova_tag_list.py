@@ -3,11 +3,10 @@ Nova Tag List tests
 """
 
 from unittest.mock import Mock
-from git import TagReference
 import pytest
 from core.nova_component_type import NovaComponentType
 from core.nova_tag_list import NovaTagList
-from integration.git import GitIntegration
+from integration.git import GitIntegration, GitTag
 
 
 @pytest.fixture(name="mock_service")
@@ -72,9 +71,9 @@ def fixture_mock_git_integration():
     returning service and package tags
     """
     gi_mock = Mock(spec=GitIntegration)
-    service_tag_mock = Mock(spec=TagReference)
+    service_tag_mock = Mock(spec=GitTag)
     service_tag_mock.name = "v1.0.0"
-    package_tag_mock = Mock(spec=TagReference)
+    package_tag_mock = Mock(spec=GitTag)
     package_tag_mock.name = "client-1.0.0"
     gi_mock.list_tags.return_value = [service_tag_mock, package_tag_mock]
     return gi_mock
@@ -155,6 +154,18 @@ def test_from_component_for_package(mock_package, mock_git_integration):
     assert len(nova_tag_list) == 1
 
 
+def test_from_tags_classifies_shared_tags(
+    mock_service, mock_package, mock_git_integration
+):
+    tags = mock_git_integration.list_tags.return_value
+
+    service_tags = NovaTagList.from_tags(mock_service, "", tags)
+    package_tags = NovaTagList.from_tags(mock_package, "", tags)
+
+    assert [tag.name for tag in service_tags] == ["v1.0.0"]
+    assert [tag.name for tag in package_tags] == ["client-1.0.0"]
+
+
 @pytest.mark.parametrize(
     "source_tags, filter_value, expected_count",
     [
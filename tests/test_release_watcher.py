@@ -0,0 +1,146 @@
+"""
+Release watcher tests
+"""
+
+from itertools import islice
+from unittest.mock import Mock
+
+import pytest
+from jira import JIRAError
+
+import jira_utils as ju
+from core.nova_component import NovaComponent
+from core.nova_release import NovaRelease
+from core.nova_status import Status
+from core.nova_task import NovaTask
+from integration.jira import JiraIntegration
+from nova_component_catalog import NovaComponentCatalog
+from nova_release_repository import NovaReleaseRepository
+from release_watcher import (
+    ComponentStatusChange,
+    ReleaseWatcher,
+    diff_component_statuses,
+)
+
+
+@pytest.fixture(name="release")
+def fixture_release():
+    release = NovaRelease("project", "2", "5")
+    for name in ["svc1", "svc2"]:
+        component = NovaComponent(name, None)
+        component.add_task(NovaTask(f"{name}-1", Status.IN_DEVELOPMENT))
+        release.add_component(component)
+    return release
+
+
+@pytest.fixture(name="repository")
+def fixture_repository():
+    return Mock(spec=NovaReleaseRepository)
+
+
+def fake_issue(key: str, status: str, components: list[str]) -> dict:
+    return {
+        "key": key,
+        "fields": {
+            "components": [{"name": name} for name in components],
+            "status": {"name": status},
+            "fixVersions": [{"name": "Nova 2. Delivery 5"}],
+        },
+    }
+
+
+def set_task_status(release: NovaRelease, name: str, status: Status):
+    component = release.get_component_by_name(name + "!")
+    assert component is not None
+    component.upsert_task(NovaTask(f"{name}-1", status))
+
+
+def test_poll_reports_component_status_transitions(repository, release):
+    sut = ReleaseWatcher(repository, release)
+    repository.refresh.side_effect = lambda r, _: set_task_status(
+        r, "svc2", Status.READY_FOR_RELEASE
+    )
+
+    changes = sut.poll()
+
+    assert changes == [
+        ComponentStatusChange(
+            "svc2", Status.IN_DEVELOPMENT, Status.READY_FOR_RELEASE
+        )
+    ]
+    repository.refresh.assert_called_once_with(
+        release, ju.STATUS_ONLY_FIELDS_PROFILE
+    )
+
+
+def test_poll_reports_nothing_when_statuses_are_the_same(repository, release):
+    sut = ReleaseWatcher(repository, release)
+
+    assert not sut.poll()
+    assert not sut.poll()
+
+
+def test_diff_reports_added_and_removed_components():
+    changes = diff_component_statuses(
+        {"svc1": Status.DONE}, {"svc2": Status.IN_DEVELOPMENT}
+    )
+
+    assert changes == [
+        ComponentStatusChange("svc2", None, Status.IN_DEVELOPMENT),
+        ComponentStatusChange("svc1", Status.DONE, None),
+    ]
+    assert str(changes[0]) == "[svc2] NOT IN RELEASE -> IN_DEVELOPMENT"
+
+
+def test_watch_continues_after_failed_poll(repository, release):
+    statuses = iter([Status.READY_FOR_RELEASE, Status.DONE])
+
+    def refresh(r, _):
+        if repository.refresh.call_count == 1:
+            raise JIRAError(text="unavailable", status_code=503)
+        set_task_status(r, "svc1", next(statuses))
+
+    repository.refresh.side_effect = refresh
+    sleep = Mock()
+    sut = ReleaseWatcher(repository, release)
+
+    changes = list(islice(sut.watch(30, sleep), 2))
+
+    assert [c.current for c in changes] == [
+        Status.READY_FOR_RELEASE,
+        Status.DONE,
+    ]
+    assert repository.refresh.call_count == 3
+    sleep.assert_called_with(30)
+
+
+def test_watch_continues_after_component_is_cleared():
+    jira = Mock(spec=JiraIntegration)
+    jira.iter_raw_issues.return_value = iter(
+        [fake_issue("T-1", "In Development", ["svc1"])]
+    )
+    jira.get_raw_issues.side_effect = [
+        [fake_issue("T-1", "In Development", [])],
+        [fake_issue("T-2", "Done", ["svc1"])],
+    ]
+    catalog = Mock(spec=NovaComponentCatalog)
+    catalog.components.side_effect = lambda _: [NovaComponent("svc1", None)]
+    repository = NovaReleaseRepository(jira, catalog)
+    sut = ReleaseWatcher(repository, repository.get("project", "2", "5"))
+
+    changes = list(islice(sut.watch(30, Mock()), 2))
+
+    assert changes == [
+        ComponentStatusChange("svc1", Status.IN_DEVELOPMENT, None),
+        ComponentStatusChange("svc1", None, Status.DONE),
+    ]
+
+
+def test_watch_requires_positive_interval(repository, release):
+    with pytest.raises(ValueError):
+        next(ReleaseWatcher(repository, release).watch(0))
+
+
+def teardown_module():
+    """Teardown module"""
+    NovaComponent.longest_component_name = 0
@@ -0,0 +1,169 @@
+"""
+Offline snapshot tests
+"""
+
+import shutil
+from unittest.mock import Mock
+
+import pytest
+from git.repo import Repo
+
+from core.nova_component import NovaComponent
+from integration.jira import JiraIntegration
+from integration.jira_cache import ISSUES_RESOURCE
+from integration.snapshot import (
+    OfflineJiraIntegration,
+    Snapshot,
+    SnapshotGitIntegration,
+    SnapshotJiraStore,
+    SnapshotMissError,
+)
+from nova_component_catalog import NovaComponentCatalog
+from nova_component_parser import NovaComponentParser
+from nova_release_repository import NovaReleaseRepository
+from perf.jira_stand_in import JiraDataset, JiraStandIn, JiraStandInServer
+
+RELEASE_TITLE = "Nova 2. Delivery 3"
+
+
+@pytest.fixture(name="snapshot_path")
+def fixture_snapshot_path(tmp_path):
+    return str(tmp_path / "snapshot.zip")
+
+
+@pytest.fixture(name="stand_in")
+def fixture_stand_in():
+    return JiraStandIn(
+        JiraDataset.generate(components=5, issues=50, deliveries=3)
+    )
+
+
+@pytest.fixture(name="origin")
+def fixture_origin(tmp_path):
+    origin_dir = tmp_path / "origin"
+    repo = Repo.init(origin_dir, initial_branch="master")
+    repo.config_writer().set_value("user", "name", "nova").release()
+    repo.config_writer().set_value("user", "email", "nova@test").release()
+    (origin_dir / "CHANGELOG.md").write_text("## 1.0.0\n- feature\n")
+    repo.index.add(["CHANGELOG.md"])
+    repo.index.commit("initial")
+    repo.create_tag("v1.0.0", message=f"{RELEASE_TITLE} released")
+    return origin_dir
+
+
+def create_repository(jira: JiraIntegration) -> NovaReleaseRepository:
+    config = Mock()
+    config.data = {
+        "github": {"username": "", "accessToken": ""},
+        "bitbucket": {"username": "", "password": ""},
+    }
+    return NovaReleaseRepository(
+        jira,
+        NovaComponentCatalog(jira, parser=NovaComponentParser(config=config)),
+    )
+
+
+def test_snapshot_is_saved_and_read(snapshot_path):
+    recording = Snapshot(snapshot_path, recording=True)
+    assert recording.read("jira", "key", lambda: {"value": 1}) == {"value": 1}
+    recording.save()
+
+    sut = Snapshot(snapshot_path)
+
+    assert len(sut) == 1
+    assert sut.read("jira", "key", Mock()) == {"value": 1}
+
+
+def test_snapshot_read_fails_when_not_recorded(snapshot_path):
+    Snapshot(snapshot_path, recording=True).save()
+    fetch = Mock()
+
+    with pytest.raises(SnapshotMissError):
+        Snapshot(snapshot_path).read("jira", "key", fetch)
+    fetch.assert_not_called()
+
+
+def test_snapshot_must_exist(snapshot_path):
+    with pytest.raises(ValueError):
+        Snapshot(snapshot_path)
+
+
+def test_jira_store_reads_through_inner_store_when_recording(snapshot_path):
+    inner = Mock()
+    inner.get_or_fetch.return_value = ["cached"]
+    sut = SnapshotJiraStore(Snapshot(snapshot_path, recording=True), inner)
+
+    assert sut.get_or_fetch(ISSUES_RESOURCE, "search", Mock()) == ["cached"]
+
+    sut.invalidate(ISSUES_RESOURCE)
+    inner.invalidate.assert_called_once_with(ISSUES_RESOURCE)
+
+
+def test_release_is_replayed_offline(snapshot_path, stand_in):
+    snapshot = Snapshot(snapshot_path, recording=True)
+    with JiraStandInServer(stand_in) as server:
+        jira = JiraIntegration(
+            server.url, "user", "password", cache=SnapshotJiraStore(snapshot)
+        )
+        recorded = create_repository(jira).get("NOVA", "2", "3")
+        latest = jira.get_latest_released_version("NOVA").name
+    snapshot.save()
+
+    offline = OfflineJiraIntegration(Snapshot(snapshot_path))
+    replayed = create_repository(offline).get("NOVA", "2", "3")
+
+    assert replayed.describe_status() == recorded.describe_status()
+    assert offline.get_latest_released_version("NOVA").name == latest
+
+
+def test_offline_jira_does_not_change_anything(snapshot_path, stand_in):
+    snapshot = Snapshot(snapshot_path, recording=True)
+    with JiraStandInServer(stand_in) as server:
+        jira = JiraIntegration(
+            server.url, "user", "password", cache=SnapshotJiraStore(snapshot)
+        )
+        create_repository(jira).get("NOVA", "2", "3")
+        jira.can_release_version("NOVA", RELEASE_TITLE)
+    snapshot.save()
+    sut = OfflineJiraIntegration(Snapshot(snapshot_path))
+    repository = create_repository(sut)
+    release = repository.get("NOVA", "2", "3")
+    status = release.describe_status()
+    task_names = [t.name for component in release for t in component.tasks]
+
+    assert repository.refresh(release).describe_status() == status
+    assert sut.transition_issues(task_names, "Done") == dict.fromkeys(
+        task_names, ""
+    )
+    sut.mark_version_as_released("NOVA", RELEASE_TITLE)
+    assert sut.can_release_version("NOVA", RELEASE_TITLE)
+
+
+def test_git_is_replayed_offline(snapshot_path, origin):
+    url = origin.as_uri()
+    recording = SnapshotGitIntegration(Snapshot(snapshot_path, recording=True))
+    recorded_tags = recording.list_tags(url)
+    sources_dir = recording.clone(url)
+    assert recording.list_tags_with_annotation(sources_dir, RELEASE_TITLE) == [
+        "v1.0.0"
+    ]
+    recording.checkout(sources_dir, "v1.0.0")
+    recording._snapshot.save()  # pylint: disable=protected-access
+    shutil.rmtree(origin)
+
+    sut = SnapshotGitIntegration(Snapshot(snapshot_path))
+    sources_dir = sut.clone(url)
+    sut.checkout(sources_dir, "v1.0.0")
+
+    assert sut.list_tags(url) == recorded_tags
+    assert [tag.name for tag in recorded_tags] == ["v1.0.0"]
+    assert sut.list_tags_with_annotation(sources_dir, RELEASE_TITLE) == [
+        "v1.0.0"
+    ]
+    with open(f"{sources_dir}/CHANGELOG.md", encoding="utf-8") as changelog:
+        assert changelog.read() == "## 1.0.0\n- feature\n"
+
+
+def teardown_module():
+    """Teardown module"""
+    NovaComponent.longest_component_name = 0
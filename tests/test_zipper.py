@@ -0,0 +1,66 @@
+"""
+Zipper tests
+"""
+
+import zipfile
+from unittest.mock import Mock
+
+import pytest
+
+from zipper import Zipper
+
+
+@pytest.fixture(name="config")
+def fixture_config(tmp_path):
+    config = Mock()
+    config.get_artifacts_folder_path.side_effect = (
+        lambda nova, delivery, hotfix: str(
+            tmp_path / f"{nova}-{delivery}-{hotfix or ''}"
+        )
+    )
+    return config
+
+
+def test_extract_notes_takes_only_requested_components(config, tmp_path):
+    base_zip = tmp_path / "base.zip"
+    with zipfile.ZipFile(base_zip, "w") as zipf:
+        for entry in [
+            "nova.service1-1.0.0.pdf",
+            "nova.service1.client-1.0.0.pdf",
+            "nova.service2-2.0.0.pdf",
+        ]:
+            zipf.writestr(entry, entry)
+    sut = Zipper("2", "42", "1", config=config)
+
+    notes = sut.extract_notes(str(base_zip), ["Nova.Service1", "Nova.Service3"])
+
+    assert list(notes) == ["Nova.Service1"]
+    assert notes["Nova.Service1"].endswith("nova.service1-1.0.0.pdf")
+    assert "2-42-1" in notes["Nova.Service1"]
+
+
+def test_extract_notes_matches_longest_component_name(config, tmp_path):
+    base_zip = tmp_path / "base.zip"
+    with zipfile.ZipFile(base_zip, "w") as zipf:
+        for entry in ["svc-api-1.0.0.pdf", "svc-client-2.0.0.pdf"]:
+            zipf.writestr(entry, entry)
+    sut = Zipper("2", "42", "1", config=config)
+
+    notes = sut.extract_notes(str(base_zip), ["svc"], ["svc", "svc-api"])
+
+    assert list(notes) == ["svc"]
+    assert notes["svc"].endswith("svc-client-2.0.0.pdf")
+
+
+def test_extract_notes_of_missing_file(config, tmp_path):
+    sut = Zipper("2", "42", "1", config=config)
+
+    assert not sut.extract_notes(str(tmp_path / "none.zip"), ["svc"])
+
+
+def test_hotfix_notes_file_name(config):
+    sut = Zipper("2", "42", "1", config=config)
+
+    assert sut.notes_file_path.endswith(
+        "nova2_delivery42_hotfix1_release_notes.zip"
+    )
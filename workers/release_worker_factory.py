@@ -2,6 +2,8 @@
 Release worker factory.
 """
 
+from typing import Optional
+
 from github import Github
 from core.nova_component_type import NovaComponentType
 from core.nova_release import NovaRelease
@@ -25,11 +27,19 @@ class ReleaseWorkerFactory:  # pylint: disable=too-few-public-methods
         worker_type: str,
         component_type: NovaComponentType,
         release: NovaRelease,
+        gi: Optional[GitIntegration] = None,
     ) -> ReleaseWorker:
         """
         Creates a release worker of the specified type.
+
+        :param worker_type: git cloud service of the component
+        :param component_type: component type
+        :param release: release model
+        :param gi: git integration the worker clones repositories with,
+            a new one is created if not specified
         """
         config = Config()
+        gi = gi or GitIntegration()
 
         if component_type in [
             NovaComponentType.PACKAGE,
@@ -41,23 +51,23 @@ class ReleaseWorkerFactory:  # pylint: disable=too-few-public-methods
                 return GitHubNugetPackageReleaseWorker(
                     release,
                     GitHubIntegration(gh_client),
-                    GitIntegration(),
+                    gi,
                     config,
                 )
 
             if worker_type == "bitbucket":
                 return BitBucketNugetPackageReleaseWorker(
-                    release, GitIntegration(), config
+                    release, gi, config
                 )
 
         if worker_type == "bitbucket":
-            return BitbucketReleaseWorker(release, GitIntegration(), config)
+            return BitbucketReleaseWorker(release, gi, config)
 
         if worker_type == "github":
             gh_client = Github(config.data["github"]["accessToken"])
 
             return GitHubReleaseWorker(
-                release, GitHubIntegration(gh_client), GitIntegration(), config
+                release, GitHubIntegration(gh_client), gi, config
             )
 
         raise ValueError(f"Unknown release worker type: {worker_type}")
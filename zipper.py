@@ -2,10 +2,12 @@
 Zipper module
 """
 
+import os
 import zipfile
 from typing import Optional
 from os.path import basename
 
+import fs_utils as fs
 from config import Config
 
 
@@ -48,6 +50,53 @@ class Zipper:
 
         return output_file_path
 
+    def extract_notes(
+        self,
+        zip_path: str,
+        component_names: list[str],
+        known_names: Optional[list[str]] = None,
+    ) -> dict[str, str]:
+        """
+        Extracts release notes of the components from another release
+        notes file, e.g. notes of the base delivery which a hotfix does
+        not change, so they are not generated again.
+
+        :param zip_path: path to the zipped release notes file
+        :param component_names: names of the components to extract
+        :param known_names: names of all components the release notes
+        file may contain notes of, the components to extract by default
+        :return: dictionary with component name as a key and
+        absolute path to the extracted release notes file as a value
+        """
+        if not os.path.isfile(zip_path):
+            return {}
+
+        # notes file names start with the component name and the tag
+        prefixes = {
+            fs.gen_release_notes_filename(name, ""): name
+            for name in [*(known_names or []), *component_names]
+        }
+        requested = set(component_names)
+        result: dict[str, str] = {}
+        with zipfile.ZipFile(zip_path) as zipf:
+            for entry in zipf.namelist():
+                # the longest prefix wins, e.g. "svc-api-1.0.0.pdf"
+                # belongs to "svc-api" rather than to "svc"
+                prefix = max(
+                    (p for p in prefixes if entry.startswith(p)),
+                    key=len,
+                    default=None,
+                )
+                if prefix is not None and prefixes[prefix] in requested:
+                    path = zipf.extract(entry, self._output_path)
+                    result[prefixes[prefix]] = os.path.abspath(path)
+        return result
+
+    @property
+    def notes_file_path(self) -> str:
+        """Path to the zipped release notes file"""
+        return self._build_notes_file_path()
+
     def _build_notes_file_path(self) -> str:
         """
         Builds the name of the release notes file.